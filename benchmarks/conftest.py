@@ -0,0 +1,61 @@
+import tracemalloc
+
+import pytest
+from fakeredis import FakeRedis
+
+from dynamiq.cache.backends import RedisCache
+from dynamiq.cache.config import RedisCacheConfig
+from dynamiq.callbacks import TracingCallbackHandler
+from dynamiq.runnables import RunnableConfig, RunnableStatus
+
+
+@pytest.fixture
+def cache_config(monkeypatch):
+    """Cache config backed by in-process Redis, so cache overhead is measured without network round trips."""
+    cache = RedisCache(client=FakeRedis())
+    monkeypatch.setattr(RedisCache, "from_config", classmethod(lambda cls, config: cache))
+    return RedisCacheConfig(host="localhost", port=6379, db=0)
+
+
+@pytest.fixture
+def get_run_config(request):
+    """Builds run config with cache, tracing and lean mode enabled as requested."""
+
+    def _get_run_config(cache: bool = False, tracing: bool = False, lean: bool = False) -> RunnableConfig:
+        return RunnableConfig(
+            cache=request.getfixturevalue("cache_config") if cache else None,
+            callbacks=[TracingCallbackHandler()] if tracing else [],
+            lean=lean,
+        )
+
+    return _get_run_config
+
+
+@pytest.fixture
+def bench_flow_run(benchmark):
+    """Benchmarks runs of the workflow and reports per-node overhead, throughput and peak memory of a run."""
+
+    def _bench_flow_run(wf, nodes_count: int, config: RunnableConfig | None = None):
+        def run():
+            response = wf.run(input_data={"value": 1}, config=config)
+            assert response.status == RunnableStatus.SUCCESS
+            return response
+
+        tracemalloc.start()
+        run()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        response = benchmark(run)
+        # stats are not collected when benchmarks are disabled, e.g. on smoke runs with --benchmark-disable
+        if benchmark.disabled or benchmark.stats is None:
+            return response
+
+        mean = benchmark.stats.stats.mean
+        benchmark.extra_info["nodes"] = nodes_count
+        benchmark.extra_info["node_overhead_us"] = round(mean / nodes_count * 1e6, 1)
+        benchmark.extra_info["nodes_per_second"] = round(nodes_count / mean)
+        benchmark.extra_info["peak_memory_kb"] = round(peak_memory / 1024)
+        return response
+
+    return _bench_flow_run
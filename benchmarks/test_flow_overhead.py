@@ -0,0 +1,141 @@
+"""
+Overhead of the flow scheduler and node runs on synthetic flows of no-op nodes.
+
+Run with `make benchmark` (requires `pytest-benchmark`). Compare against a saved baseline with
+`pytest benchmarks --benchmark-autosave` and `pytest benchmarks --benchmark-compare`.
+"""
+
+from typing import Any, Literal
+
+import pytest
+
+from dynamiq import Workflow
+from dynamiq.executors.pool import ProcessExecutor, ThreadExecutor
+from dynamiq.flows import Flow
+from dynamiq.nodes import NodeGroup
+from dynamiq.nodes.node import CachingConfig, Node, NodeDependency
+from dynamiq.nodes.utils import SubFlow
+from dynamiq.runnables import RunnableConfig
+
+FAN_OUT_WIDTH = 100
+CHAIN_LENGTH = 20
+DIAMOND_WIDTH = 10
+DIAMOND_DEPTH = 2
+NESTING_DEPTH = 5
+DOCUMENTS_COUNT = 200
+EMBEDDING_SIZE = 256
+CONSUMERS_COUNT = 20
+
+
+class NoopNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    name: str = "Noop"
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        return {"ok": True}
+
+
+class DocumentsNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    name: str = "Documents"
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        return {
+            "documents": [
+                {"content": f"Document {i}", "metadata": {"page": i}, "embedding": [0.1] * EMBEDDING_SIZE}
+                for i in range(DOCUMENTS_COUNT)
+            ]
+        }
+
+
+def build_chain(length: int = CHAIN_LENGTH, **node_kwargs) -> list[Node]:
+    nodes = [NoopNode(**node_kwargs)]
+    for _ in range(length - 1):
+        nodes.append(NoopNode(depends=[NodeDependency(nodes[-1])], **node_kwargs))
+    return nodes
+
+
+def build_fan_out(width: int = FAN_OUT_WIDTH) -> list[Node]:
+    source = NoopNode()
+    branches = [NoopNode(depends=[NodeDependency(source)]) for _ in range(width)]
+    sink = NoopNode(depends=[NodeDependency(node) for node in branches])
+    return [source, *branches, sink]
+
+
+def build_diamond(width: int = DIAMOND_WIDTH, depth: int = DIAMOND_DEPTH) -> list[Node]:
+    nodes = [NoopNode()]
+    for _ in range(depth):
+        branches = [NoopNode(depends=[NodeDependency(nodes[-1])]) for _ in range(width)]
+        nodes.extend([*branches, NoopNode(depends=[NodeDependency(node) for node in branches])])
+    return nodes
+
+
+def build_nested(depth: int = NESTING_DEPTH) -> list[Node]:
+    nodes = [NoopNode()]
+    for _ in range(depth):
+        nodes = [NoopNode(), SubFlow(flow=Flow(nodes=nodes))]
+    return nodes
+
+
+def count_nodes(nodes: list[Node]) -> int:
+    return sum(1 + count_nodes(node.flow.nodes) if isinstance(node, SubFlow) else 1 for node in nodes)
+
+
+SHAPES = {
+    "chain": build_chain,
+    "fan_out": build_fan_out,
+    "diamond": build_diamond,
+    "nested": build_nested,
+}
+
+
+@pytest.mark.parametrize("executor", [ThreadExecutor, ProcessExecutor], ids=["thread", "process"])
+@pytest.mark.parametrize("shape", list(SHAPES))
+def test_flow_run(bench_flow_run, shape, executor):
+    nodes = SHAPES[shape]()
+    wf = Workflow(flow=Flow(nodes=nodes, executor=executor))
+
+    bench_flow_run(wf, count_nodes(nodes))
+
+
+@pytest.mark.parametrize("tracing", [False, True], ids=["tracing_off", "tracing_on"])
+@pytest.mark.parametrize("cache", [False, True], ids=["cache_off", "cache_on"])
+def test_flow_run_with_cache_and_tracing(bench_flow_run, get_run_config, cache, tracing):
+    nodes = build_chain(caching=CachingConfig(enabled=cache))
+    wf = Workflow(flow=Flow(nodes=nodes))
+
+    bench_flow_run(wf, len(nodes), config=get_run_config(cache=cache, tracing=tracing))
+
+
+@pytest.mark.parametrize("lean", [False, True], ids=["default", "lean"])
+def test_flow_run_lean(bench_flow_run, get_run_config, lean):
+    nodes = build_fan_out()
+    wf = Workflow(flow=Flow(nodes=nodes))
+
+    bench_flow_run(wf, len(nodes), config=get_run_config(lean=lean))
+
+
+def test_flow_run_with_shared_large_output(bench_flow_run):
+    source = DocumentsNode()
+    nodes = [source, *(NoopNode(depends=[NodeDependency(source)]) for _ in range(CONSUMERS_COUNT))]
+    wf = Workflow(flow=Flow(nodes=nodes))
+
+    bench_flow_run(wf, len(nodes))
+
+
+@pytest.mark.parametrize("keep_outputs", ["all", "sinks"])
+def test_flow_run_keep_outputs(bench_flow_run, keep_outputs):
+    nodes = [DocumentsNode()]
+    for _ in range(CHAIN_LENGTH - 1):
+        nodes.append(DocumentsNode(depends=[NodeDependency(nodes[-1])]))
+    wf = Workflow(flow=Flow(nodes=nodes, keep_outputs=keep_outputs))
+
+    bench_flow_run(wf, len(nodes))
+
+
+@pytest.mark.parametrize("tracing", [False, True], ids=["tracing_off", "tracing_on"])
+def test_node_run(benchmark, get_run_config, tracing):
+    node = NoopNode()
+    config = get_run_config(tracing=tracing)
+
+    benchmark(node.run, input_data={"value": 1}, config=config)
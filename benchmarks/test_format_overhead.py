@@ -0,0 +1,97 @@
+"""
+Cost of `format_value` on large lists of documents against the previous implementation.
+
+Each group times the previous implementation (`reference`) and the current one with and without copying on the
+same documents, so the results show the difference. Run with `make benchmark` (requires `pytest-benchmark`).
+"""
+
+from io import BytesIO
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, PydanticUserError, RootModel
+
+from dynamiq.types import Document
+from dynamiq.utils import format_value
+from dynamiq.utils.utils import encode_bytes
+
+DOCUMENTS_COUNT = 1000
+EMBEDDING_SIZE = 256
+
+
+def format_value_reference(value: Any, skip_format_types: set = None, force_format_types: set = None, **kwargs) -> Any:
+    """Previous `format_value`, dispatching with isinstance chains and formatting leaves with a new RootModel."""
+    from dynamiq.nodes.tools.python import PythonInputSchema
+    from dynamiq.runnables import RunnableResult
+
+    if skip_format_types is None:
+        skip_format_types = set()
+    if force_format_types is None:
+        force_format_types = set()
+
+    if not isinstance(value, tuple(force_format_types)) and isinstance(value, tuple(skip_format_types)):
+        return value
+
+    if isinstance(value, BytesIO):
+        return getattr(value, "name", None) or encode_bytes(value.getvalue())
+    if isinstance(value, bytes):
+        return encode_bytes(value)
+    if isinstance(value, dict):
+        return {k: format_value_reference(v, skip_format_types, force_format_types) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return type(value)(format_value_reference(v, skip_format_types, force_format_types) for v in value)
+    if isinstance(value, (RunnableResult, PythonInputSchema)):
+        return value.to_dict(skip_format_types=skip_format_types, force_format_types=force_format_types)
+    if isinstance(value, BaseModel):
+        return value.to_dict() if hasattr(value, "to_dict") else value.model_dump()
+    if isinstance(value, Exception):
+        recoverable = bool(kwargs.get("recoverable"))
+        return {"content": f"{str(value)}", "error_type": type(value).__name__, "recoverable": recoverable}
+    if callable(value):
+        return f"func: {getattr(value, '__name__', str(value))}"
+
+    try:
+        return RootModel[type(value)](value).model_dump()
+    except PydanticUserError:
+        return str(value)
+
+
+FORMATTERS = {
+    "reference": format_value_reference,
+    "copy": format_value,
+    "no_copy": lambda value: format_value(value, copy=False),
+}
+
+
+@pytest.fixture
+def documents() -> list[Document]:
+    return [
+        Document(
+            content=f"Document {i}",
+            metadata={"source": f"file_{i}.txt", "page": i, "tags": ["a", "b"]},
+            embedding=[0.1] * EMBEDDING_SIZE,
+            score=0.5,
+        )
+        for i in range(DOCUMENTS_COUNT)
+    ]
+
+
+@pytest.mark.benchmark(group="format_documents")
+@pytest.mark.parametrize("formatter", FORMATTERS)
+def test_format_documents(benchmark, documents, formatter):
+    value = {"documents": documents}
+
+    formatted = benchmark(FORMATTERS[formatter], value)
+
+    assert formatted == format_value_reference(value)
+
+
+@pytest.mark.benchmark(group="format_document_dicts")
+@pytest.mark.parametrize("formatter", FORMATTERS)
+def test_format_document_dicts(benchmark, documents, formatter):
+    value = {"documents": [document.to_dict() for document in documents]}
+
+    formatted = benchmark(FORMATTERS[formatter], value)
+
+    assert formatted == format_value_reference(value)
+    assert (formatted is value) is (formatter == "no_copy")
@@ -1,3 +1,4 @@
+import inspect
 from functools import wraps
 from typing import Any, Callable
 
@@ -43,29 +44,41 @@ def cache_wf_entity(
         Returns:
             Callable: Wrapped function.
         """
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> tuple[Any, bool]:
-            """Wrapper function to handle caching.
+        def get_cached(args: tuple, kwargs: dict) -> tuple[Any, Any, dict, Any]:
+            """Resolve cache manager and cached output for the call.
 
             Args:
-                *args (Any): Positional arguments.
-                **kwargs (Any): Keyword arguments.
+                args (tuple): Positional arguments.
+                kwargs (dict): Keyword arguments.
 
             Returns:
-                tuple[Any, bool]: Function output and cache status.
+                tuple[Any, Any, dict, Any]: Cache manager, input data, cleaned kwargs and cached output.
             """
             cache_manager = None
-            from_cache = False
+            output = None
             input_data = kwargs.pop("input_data", args[0] if args else {})
             cleaned_kwargs = {k: v for k, v in kwargs.items() if k not in func_kwargs_to_remove}
             if cache_enabled and cache_config:
                 logger.debug(f"Entity_id {entity_id}: cache used")
                 cache_manager = cache_manager_cls(config=cache_config)
-                if output := cache_manager.get_entity_output(
-                    entity_id=entity_id, input_data=input_data, **cleaned_kwargs
-                ):
-                    from_cache = True
-                    return output, from_cache
+                output = cache_manager.get_entity_output(entity_id=entity_id, input_data=input_data, **cleaned_kwargs)
+
+            return cache_manager, input_data, cleaned_kwargs, output
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> tuple[Any, bool]:
+            """Wrapper function to handle caching.
+
+            Args:
+                *args (Any): Positional arguments.
+                **kwargs (Any): Keyword arguments.
+
+            Returns:
+                tuple[Any, bool]: Function output and cache status.
+            """
+            cache_manager, input_data, cleaned_kwargs, output = get_cached(args, kwargs)
+            if output:
+                return output, True
 
             output = func(*args, **kwargs)
 
@@ -74,8 +87,32 @@ def cache_wf_entity(
                     entity_id=entity_id, input_data=input_data, output_data=output, **cleaned_kwargs
                 )
 
-            return output, from_cache
+            return output, False
+
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> tuple[Any, bool]:
+            """Async wrapper function to handle caching.
+
+            Args:
+                *args (Any): Positional arguments.
+                **kwargs (Any): Keyword arguments.
+
+            Returns:
+                tuple[Any, bool]: Function output and cache status.
+            """
+            cache_manager, input_data, cleaned_kwargs, output = get_cached(args, kwargs)
+            if output:
+                return output, True
+
+            output = await func(*args, **kwargs)
+
+            if cache_manager:
+                cache_manager.set_entity_output(
+                    entity_id=entity_id, input_data=input_data, output_data=output, **cleaned_kwargs
+                )
+
+            return output, False
 
-        return wrapper
+        return async_wrapper if inspect.iscoroutinefunction(func) else wrapper
 
     return _cache
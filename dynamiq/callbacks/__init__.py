@@ -1,4 +1,6 @@
 from .base import BaseCallbackHandler
+from .deferred import DeferredCallbackHandler
+from .profiling import ProfilingCallbackHandler
 from .streaming import (
     AsyncStreamingIteratorCallbackHandler,
     StreamingQueueCallbackHandler,
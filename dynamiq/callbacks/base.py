@@ -4,7 +4,10 @@ from uuid import UUID
 
 
 class BaseCallbackHandler(ABC):
-    """Abstract base class for callback handlers."""
+    """Abstract base class for callback handlers.
+
+    Serialized entities passed to callbacks are shared by all handlers and events, so handlers must not modify them.
+    """
 
     def on_workflow_start(
         self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any
@@ -131,6 +134,19 @@ class BaseCallbackHandler(ABC):
         """
         pass
 
+    def on_node_phases(self, phases: list[tuple[str, float, float]], **kwargs: Any):
+        """Called after the node run finishes with time spent in each phase of the run.
+
+        Phases are `(name, start, end)` spans with `time.perf_counter` values in seconds, named
+        `validate_depends`, `transform_input`, `cache_lookup`, `execute_with_retry`, `cache_store`,
+        `transform_output` and `callbacks`.
+
+        Args:
+            phases (list[tuple[str, float, float]]): Timed phases of the node run.
+            **kwargs (Any): Additional arguments.
+        """
+        pass
+
     def on_node_execute_start(
         self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any
     ):
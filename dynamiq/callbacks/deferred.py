@@ -0,0 +1,63 @@
+import threading
+from typing import Any, Callable
+
+from dynamiq.callbacks.base import BaseCallbackHandler
+
+
+class DeferredCallbackHandler(BaseCallbackHandler):
+    """Callback handler holding events until it is flushed to the wrapped handlers or discarded.
+
+    Used for runs that may turn out to be discarded, e.g. speculative node runs, so handlers see their events
+    only once the run is confirmed. After `flush` events are passed through immediately, after `discard`
+    they are dropped.
+
+    Attributes:
+        callbacks (list[BaseCallbackHandler]): Handlers receiving the events.
+    """
+
+    def __init__(self, callbacks: list[BaseCallbackHandler]):
+        self.callbacks = callbacks
+        self._events: list[tuple[str, tuple, dict]] | None = []
+        self._is_discarded = False
+        self._lock = threading.Lock()
+
+    def _handle(self, name: str, *args: Any, **kwargs: Any):
+        """Holds the event or passes it to the wrapped handlers if the handler is already flushed."""
+        with self._lock:
+            if self._is_discarded:
+                return
+            if self._events is not None:
+                self._events.append((name, args, kwargs))
+                return
+            # events are passed under the lock, so they are never delivered before the held ones
+            for callback in self.callbacks:
+                getattr(callback, name)(*args, **kwargs)
+
+    def flush(self):
+        """Passes held events to the wrapped handlers in order and passes further events immediately."""
+        with self._lock:
+            if self._is_discarded or self._events is None:
+                return
+            events, self._events = self._events, None
+            for name, args, kwargs in events:
+                for callback in self.callbacks:
+                    getattr(callback, name)(*args, **kwargs)
+
+    def discard(self):
+        """Drops held and further events."""
+        with self._lock:
+            self._is_discarded = True
+            self._events = None
+
+
+def _deferred(name: str) -> Callable[..., None]:
+    def handle(self: DeferredCallbackHandler, *args: Any, **kwargs: Any):
+        self._handle(name, *args, **kwargs)
+
+    handle.__name__ = name
+    handle.__doc__ = f"Holds the `{name}` event until the handler is flushed."
+    return handle
+
+
+for _name in [name for name in vars(BaseCallbackHandler) if name.startswith("on_")]:
+    setattr(DeferredCallbackHandler, _name, _deferred(_name))
@@ -0,0 +1,269 @@
+import json
+import os
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from dynamiq.callbacks import BaseCallbackHandler
+from dynamiq.callbacks.base import get_run_id
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+class ProfileFormat(str, Enum):
+    """Enumeration for profile export formats."""
+    CHROME = "chrome"
+    SPEEDSCOPE = "speedscope"
+
+
+@dataclass
+class NodeProfile:
+    """Data class for timed phases of a node run.
+
+    Attributes:
+        run_id (UUID): Node run ID.
+        node_id (str | None): Node ID.
+        name (str | None): Node name.
+        thread_id (int | None): ID of the thread the node ran in.
+        thread_name (str | None): Name of the thread the node ran in.
+        phases (list[tuple[str, float, float]]): Phases as `(name, start, end)` `time.perf_counter` spans.
+    """
+    run_id: UUID
+    node_id: str | None = None
+    name: str | None = None
+    thread_id: int | None = None
+    thread_name: str | None = None
+    phases: list[tuple[str, float, float]] = field(default_factory=list)
+
+    @property
+    def start(self) -> float:
+        """Start time of the node run."""
+        return self.phases[0][1]
+
+    @property
+    def end(self) -> float:
+        """End time of the node run."""
+        return self.phases[-1][2]
+
+
+class ProfilingCallbackHandler(BaseCallbackHandler):
+    """Callback handler collecting time spent in each phase of node runs.
+
+    Shows how much of a run goes to framework overhead (dependency validation, input and output
+    transformation, cache and callbacks) compared to node execution. Profiles can be exported as
+    Chrome trace (chrome://tracing, Perfetto) or speedscope JSON.
+
+    Attributes:
+        profiles (dict[UUID, NodeProfile]): Profiles of finished node runs by run ID.
+    """
+
+    def __init__(self):
+        self.profiles: dict[UUID, NodeProfile] = {}
+        self._nodes: dict[UUID, tuple[str | None, str | None]] = {}
+        self._lock = threading.Lock()
+
+    def _add_node(self, serialized: dict[str, Any], **kwargs: Any):
+        """Remember the node of the run.
+
+        Args:
+            serialized (dict[str, Any]): Serialized node data.
+            **kwargs (Any): Additional arguments.
+        """
+        with self._lock:
+            self._nodes[get_run_id(kwargs)] = (serialized.get("id"), serialized.get("name"))
+
+    def on_node_start(self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any):
+        """Called when the node starts.
+
+        Args:
+            serialized (dict[str, Any]): Serialized node data.
+            input_data (dict[str, Any]): Input data for the node.
+            **kwargs (Any): Additional arguments.
+        """
+        self._add_node(serialized, **kwargs)
+
+    def on_node_skip(
+        self, serialized: dict[str, Any], skip_data: dict[str, Any], input_data: dict[str, Any], **kwargs: Any
+    ):
+        """Called when the node skips.
+
+        Args:
+            serialized (dict[str, Any]): Serialized node data.
+            skip_data (dict[str, Any]): Data related to the skip.
+            input_data (dict[str, Any]): Input data for the node.
+            **kwargs (Any): Additional arguments.
+        """
+        self._add_node(serialized, **kwargs)
+
+    def on_node_phases(self, phases: list[tuple[str, float, float]], **kwargs: Any):
+        """Called after the node run finishes with time spent in each phase of the run.
+
+        Args:
+            phases (list[tuple[str, float, float]]): Timed phases of the node run.
+            **kwargs (Any): Additional arguments.
+        """
+        if not phases:
+            return
+
+        run_id = get_run_id(kwargs)
+        thread = threading.current_thread()
+        with self._lock:
+            node_id, name = self._nodes.pop(run_id, (None, None))
+            self.profiles[run_id] = NodeProfile(
+                run_id=run_id,
+                node_id=node_id,
+                name=name,
+                thread_id=thread.ident,
+                thread_name=thread.name,
+                phases=list(phases),
+            )
+
+    def get_phase_durations(self) -> dict[str, float]:
+        """Get total time spent in each phase by all node runs.
+
+        Time of nested node runs (e.g. of a subflow) is also included in the execution phase of the parent node.
+
+        Returns:
+            dict[str, float]: Total duration in seconds by phase name.
+        """
+        durations = defaultdict(float)
+        for profile in list(self.profiles.values()):
+            for name, start, end in profile.phases:
+                durations[name] += end - start
+        return dict(durations)
+
+    def _get_time_origin(self, profiles: list[NodeProfile]) -> float:
+        """Get start time of the earliest node run.
+
+        Args:
+            profiles (list[NodeProfile]): Node profiles.
+
+        Returns:
+            float: Start time in seconds.
+        """
+        return min((profile.start for profile in profiles), default=0.0)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Export profiles in Chrome trace event format.
+
+        Every node run and each of its phases is a complete event on the track of the thread it ran in.
+
+        Returns:
+            dict[str, Any]: Chrome trace data.
+        """
+        profiles = sorted(self.profiles.values(), key=lambda profile: profile.start)
+        origin = self._get_time_origin(profiles)
+        pid = os.getpid()
+
+        def to_us(value: float) -> float:
+            return round((value - origin) * 1e6, 3)
+
+        events = []
+        thread_names = {}
+        for profile in profiles:
+            thread_names[profile.thread_id] = profile.thread_name
+            events.append(
+                {
+                    "name": profile.name or str(profile.node_id),
+                    "cat": "node",
+                    "ph": "X",
+                    "ts": to_us(profile.start),
+                    "dur": round((profile.end - profile.start) * 1e6, 3),
+                    "pid": pid,
+                    "tid": profile.thread_id,
+                    "args": {"node_id": profile.node_id, "run_id": str(profile.run_id)},
+                }
+            )
+            for name, start, end in profile.phases:
+                events.append(
+                    {
+                        "name": name,
+                        "cat": "phase",
+                        "ph": "X",
+                        "ts": to_us(start),
+                        "dur": round((end - start) * 1e6, 3),
+                        "pid": pid,
+                        "tid": profile.thread_id,
+                    }
+                )
+
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in thread_names.items()
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def to_speedscope(self) -> dict[str, Any]:
+        """Export profiles in speedscope file format with an evented profile per thread.
+
+        Returns:
+            dict[str, Any]: Speedscope profile data.
+        """
+        profiles = list(self.profiles.values())
+        origin = self._get_time_origin(profiles)
+        frames: list[dict[str, str]] = []
+        frame_indexes: dict[str, int] = {}
+
+        def get_frame(name: str) -> int:
+            if name not in frame_indexes:
+                frame_indexes[name] = len(frames)
+                frames.append({"name": name})
+            return frame_indexes[name]
+
+        spans_by_thread = defaultdict(list)
+        for profile in profiles:
+            spans = spans_by_thread[(profile.thread_id, profile.thread_name)]
+            spans.append((profile.start, profile.end, 0, get_frame(profile.name or str(profile.node_id))))
+            spans.extend((start, end, 1, get_frame(name)) for name, start, end in profile.phases)
+
+        speedscope_profiles = []
+        for (thread_id, thread_name), spans in spans_by_thread.items():
+            # Outer spans go first, nested node runs are contained in the execution phase of the parent node.
+            spans.sort(key=lambda span: (span[0], -span[1], span[2]))
+            events, stack = [], []
+            for start, end, _, frame in spans:
+                while stack and stack[-1][0] <= start:
+                    close_at, close_frame = stack.pop()
+                    events.append({"type": "C", "frame": close_frame, "at": (close_at - origin) * 1e6})
+                if stack:
+                    end = min(end, stack[-1][0])
+                events.append({"type": "O", "frame": frame, "at": (start - origin) * 1e6})
+                stack.append((end, frame))
+            while stack:
+                close_at, close_frame = stack.pop()
+                events.append({"type": "C", "frame": close_frame, "at": (close_at - origin) * 1e6})
+
+            speedscope_profiles.append(
+                {
+                    "type": "evented",
+                    "name": thread_name or str(thread_id),
+                    "unit": "microseconds",
+                    "startValue": events[0]["at"],
+                    "endValue": events[-1]["at"],
+                    "events": events,
+                }
+            )
+
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": "dynamiq",
+            "shared": {"frames": frames},
+            "profiles": speedscope_profiles,
+        }
+
+    def save(self, path: str, format: ProfileFormat | str = ProfileFormat.CHROME):
+        """Save profiles to JSON file.
+
+        Args:
+            path (str): Path of the file.
+            format (ProfileFormat | str, optional): Export format. Defaults to ProfileFormat.CHROME.
+        """
+        if ProfileFormat(format) == ProfileFormat.SPEEDSCOPE:
+            data = self.to_speedscope()
+        else:
+            data = self.to_chrome_trace()
+        with open(path, "w") as f:
+            json.dump(data, f)
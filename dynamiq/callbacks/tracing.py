@@ -176,12 +176,12 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
 
         from dynamiq.nodes import NodeGroup
 
-        # Handle runtime LLM prompt override
+        # Handle runtime LLM prompt override, serialized node is shared by all callbacks and is not modified
         if serialized.get("group") == NodeGroup.LLMS:
             prompt = kwargs.get("prompt") or serialized.get("prompt")
             if isinstance(prompt, BaseModel):
                 prompt = prompt.model_dump()
-            serialized["prompt"] = prompt
+            serialized = serialized | {"prompt": prompt}
 
         run = Run(
             id=run_id,
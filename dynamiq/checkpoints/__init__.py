@@ -0,0 +1,4 @@
+from .base import BaseCheckpointStore, FlowCheckpoint
+from .in_memory import InMemoryCheckpointStore
+from .redis import RedisCheckpointStore
+from .sqlite import SQLiteCheckpointStore
@@ -0,0 +1,137 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+import jsonpickle
+from pydantic import BaseModel
+
+from dynamiq.runnables import RunnableResult
+from dynamiq.utils.serialization import DEFAULT_ALLOWED_MODULES, restricted_decode
+
+
+class FlowCheckpoint(BaseModel):
+    """
+    Persisted progress of a flow run.
+
+    Attributes:
+        run_id (str): Identifier the checkpoint is stored under.
+        flow_id (str): Identifier of the checkpointed flow.
+        input_data (Any): Input data of the flow run.
+        results (dict[str, RunnableResult]): Results of completed nodes by node id.
+    """
+
+    run_id: str
+    flow_id: str
+    input_data: Any = None
+    results: dict[str, RunnableResult] = {}
+
+
+class BaseCheckpointStore(ABC):
+    """
+    Abstract base class for flow checkpoint stores.
+
+    Stored values are restored only from builtins and classes of `ALLOWED_MODULES`, as anyone able to write
+    to the store could otherwise run code on resume.
+
+    Attributes:
+        delete_on_success (bool): Whether to delete checkpoint once all nodes of the flow run succeed.
+    """
+
+    ALLOWED_MODULES: tuple[str, ...] = DEFAULT_ALLOWED_MODULES
+
+    def __init__(self, delete_on_success: bool = True):
+        """
+        Initialize BaseCheckpointStore.
+
+        Args:
+            delete_on_success (bool, optional): Whether to delete checkpoint once the flow run succeeds.
+                Defaults to True.
+        """
+        self.delete_on_success = delete_on_success
+
+    @staticmethod
+    def serialize(value: Any) -> str:
+        """
+        Serialize value to be stored.
+
+        Args:
+            value (Any): Value to serialize.
+
+        Returns:
+            str: Serialized value.
+        """
+        return jsonpickle.encode(value)
+
+    @classmethod
+    def deserialize(cls, data: str | bytes) -> Any:
+        """
+        Deserialize stored value, restoring only classes and functions of the allowed modules.
+
+        Args:
+            data (str | bytes): Serialized value.
+
+        Returns:
+            Any: Deserialized value.
+
+        Raises:
+            ValueError: If the value references not allowed classes or functions.
+        """
+        return restricted_decode(data, allowed_modules=cls.ALLOWED_MODULES)
+
+    @abstractmethod
+    def create(self, run_id: str, flow_id: str, input_data: Any):
+        """
+        Create an empty checkpoint of the flow run, replacing existing one.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+            flow_id (str): Identifier of the flow.
+            input_data (Any): Input data of the flow run.
+
+        Raises:
+            NotImplementedError: If not implemented.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_result(self, run_id: str, node_id: str, result: RunnableResult):
+        """
+        Save result of the completed node.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+            node_id (str): Identifier of the node.
+            result (RunnableResult): Result of the node.
+
+        Raises:
+            NotImplementedError: If not implemented.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self, run_id: str) -> FlowCheckpoint | None:
+        """
+        Load checkpoint of the flow run.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+
+        Returns:
+            FlowCheckpoint | None: Checkpoint or None if it does not exist.
+
+        Raises:
+            NotImplementedError: If not implemented.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, run_id: str):
+        """
+        Delete checkpoint of the flow run.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+
+        Raises:
+            NotImplementedError: If not implemented.
+        """
+        raise NotImplementedError
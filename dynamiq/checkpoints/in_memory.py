@@ -0,0 +1,71 @@
+import threading
+from typing import Any
+
+from dynamiq.checkpoints.base import BaseCheckpointStore, FlowCheckpoint
+from dynamiq.runnables import RunnableResult
+
+
+class InMemoryCheckpointStore(BaseCheckpointStore):
+    """In-memory checkpoint store. Checkpoints do not survive the process."""
+
+    def __init__(self, delete_on_success: bool = True):
+        """
+        Initialize InMemoryCheckpointStore.
+
+        Args:
+            delete_on_success (bool, optional): Whether to delete checkpoint once the flow run succeeds.
+                Defaults to True.
+        """
+        super().__init__(delete_on_success=delete_on_success)
+        self._checkpoints: dict[str, FlowCheckpoint] = {}
+        self._lock = threading.Lock()
+
+    def create(self, run_id: str, flow_id: str, input_data: Any):
+        """
+        Create an empty checkpoint of the flow run, replacing existing one.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+            flow_id (str): Identifier of the flow.
+            input_data (Any): Input data of the flow run.
+        """
+        with self._lock:
+            self._checkpoints[run_id] = FlowCheckpoint(run_id=run_id, flow_id=flow_id, input_data=input_data)
+
+    def save_result(self, run_id: str, node_id: str, result: RunnableResult):
+        """
+        Save result of the completed node.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+            node_id (str): Identifier of the node.
+            result (RunnableResult): Result of the node.
+        """
+        with self._lock:
+            if checkpoint := self._checkpoints.get(run_id):
+                checkpoint.results[node_id] = result
+
+    def load(self, run_id: str) -> FlowCheckpoint | None:
+        """
+        Load checkpoint of the flow run.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+
+        Returns:
+            FlowCheckpoint | None: Checkpoint or None if it does not exist.
+        """
+        with self._lock:
+            if checkpoint := self._checkpoints.get(run_id):
+                return checkpoint.model_copy(update={"results": dict(checkpoint.results)})
+        return None
+
+    def delete(self, run_id: str):
+        """
+        Delete checkpoint of the flow run.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+        """
+        with self._lock:
+            self._checkpoints.pop(run_id, None)
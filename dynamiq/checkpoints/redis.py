@@ -0,0 +1,141 @@
+from typing import Any
+
+from dynamiq.checkpoints.base import BaseCheckpointStore, FlowCheckpoint
+from dynamiq.connections import RedisConnection
+from dynamiq.runnables import RunnableResult
+
+
+class RedisCheckpointStore(BaseCheckpointStore):
+    """
+    Checkpoint store keeping each flow run in a Redis hash.
+
+    The `__run__` field of the hash holds the run metadata, other fields hold node results by node id.
+    Any client with Redis-compatible `hset`, `hgetall`, `delete` and `expire` methods can be used.
+
+    Attributes:
+        client (Any): Redis client instance.
+        namespace (str): Prefix of checkpoint keys.
+        ttl (int | None): Time-to-live of checkpoints in seconds.
+    """
+
+    RUN_FIELD = "__run__"
+
+    def __init__(
+        self,
+        client: Any,
+        namespace: str = "dynamiq:checkpoint",
+        ttl: int | None = None,
+        delete_on_success: bool = True,
+    ):
+        """
+        Initialize RedisCheckpointStore.
+
+        Args:
+            client (Any): Redis client instance.
+            namespace (str, optional): Prefix of checkpoint keys. Defaults to "dynamiq:checkpoint".
+            ttl (int | None, optional): Time-to-live of checkpoints in seconds. Defaults to None.
+            delete_on_success (bool, optional): Whether to delete checkpoint once the flow run succeeds.
+                Defaults to True.
+        """
+        super().__init__(delete_on_success=delete_on_success)
+        self.client = client
+        self.namespace = namespace
+        self.ttl = ttl
+
+    @classmethod
+    def from_connection(cls, connection: RedisConnection, **kwargs) -> "RedisCheckpointStore":
+        """
+        Create RedisCheckpointStore from Redis connection.
+
+        Args:
+            connection (RedisConnection): Redis connection.
+            **kwargs: Additional keyword arguments passed to the constructor.
+
+        Returns:
+            RedisCheckpointStore: Checkpoint store instance.
+        """
+        from redis import Redis
+
+        return cls(client=Redis(**connection.model_dump(exclude={"id", "type"})), **kwargs)
+
+    def get_key(self, run_id: str) -> str:
+        """
+        Get key of the checkpoint hash.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+
+        Returns:
+            str: Key of the checkpoint hash.
+        """
+        return f"{self.namespace}:{run_id}"
+
+    def _set_fields(self, run_id: str, mapping: dict[str, str]):
+        """
+        Set fields of the checkpoint hash and refresh its time-to-live.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+            mapping (dict[str, str]): Fields to set.
+        """
+        key = self.get_key(run_id)
+        self.client.hset(key, mapping=mapping)
+        if self.ttl is not None:
+            self.client.expire(key, self.ttl)
+
+    def create(self, run_id: str, flow_id: str, input_data: Any):
+        """
+        Create an empty checkpoint of the flow run, replacing existing one.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+            flow_id (str): Identifier of the flow.
+            input_data (Any): Input data of the flow run.
+        """
+        self.client.delete(self.get_key(run_id))
+        self._set_fields(run_id, {self.RUN_FIELD: self.serialize({"flow_id": flow_id, "input_data": input_data})})
+
+    def save_result(self, run_id: str, node_id: str, result: RunnableResult):
+        """
+        Save result of the completed node.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+            node_id (str): Identifier of the node.
+            result (RunnableResult): Result of the node.
+        """
+        self._set_fields(run_id, {node_id: self.serialize(result)})
+
+    def load(self, run_id: str) -> FlowCheckpoint | None:
+        """
+        Load checkpoint of the flow run.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+
+        Returns:
+            FlowCheckpoint | None: Checkpoint or None if it does not exist.
+        """
+        fields = {
+            (field.decode() if isinstance(field, bytes) else field): value
+            for field, value in self.client.hgetall(self.get_key(run_id)).items()
+        }
+        if self.RUN_FIELD not in fields:
+            return None
+
+        run = self.deserialize(fields.pop(self.RUN_FIELD))
+        return FlowCheckpoint(
+            run_id=run_id,
+            flow_id=run["flow_id"],
+            input_data=run["input_data"],
+            results={node_id: self.deserialize(result) for node_id, result in fields.items()},
+        )
+
+    def delete(self, run_id: str):
+        """
+        Delete checkpoint of the flow run.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+        """
+        self.client.delete(self.get_key(run_id))
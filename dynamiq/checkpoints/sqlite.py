@@ -0,0 +1,109 @@
+import sqlite3
+import threading
+from typing import Any
+
+from dynamiq.checkpoints.base import BaseCheckpointStore, FlowCheckpoint
+from dynamiq.runnables import RunnableResult
+
+
+class SQLiteCheckpointStore(BaseCheckpointStore):
+    """Checkpoint store persisting flow runs progress to a local SQLite database file."""
+
+    CREATE_RUNS_TABLE_QUERY = """
+        CREATE TABLE IF NOT EXISTS checkpoint_runs (
+            run_id TEXT PRIMARY KEY,
+            flow_id TEXT NOT NULL,
+            input_data TEXT
+        )
+    """
+    CREATE_RESULTS_TABLE_QUERY = """
+        CREATE TABLE IF NOT EXISTS checkpoint_results (
+            run_id TEXT NOT NULL,
+            node_id TEXT NOT NULL,
+            result TEXT NOT NULL,
+            PRIMARY KEY (run_id, node_id)
+        )
+    """
+    UPSERT_RUN_QUERY = "INSERT OR REPLACE INTO checkpoint_runs (run_id, flow_id, input_data) VALUES (?, ?, ?)"
+    UPSERT_RESULT_QUERY = "INSERT OR REPLACE INTO checkpoint_results (run_id, node_id, result) VALUES (?, ?, ?)"
+    SELECT_RUN_QUERY = "SELECT flow_id, input_data FROM checkpoint_runs WHERE run_id = ?"
+    SELECT_RESULTS_QUERY = "SELECT node_id, result FROM checkpoint_results WHERE run_id = ?"
+    DELETE_RUN_QUERY = "DELETE FROM checkpoint_runs WHERE run_id = ?"
+    DELETE_RESULTS_QUERY = "DELETE FROM checkpoint_results WHERE run_id = ?"
+
+    def __init__(self, db_path: str = "checkpoints.db", delete_on_success: bool = True):
+        """
+        Initialize SQLiteCheckpointStore.
+
+        Args:
+            db_path (str, optional): Path to the database file. Defaults to "checkpoints.db".
+            delete_on_success (bool, optional): Whether to delete checkpoint once the flow run succeeds.
+                Defaults to True.
+        """
+        super().__init__(delete_on_success=delete_on_success)
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(self.CREATE_RUNS_TABLE_QUERY)
+            self._conn.execute(self.CREATE_RESULTS_TABLE_QUERY)
+
+    def create(self, run_id: str, flow_id: str, input_data: Any):
+        """
+        Create an empty checkpoint of the flow run, replacing existing one.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+            flow_id (str): Identifier of the flow.
+            input_data (Any): Input data of the flow run.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(self.DELETE_RESULTS_QUERY, (run_id,))
+            self._conn.execute(self.UPSERT_RUN_QUERY, (run_id, flow_id, self.serialize(input_data)))
+
+    def save_result(self, run_id: str, node_id: str, result: RunnableResult):
+        """
+        Save result of the completed node.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+            node_id (str): Identifier of the node.
+            result (RunnableResult): Result of the node.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(self.UPSERT_RESULT_QUERY, (run_id, node_id, self.serialize(result)))
+
+    def load(self, run_id: str) -> FlowCheckpoint | None:
+        """
+        Load checkpoint of the flow run.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+
+        Returns:
+            FlowCheckpoint | None: Checkpoint or None if it does not exist.
+        """
+        with self._lock:
+            run = self._conn.execute(self.SELECT_RUN_QUERY, (run_id,)).fetchone()
+            if run is None:
+                return None
+            rows = self._conn.execute(self.SELECT_RESULTS_QUERY, (run_id,)).fetchall()
+
+        flow_id, input_data = run
+        return FlowCheckpoint(
+            run_id=run_id,
+            flow_id=flow_id,
+            input_data=self.deserialize(input_data),
+            results={node_id: self.deserialize(result) for node_id, result in rows},
+        )
+
+    def delete(self, run_id: str):
+        """
+        Delete checkpoint of the flow run.
+
+        Args:
+            run_id (str): Checkpoint identifier.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(self.DELETE_RESULTS_QUERY, (run_id,))
+            self._conn.execute(self.DELETE_RUN_QUERY, (run_id,))
@@ -0,0 +1,88 @@
+import argparse
+import signal
+import threading
+
+from dynamiq.connections import RedisConnection
+from dynamiq.executors.distributed import (
+    DEFAULT_ALLOWED_MODULES,
+    DEFAULT_WORK_QUEUE_NAME,
+    DEFAULT_WORK_QUEUE_NAMESPACE,
+    MAX_WORKERS_QUEUE_WORKER,
+    RedisWorkQueue,
+    WorkQueueWorker,
+)
+from dynamiq.utils.env import get_env_var
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """
+    Build parser of the `dynamiq` command line.
+
+    Returns:
+        argparse.ArgumentParser: Command line parser.
+    """
+    parser = argparse.ArgumentParser(prog="dynamiq")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    worker = commands.add_parser("worker", help="Run worker executing flow nodes from the Redis work queue.")
+    worker.add_argument("--redis-host", default=get_env_var("REDIS_HOST", "localhost"))
+    worker.add_argument("--redis-port", type=int, default=int(get_env_var("REDIS_PORT", 6379)))
+    worker.add_argument("--redis-db", type=int, default=int(get_env_var("REDIS_DB", 0)))
+    worker.add_argument("--redis-username", default=get_env_var("REDIS_USERNAME", ""))
+    worker.add_argument("--redis-password", default=get_env_var("REDIS_PASSWORD", ""))
+    worker.add_argument("--namespace", default=DEFAULT_WORK_QUEUE_NAMESPACE, help="Prefix of queue keys.")
+    worker.add_argument("--queue", default=DEFAULT_WORK_QUEUE_NAME, help="Name of the queue to pull nodes from.")
+    worker.add_argument(
+        "--max-workers", type=int, default=MAX_WORKERS_QUEUE_WORKER, help="Maximum number of concurrent nodes."
+    )
+    worker.add_argument(
+        "--allow-module",
+        action="append",
+        default=[],
+        dest="allowed_modules",
+        help="Module node definitions can restore classes and functions from, besides dynamiq. Can be repeated.",
+    )
+    return parser
+
+
+def run_worker(args: argparse.Namespace):
+    """
+    Run queue worker until it receives SIGINT or SIGTERM.
+
+    Args:
+        args (argparse.Namespace): Parsed `worker` command arguments.
+    """
+    connection = RedisConnection(
+        host=args.redis_host,
+        port=args.redis_port,
+        db=args.redis_db,
+        username=args.redis_username or None,
+        password=args.redis_password or None,
+    )
+    worker = WorkQueueWorker(
+        work_queue=RedisWorkQueue.from_connection(connection, namespace=args.namespace),
+        name=args.queue,
+        max_workers=args.max_workers,
+        allowed_modules=DEFAULT_ALLOWED_MODULES + tuple(args.allowed_modules),
+    )
+
+    stop_event = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop_event.set())
+    worker.run(stop_event=stop_event)
+
+
+def main(argv: list[str] | None = None):
+    """
+    Entry point of the `dynamiq` command line.
+
+    Args:
+        argv (list[str] | None, optional): Command line arguments. Defaults to None, which uses `sys.argv`.
+    """
+    args = get_parser().parse_args(argv)
+    if args.command == "worker":
+        run_worker(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ import os
 from abc import abstractmethod
 from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from pydantic import BaseModel
 
@@ -71,6 +71,36 @@ class BaseConverter(BaseModel):
 
         return {"documents": documents}
 
+    @staticmethod
+    def split_inputs(
+        file_paths: list[str] | list[os.PathLike] | None = None,
+        files: list[BytesIO] | None = None,
+        metadata: dict[str, Any] | list[dict[str, Any]] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Splits converter inputs into inputs of single files, so files can be converted one at a time.
+
+        Inputs with directories, duplicated paths or a list of metadata are not split, as files are matched
+        to metadata across the whole input.
+
+        Args:
+            file_paths: List of file or directory paths to convert.
+            files: List of BytesIO objects to convert.
+            metadata: Metadata for documents. Can be a dict for all or a list of dicts for each.
+
+        Yields:
+            Dict with 'file_paths', 'files' and 'metadata' keys describing one file.
+        """
+        paths = [Path(path) for path in file_paths or []]
+        if isinstance(metadata, list) or len(set(paths)) != len(paths) or not all(path.is_file() for path in paths):
+            yield {"file_paths": file_paths, "files": files, "metadata": metadata}
+            return
+
+        for file_path in file_paths or []:
+            yield {"file_paths": [file_path], "files": None, "metadata": metadata}
+        for file in files or []:
+            yield {"file_paths": None, "files": [file], "metadata": metadata}
+
     @staticmethod
     def _normalize_metadata(
         metadata: dict[str, Any] | list[dict[str, Any]] | None, sources_count: int
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Callable
 
 from pydantic import BaseModel, PrivateAttr
@@ -20,6 +21,7 @@ class BaseEmbedder(BaseModel):
     client: Any | None = None
 
     _embedding: Callable = PrivateAttr()
+    _aembedding: Callable = PrivateAttr()
     """
         Initializes the Embedder component with given configuration.
 
@@ -49,9 +51,10 @@ class BaseEmbedder(BaseModel):
     def __init__(self, *args, **kwargs):
         # Import in runtime to save memory
         super().__init__(**kwargs)
-        from litellm import embedding
+        from litellm import aembedding, embedding
 
         self._embedding = embedding
+        self._aembedding = aembedding
 
     @property
     def embed_params(self) -> dict:
@@ -72,6 +75,44 @@ class BaseEmbedder(BaseModel):
                 - 'embedding': A list representing the embedding vector of the input text.
                 - 'meta': A dictionary with metadata information about the model usage.
         """
+        response = self._embedding(
+            model=self.model, input=[self._prepare_text_to_embed(text)], **self.embed_params
+        )
+
+        meta = {"model": response.model, "usage": dict(response.usage)}
+
+        return {"embedding": response.data[0]["embedding"], "meta": meta}
+
+    async def aembed_text(self, text: str) -> dict:
+        """
+        Asynchronously embeds a single string using the Embedder model.
+
+        Args:
+            text (str): The text string to be embedded.
+
+        Returns:
+            dict: A dictionary containing:
+                - 'embedding': A list representing the embedding vector of the input text.
+                - 'meta': A dictionary with metadata information about the model usage.
+        """
+        response = await self._aembedding(
+            model=self.model, input=[self._prepare_text_to_embed(text)], **self.embed_params
+        )
+
+        meta = {"model": response.model, "usage": dict(response.usage)}
+
+        return {"embedding": response.data[0]["embedding"], "meta": meta}
+
+    def _prepare_text_to_embed(self, text: str) -> str:
+        """
+        Validate the text and add the configured prefix and suffix.
+
+        Args:
+            text (str): The text string to be embedded.
+
+        Returns:
+            str: Text ready for embedding.
+        """
         if not isinstance(text, str):
             msg = (
                 "TextEmbedder expects a string as input."
@@ -80,15 +121,7 @@ class BaseEmbedder(BaseModel):
             raise TypeError(msg)
 
         text_to_embed = self.prefix + text + self.suffix
-        text_to_embed = text_to_embed.replace("\n", " ")
-
-        response = self._embedding(
-            model=self.model, input=[text_to_embed], **self.embed_params
-        )
-
-        meta = {"model": response.model, "usage": dict(response.usage)}
-
-        return {"embedding": response.data[0]["embedding"], "meta": meta}
+        return text_to_embed.replace("\n", " ")
 
     def _prepare_documents_to_embed(self, documents: list[Document]) -> list[str]:
         """
@@ -120,12 +153,36 @@ class BaseEmbedder(BaseModel):
         """
         Embed a list of texts in batches.
         """
+        embed_params = self.embed_params
+        responses = [
+            self._embedding(model=self.model, input=texts_to_embed[i : i + batch_size], **embed_params)
+            for i in range(0, len(texts_to_embed), batch_size)
+        ]
+        return self._merge_batch_responses(responses)
+
+    async def _aembed_texts_batch(
+        self, texts_to_embed: list[str], batch_size: int
+    ) -> tuple[list[list[float]], dict[str, Any]]:
+        """
+        Asynchronously embed a list of texts in batches. Batches are requested concurrently.
+        """
+        embed_params = self.embed_params
+        responses = await asyncio.gather(
+            *[
+                self._aembedding(model=self.model, input=texts_to_embed[i : i + batch_size], **embed_params)
+                for i in range(0, len(texts_to_embed), batch_size)
+            ]
+        )
+        return self._merge_batch_responses(responses)
+
+    @staticmethod
+    def _merge_batch_responses(responses: list[Any]) -> tuple[list[list[float]], dict[str, Any]]:
+        """
+        Merge embeddings and usage metadata of batch responses.
+        """
         all_embeddings = []
         meta: dict[str, Any] = {}
-        embed_params = self.embed_params
-        for i in range(0, len(texts_to_embed), batch_size):
-            batch = texts_to_embed[i : i + batch_size]
-            response = self._embedding(model=self.model, input=batch, **embed_params)
+        for response in responses:
             embeddings = [el["embedding"] for el in response.data]
             all_embeddings.extend(embeddings)
 
@@ -151,17 +208,7 @@ class BaseEmbedder(BaseModel):
                 - 'documents' (list[Document]): The input documents with their embeddings populated.
                 - 'meta' (dict): Metadata information about the embedding process.
         """
-        if (
-            not isinstance(documents, list)
-            or documents
-            and not isinstance(documents[0], Document)
-        ):
-            msg = (
-                "DocumentEmbedder expects a list of Documents as input."
-                "In case you want to embed a string, please use the embed_text."
-            )
-            raise TypeError(msg)
-
+        self._validate_documents(documents)
         if not documents:
             # return early if we were passed an empty list
             return {"documents": [], "meta": {}}
@@ -176,3 +223,50 @@ class BaseEmbedder(BaseModel):
             doc.embedding = emb
 
         return {"documents": documents, "meta": meta}
+
+    async def aembed_documents(self, documents: list[Document]) -> dict:
+        """
+        Asynchronously embeds a list of documents and returns the embedded documents along with meta information.
+
+        Args:
+            documents (list[Document]): The documents to be embedded.
+
+        Returns:
+            dict: A dictionary containing:
+                - 'documents' (list[Document]): The input documents with their embeddings populated.
+                - 'meta' (dict): Metadata information about the embedding process.
+        """
+        self._validate_documents(documents)
+        if not documents:
+            return {"documents": [], "meta": {}}
+
+        texts_to_embed = self._prepare_documents_to_embed(documents=documents)
+
+        embeddings, meta = await self._aembed_texts_batch(texts_to_embed=texts_to_embed, batch_size=self.batch_size)
+
+        for doc, emb in zip(documents, embeddings):
+            doc.embedding = emb
+
+        return {"documents": documents, "meta": meta}
+
+    @staticmethod
+    def _validate_documents(documents: list[Document]):
+        """
+        Validate that the input is a list of Documents.
+
+        Args:
+            documents (list[Document]): The documents to be embedded.
+
+        Raises:
+            TypeError: If the input is not a list of Documents.
+        """
+        if (
+            not isinstance(documents, list)
+            or documents
+            and not isinstance(documents[0], Document)
+        ):
+            msg = (
+                "DocumentEmbedder expects a list of Documents as input."
+                "In case you want to embed a string, please use the embed_text."
+            )
+            raise TypeError(msg)
@@ -1,9 +1,11 @@
+import asyncio
 import enum
+import weakref
 from abc import ABC, abstractmethod
 from functools import partial
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, AsyncIterator, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
 from dynamiq.utils import generate_uuid
@@ -12,6 +14,7 @@ from dynamiq.utils.logger import logger
 
 if TYPE_CHECKING:
     from chromadb import ClientAPI as ChromaClient
+    from httpx import AsyncClient
     from openai import OpenAI as OpenAIClient
     from pinecone import Pinecone as PineconeClient
     from qdrant_client import QdrantClient
@@ -195,6 +198,19 @@ class HttpApiKey(BaseApiKeyConnection):
         }
 
 
+async def _close_on_loop_shutdown(client: "AsyncClient") -> AsyncIterator[None]:
+    """
+    Keeps the async client open until the event loop closes the generator on shutdown, then closes the client.
+
+    Args:
+        client (AsyncClient): Async httpx client.
+    """
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
 class Http(BaseConnection):
     """
     Represents a connection to an API.
@@ -215,6 +231,30 @@ class Http(BaseConnection):
     params: dict[str, Any] | None = Field(default_factory=dict)
     data: dict[str, Any] | None = Field(default_factory=dict)
 
+    _async_clients: weakref.WeakKeyDictionary = PrivateAttr(default_factory=weakref.WeakKeyDictionary)
+
+    async def get_async_client(self) -> "AsyncClient":
+        """
+        Gets the async httpx client of the connection for the running event loop.
+
+        Clients are bound to the event loop they were used on, so one client is created per event loop and
+        reused by all async requests made on it. The client is closed when the event loop shuts down its
+        async generators, e.g. at the end of `asyncio.run`.
+
+        Returns:
+            AsyncClient: Async httpx client of the connection.
+        """
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        if (entry := self._async_clients.get(loop)) is None:
+            client = httpx.AsyncClient()
+            closer = _close_on_loop_shutdown(client)
+            # starting the generator registers it with the loop, the entry keeps it alive until the loop is gone
+            await anext(closer)
+            entry = self._async_clients[loop] = (client, closer)
+        return entry[0]
+
     def connect(self):
         """
         Connects to the API.
@@ -10,8 +10,11 @@ class BaseExecutor(ABC):
 
     Attributes:
         max_workers (int | None): Maximum number of concurrent workers. None means no limit.
+        supports_streaming (bool): Whether the executor can run nodes together with their streaming consumers.
     """
 
+    supports_streaming: bool = False
+
     def __init__(self, max_workers: int | None = None):
         """
         Initialize the BaseExecutor.
@@ -0,0 +1,552 @@
+import json
+import math
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent import futures
+from typing import Any, Callable
+from uuid import uuid4
+
+import jsonpickle
+
+from dynamiq.connections import RedisConnection
+from dynamiq.executors.pool import NodeNotRegistered, PoolExecutor, ProcessExecutor
+from dynamiq.nodes.node import Node
+from dynamiq.runnables import RunnableResult
+from dynamiq.utils.logger import logger
+from dynamiq.utils.serialization import DEFAULT_ALLOWED_MODULES, restricted_decode
+
+DEFAULT_WORK_QUEUE_NAMESPACE = "dynamiq:queue"
+DEFAULT_WORK_QUEUE_NAME = "dynamiq:nodes"
+DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_RESULT_TIMEOUT = 3600.0
+DEFAULT_RESULT_TTL = 3600.0
+MAX_WORKERS_QUEUE_WORKER = 8
+
+class BaseWorkQueue(ABC):
+    """Named queues passing serialized work items to remote workers and results back to submitters."""
+
+    @abstractmethod
+    def put(self, name: str, message: str, ttl: float | None = None):
+        """
+        Append message to the queue.
+
+        Args:
+            name (str): Name of the queue.
+            message (str): Serialized message.
+            ttl (float | None, optional): Seconds the queue is kept after the last message is appended.
+                Defaults to None, which keeps it until it is read.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, name: str, timeout: float | None = None) -> str | None:
+        """
+        Pop the oldest message from the queue, blocking while the queue is empty.
+
+        Args:
+            name (str): Name of the queue.
+            timeout (float | None, optional): Maximum time to wait in seconds. Defaults to None.
+
+        Returns:
+            str | None: Serialized message or None if the timeout expired.
+        """
+        raise NotImplementedError
+
+
+class InMemoryWorkQueue(BaseWorkQueue):
+    """Work queue kept in process memory, for tests and workers running in threads of the same process."""
+
+    def __init__(self):
+        """Initialize InMemoryWorkQueue."""
+        self._queues: dict[str, queue.Queue] = {}
+        self._lock = threading.Lock()
+
+    def _get_queue(self, name: str) -> queue.Queue:
+        """
+        Get the queue by name, creating it on first use.
+
+        Args:
+            name (str): Name of the queue.
+
+        Returns:
+            queue.Queue: Queue instance.
+        """
+        with self._lock:
+            return self._queues.setdefault(name, queue.Queue())
+
+    def put(self, name: str, message: str, ttl: float | None = None):
+        """
+        Append message to the queue.
+
+        Args:
+            name (str): Name of the queue.
+            message (str): Serialized message.
+            ttl (float | None, optional): Not used, queues are released with the process. Defaults to None.
+        """
+        self._get_queue(name).put(message)
+
+    def get(self, name: str, timeout: float | None = None) -> str | None:
+        """
+        Pop the oldest message from the queue, blocking while the queue is empty.
+
+        Args:
+            name (str): Name of the queue.
+            timeout (float | None, optional): Maximum time to wait in seconds. Defaults to None.
+
+        Returns:
+            str | None: Serialized message or None if the timeout expired.
+        """
+        try:
+            return self._get_queue(name).get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class RedisWorkQueue(BaseWorkQueue):
+    """
+    Work queue backed by Redis lists, shared by flow runs and workers on many machines.
+
+    Any client with Redis-compatible `rpush`, `expire` and `blpop` methods can be used.
+
+    Attributes:
+        client (Any): Redis client instance.
+        namespace (str): Prefix of queue keys.
+    """
+
+    def __init__(self, client: Any, namespace: str = DEFAULT_WORK_QUEUE_NAMESPACE):
+        """
+        Initialize RedisWorkQueue.
+
+        Args:
+            client (Any): Redis client instance.
+            namespace (str, optional): Prefix of queue keys. Defaults to DEFAULT_WORK_QUEUE_NAMESPACE.
+        """
+        self.client = client
+        self.namespace = namespace
+
+    @classmethod
+    def from_connection(cls, connection: RedisConnection, **kwargs) -> "RedisWorkQueue":
+        """
+        Create RedisWorkQueue from Redis connection.
+
+        Args:
+            connection (RedisConnection): Redis connection.
+            **kwargs: Additional keyword arguments passed to the constructor.
+
+        Returns:
+            RedisWorkQueue: Work queue instance.
+        """
+        from redis import Redis
+
+        return cls(client=Redis(**connection.model_dump(exclude={"id", "type"})), **kwargs)
+
+    def get_key(self, name: str) -> str:
+        """
+        Get key of the queue list.
+
+        Args:
+            name (str): Name of the queue.
+
+        Returns:
+            str: Key of the queue list.
+        """
+        return f"{self.namespace}:{name}"
+
+    def put(self, name: str, message: str, ttl: float | None = None):
+        """
+        Append message to the queue.
+
+        Args:
+            name (str): Name of the queue.
+            message (str): Serialized message.
+            ttl (float | None, optional): Seconds the queue is kept after the last message is appended.
+                Defaults to None, which keeps it until it is read.
+        """
+        key = self.get_key(name)
+        self.client.rpush(key, message)
+        if ttl is not None:
+            self.client.expire(key, math.ceil(ttl))
+
+    def get(self, name: str, timeout: float | None = None) -> str | None:
+        """
+        Pop the oldest message from the queue, blocking while the queue is empty.
+
+        Args:
+            name (str): Name of the queue.
+            timeout (float | None, optional): Maximum time to wait in seconds. Defaults to None.
+
+        Returns:
+            str | None: Serialized message or None if the timeout expired.
+        """
+        item = self.client.blpop([self.get_key(name)], timeout=timeout or 0)
+        if item is None:
+            return None
+        message = item[1]
+        return message.decode() if isinstance(message, bytes) else message
+
+
+def _get_callable_path(fn: Callable) -> str:
+    """
+    Get import path of the function sent to remote workers.
+
+    Args:
+        fn (Callable): Module level function or method of a module level class.
+
+    Returns:
+        str: Import path in `module:qualname` format.
+    """
+    return f"{fn.__module__}:{fn.__qualname__}"
+
+
+# Functions workers run for submitters, by import path. Workers never import functions named in work items.
+WORK_ITEM_CALLABLES: dict[str, Callable] = {}
+
+
+def register_work_item_callable(fn: Callable) -> Callable:
+    """
+    Allow the function to be run by queue workers.
+
+    Both submitters and workers must register the function, usually on import of its module.
+
+    Args:
+        fn (Callable): Module level function or method of a module level class.
+
+    Returns:
+        Callable: The registered function.
+    """
+    WORK_ITEM_CALLABLES[_get_callable_path(fn)] = fn
+    return fn
+
+
+def _get_work_item_callable(path: str) -> Callable:
+    """
+    Get the registered function by the path produced by `_get_callable_path`.
+
+    Args:
+        path (str): Import path in `module:qualname` format.
+
+    Returns:
+        Callable: Registered function.
+
+    Raises:
+        ValueError: If the function is not registered.
+    """
+    if (fn := WORK_ITEM_CALLABLES.get(path)) is None:
+        raise ValueError(f"Function '{path}' is not registered to run on queue workers.")
+    return fn
+
+
+class WorkQueuePool(futures.Executor):
+    """
+    Executor submitting calls to remote workers through a work queue.
+
+    Calls are serialized with jsonpickle, so the function must be registered with
+    `register_work_item_callable` by both the submitter and the workers, and its arguments serializable.
+    Results are posted back to the queue of this pool, read by a background listener thread.
+
+    Args:
+        work_queue (BaseWorkQueue): Queue shared with the workers.
+        name (str, optional): Name of the queue workers pull work items from.
+            Defaults to DEFAULT_WORK_QUEUE_NAME.
+        poll_interval (float, optional): Seconds the listener blocks on the result queue before checking
+            for shutdown. Defaults to DEFAULT_POLL_INTERVAL.
+        result_timeout (float | None, optional): Seconds to wait for the result of a call before failing it
+            with `TimeoutError`, e.g. when the worker running it was stopped. Defaults to DEFAULT_RESULT_TIMEOUT,
+            None waits forever.
+        allowed_modules (tuple[str, ...], optional): Modules classes and functions of results can be
+            restored from. Defaults to DEFAULT_ALLOWED_MODULES.
+    """
+
+    def __init__(
+        self,
+        work_queue: BaseWorkQueue,
+        name: str = DEFAULT_WORK_QUEUE_NAME,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        result_timeout: float | None = DEFAULT_RESULT_TIMEOUT,
+        allowed_modules: tuple[str, ...] = DEFAULT_ALLOWED_MODULES,
+    ):
+        self.work_queue = work_queue
+        self.name = name
+        self.poll_interval = poll_interval
+        self.result_timeout = result_timeout
+        self.allowed_modules = allowed_modules
+        self.reply_to = f"{name}:results:{uuid4()}"
+        self._futures: dict[str, futures.Future] = {}
+        self._deadlines: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._listener: threading.Thread | None = None
+        self._shutdown = threading.Event()
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> futures.Future:
+        """
+        Send the call to remote workers.
+
+        Args:
+            fn (Callable): Function registered with `register_work_item_callable`.
+            *args: Positional arguments of the call.
+            **kwargs: Keyword arguments of the call.
+
+        Returns:
+            futures.Future: Future resolved with the result of the remote call.
+
+        Raises:
+            RuntimeError: If the pool is shut down.
+            ValueError: If the function is not registered.
+        """
+        if self._shutdown.is_set():
+            raise RuntimeError("Cannot submit work to a shut down work queue pool.")
+
+        fn_path = _get_callable_path(fn)
+        _get_work_item_callable(fn_path)
+        task_id = str(uuid4())
+        future = futures.Future()
+        with self._lock:
+            self._futures[task_id] = future
+            if self.result_timeout is not None:
+                self._deadlines[task_id] = time.monotonic() + self.result_timeout
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen, name="dynamiq-work-queue", daemon=True)
+                self._listener.start()
+
+        message = {
+            "id": task_id,
+            "reply_to": self.reply_to,
+            "fn": fn_path,
+            "args": args,
+            "kwargs": kwargs,
+        }
+        self.work_queue.put(self.name, jsonpickle.encode(message))
+        return future
+
+    def _listen(self):
+        """Resolves futures of submitted calls with results posted by workers and fails timed out calls."""
+        while not self._shutdown.is_set():
+            self._fail_timed_out()
+            if (message := self.work_queue.get(self.reply_to, timeout=self.poll_interval)) is None:
+                continue
+
+            # the id is read before the result is restored, so calls with undecodable results fail fast
+            try:
+                task_id = json.loads(message)["id"]
+            except Exception as e:
+                logger.error(f"Work queue pool: skipped malformed result. Error: {e}")
+                continue
+
+            with self._lock:
+                future = self._futures.pop(task_id, None)
+                self._deadlines.pop(task_id, None)
+            if future is None or not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                reply = restricted_decode(message, allowed_modules=self.allowed_modules)
+            except Exception as e:
+                logger.error(f"Work queue pool: failed to decode result of work item {task_id}. Error: {e}")
+                future.set_exception(ValueError(f"Undecodable result of work item {task_id}: {e}"))
+                continue
+
+            if "error" in reply:
+                future.set_exception(reply["error"])
+            else:
+                future.set_result(reply["result"])
+
+    def _fail_timed_out(self):
+        """Fails calls that got no result within the result timeout."""
+        now = time.monotonic()
+        with self._lock:
+            timed_out = [task_id for task_id, deadline in self._deadlines.items() if deadline <= now]
+            timed_out_futures = [self._futures.pop(task_id) for task_id in timed_out]
+            for task_id in timed_out:
+                del self._deadlines[task_id]
+
+        for task_id, future in zip(timed_out, timed_out_futures):
+            if future.set_running_or_notify_cancel():
+                future.set_exception(
+                    TimeoutError(f"Work item {task_id} got no result in {self.result_timeout} seconds.")
+                )
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """
+        Stop reading results of submitted calls.
+
+        Args:
+            wait (bool, optional): Whether to wait for results of submitted calls, at most the result timeout.
+                Defaults to True.
+            cancel_futures (bool, optional): Whether to cancel calls not yet completed. Defaults to False.
+        """
+        with self._lock:
+            pending = list(self._futures.values())
+        if cancel_futures:
+            for future in pending:
+                future.cancel()
+        if wait:
+            futures.wait(pending)
+        self._shutdown.set()
+
+
+class QueueExecutor(ProcessExecutor):
+    """
+    Executor running nodes on remote workers started with `dynamiq worker`, attached to a `WorkQueuePool`.
+
+    Lets wide steps fan out across many machines instead of being bounded by the workers of one process.
+    Like with `ProcessExecutor` node definitions are registered once per worker, nodes must be importable
+    by workers and process-local config fields (pool, cancellation token) are not sent. Node definitions are
+    sent as part of the work item, so workers restore them only from their allowed modules.
+
+    Args:
+        max_workers (int, optional): The maximum number of in-flight nodes. Defaults to None (no limit).
+        executor (futures.Executor): Work queue pool to send nodes to, usually set as `Flow.executor_pool`
+            or `RunnableConfig.executor_pool`.
+
+    Raises:
+        ValueError: If the executor is not a `WorkQueuePool`.
+    """
+
+    registered_node_keys: OrderedDict[tuple[str, str], None] = OrderedDict()
+    registered_node_keys_lock = threading.Lock()
+
+    def __init__(self, max_workers: int | None = None, executor: futures.Executor | None = None):
+        if not isinstance(executor, WorkQueuePool):
+            raise ValueError("QueueExecutor requires a WorkQueuePool set as the executor pool.")
+
+        PoolExecutor.__init__(
+            self, pool_executor=futures.ThreadPoolExecutor, max_workers=max_workers, executor=executor
+        )
+
+    @staticmethod
+    def serialize_node(node: Node) -> Node:
+        """
+        Keeps the node as is, it is serialized with the work item.
+
+        Args:
+            node (Node): Node instance.
+
+        Returns:
+            Node: Node instance.
+        """
+        return node
+
+    @staticmethod
+    def deserialize_node(node_data: Node) -> Node:
+        """
+        Keeps the node as is, it is restored with the work item.
+
+        Args:
+            node_data (Node): Node instance.
+
+        Returns:
+            Node: Node instance.
+        """
+        return node_data
+
+    @classmethod
+    def _run_registered_node(
+        cls, node_key: tuple[str, str], node_data: Node | None = None, **kwargs
+    ) -> RunnableResult | type[NodeNotRegistered]:
+        """
+        Runs the node registered in the worker, registering it first if its definition is provided.
+
+        Args:
+            node_key (tuple[str, str]): Node id and definition hash.
+            node_data (Node | None, optional): Node definition. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult | type[NodeNotRegistered]: Node result or marker if node is not registered.
+        """
+        return super()._run_registered_node(node_key, node_data=node_data, **kwargs)
+
+
+register_work_item_callable(QueueExecutor._run_registered_node)
+
+
+class WorkQueueWorker:
+    """
+    Worker pulling calls from the work queue, running them in threads and posting results back.
+
+    Args:
+        work_queue (BaseWorkQueue): Queue shared with the submitters.
+        name (str, optional): Name of the queue to pull work items from. Defaults to DEFAULT_WORK_QUEUE_NAME.
+        max_workers (int, optional): Maximum number of concurrently running calls.
+            Defaults to MAX_WORKERS_QUEUE_WORKER.
+        poll_interval (float, optional): Seconds to block on the queue before checking for stop.
+            Defaults to DEFAULT_POLL_INTERVAL.
+        allowed_modules (tuple[str, ...], optional): Modules classes and functions of work items can be
+            restored from, e.g. modules of clients held by nodes. Defaults to DEFAULT_ALLOWED_MODULES.
+        result_ttl (float, optional): Seconds result queues are kept after the last result is posted, so
+            results of stopped submitters do not pile up. Defaults to DEFAULT_RESULT_TTL.
+    """
+
+    def __init__(
+        self,
+        work_queue: BaseWorkQueue,
+        name: str = DEFAULT_WORK_QUEUE_NAME,
+        max_workers: int = MAX_WORKERS_QUEUE_WORKER,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        allowed_modules: tuple[str, ...] = DEFAULT_ALLOWED_MODULES,
+        result_ttl: float = DEFAULT_RESULT_TTL,
+    ):
+        self.work_queue = work_queue
+        self.name = name
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.allowed_modules = allowed_modules
+        self.result_ttl = result_ttl
+
+    def run(self, stop_event: threading.Event | None = None):
+        """
+        Process work items until the stop event is set.
+
+        Work items are pulled only while a thread is free, so idle workers take over the rest of the queue.
+
+        Args:
+            stop_event (threading.Event | None, optional): Event stopping the worker. Defaults to None,
+                which runs forever.
+        """
+        stop_event = stop_event or threading.Event()
+        slots = threading.BoundedSemaphore(self.max_workers)
+        logger.info(f"Worker: processing queue '{self.name}' with {self.max_workers} threads.")
+
+        with futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="dynamiq-worker") as pool:
+            while not stop_event.is_set():
+                if not slots.acquire(timeout=self.poll_interval):
+                    continue
+                if (message := self.work_queue.get(self.name, timeout=self.poll_interval)) is None:
+                    slots.release()
+                    continue
+                pool.submit(self.process, message).add_done_callback(lambda _: slots.release())
+
+        logger.info(f"Worker: stopped processing queue '{self.name}'.")
+
+    def process(self, message: str):
+        """
+        Run the registered function from the work item and post its result to the queue of the submitter.
+
+        Only work item fields are read before the function is checked, arguments are restored after it.
+
+        Args:
+            message (str): Serialized work item.
+        """
+        try:
+            work_item = json.loads(message)
+            task_id, reply_to, fn_path = work_item["id"], work_item["reply_to"], work_item["fn"]
+        except Exception as e:
+            logger.error(f"Worker: skipped malformed work item. Error: {e}")
+            return
+
+        try:
+            fn = _get_work_item_callable(fn_path)
+            call = restricted_decode(message, allowed_modules=self.allowed_modules)
+            reply = {"id": task_id, "result": fn(*call["args"], **call["kwargs"])}
+        except Exception as e:
+            logger.error(f"Worker: work item {task_id} failed. Error: {e}")
+            reply = {"id": task_id, "error": e}
+
+        try:
+            message = jsonpickle.encode(reply)
+        except Exception as e:
+            message = jsonpickle.encode({"id": task_id, "error": RuntimeError(str(e))})
+        self.work_queue.put(reply_to, message, ttl=self.result_ttl)
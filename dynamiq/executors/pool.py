@@ -1,15 +1,34 @@
+import asyncio
+import copy
+import functools
+import heapq
+import itertools
 import os
+import threading
+import time
+from collections import OrderedDict
 from concurrent import futures
+from contextlib import contextmanager
 
 import jsonpickle
 
 from dynamiq.executors.base import BaseExecutor
+from dynamiq.executors.shared import (
+    SharedThreadPool,
+    get_nesting_level,
+    get_shared_event_loop,
+    get_shared_process_pool,
+    get_shared_thread_pool,
+)
+from dynamiq.executors.streaming import run_stream_pipeline
 from dynamiq.nodes.node import Node, NodeReadyToRun
+from dynamiq.nodes.types import ExecutorAffinity
 from dynamiq.runnables import RunnableConfig, RunnableResult, RunnableStatus
 from dynamiq.utils.logger import logger
 
 MAX_WORKERS_THREAD_POOL_EXECUTOR = 8
 MAX_WORKERS_PROCESS_POOL_EXECUTOR = os.cpu_count()
+MAX_WORKER_REGISTERED_NODES = 256
 
 
 class PoolExecutor(BaseExecutor):
@@ -17,10 +36,17 @@ class PoolExecutor(BaseExecutor):
     A pool executor that manages concurrent execution of nodes using either ThreadPoolExecutor or
     ProcessPoolExecutor.
 
+    When an existing pool is provided the executor attaches to it instead of creating a new one, does not
+    shut it down and limits the number of its in-flight nodes to `max_workers`, keeping the rest pending.
+    Pending nodes are submitted in order of their priority.
+
+    Executors of nested flow runs created with `child` share the pool and the in-flight limit of the parent.
+
     Args:
         pool_executor (type): The type of pool executor to use (ThreadPoolExecutor or
             ProcessPoolExecutor).
         max_workers (int, optional): The maximum number of workers in the pool. Defaults to None.
+        executor (futures.Executor, optional): Existing long-lived pool to attach to. Defaults to None.
     """
 
     def __init__(
@@ -29,19 +55,79 @@ class PoolExecutor(BaseExecutor):
             type[futures.ThreadPoolExecutor] | type[futures.ProcessPoolExecutor]
         ),
         max_workers: int | None = None,
+        executor: futures.Executor | None = None,
     ):
         super().__init__(max_workers=max_workers)
-        self.executor = pool_executor(max_workers=max_workers)
+        self.is_shared_executor = executor is not None
+        self.executor = executor if self.is_shared_executor else pool_executor(max_workers=max_workers)
+        self.slots = threading.Semaphore(max_workers) if max_workers else None
+        self._reset()
+
+    def _reset(self):
+        """Resets the nodes tracked by the executor."""
         self.node_by_future = {}
+        self.pending_nodes = []
+        self.node_durations = {}
+        self._time_start_by_future = {}
+        self._pending_counter = itertools.count()
+
+    def child(self) -> "PoolExecutor":
+        """
+        Creates executor for a flow run nested in a node run by this executor.
+
+        The child submits nodes to the same pool and takes in-flight slots from the same limit,
+        so nested nodes do not exceed the concurrency of the parent run.
+
+        Returns:
+            PoolExecutor: Executor sharing the pool and the in-flight limit.
+        """
+        child = copy.copy(self)
+        child.is_shared_executor = True
+        child._reset()
+        return child
+
+    @contextmanager
+    def lend_slot(self):
+        """
+        Lends the in-flight slot of the calling node to other nodes sharing the limit while the node waits for them,
+        e.g. to nodes of a nested flow run. The slot is taken back on exit.
+        """
+        if self.slots is None:
+            yield
+            return
+
+        self.slots.release()
+        try:
+            yield
+        finally:
+            self.slots.acquire()
+
+    def _release_slot(self, *_):
+        """Releases the in-flight slot of a completed node."""
+        if self.slots is not None:
+            self.slots.release()
 
     def shutdown(self, wait: bool = True):
         """
-        Shuts down the executor.
+        Shuts down the executor. Attached shared pool is left running.
 
         Args:
             wait (bool, optional): Whether to wait for pending futures to complete. Defaults to True.
         """
-        self.executor.shutdown(wait=wait)
+        if not self.is_shared_executor:
+            self.executor.shutdown(wait=wait)
+            return
+
+        self.pending_nodes.clear()
+        if wait:
+            futures.wait(fs=self.node_by_future.keys())
+        else:
+            for future in self.node_by_future:
+                future.cancel()
+        # slots of abandoned nodes return to the limit shared with other runs once they complete
+        for future in self.node_by_future:
+            future.add_done_callback(self._release_slot)
+        self.node_by_future.clear()
 
     def execute(
         self,
@@ -61,10 +147,16 @@ class PoolExecutor(BaseExecutor):
             dict[str, RunnableResult]: A dictionary of node IDs and their execution results.
         """
         self.run_nodes(ready_nodes=ready_nodes, config=config, **kwargs)
+        if self.pending_nodes and not self.node_by_future:
+            # all slots are taken by nodes of runs sharing the limit, wait for one of them
+            self.slots.acquire()
+            self._submit_pending_node()
+
         completed_node_futures, _ = futures.wait(
             fs=self.node_by_future.keys(), return_when=futures.FIRST_COMPLETED
         )
         results = self.complete_nodes(completed_node_futures=completed_node_futures)
+        self.submit_pending_nodes()
 
         return results
 
@@ -80,17 +172,37 @@ class PoolExecutor(BaseExecutor):
         Args:
             ready_nodes (list[NodeReadyToRun]): List of nodes ready to run.
             config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+                Overridden by the own configuration of the ready node, if any.
             **kwargs: Additional keyword arguments.
         """
         for ready_node in ready_nodes:
             if ready_node.is_ready:
-                future = self.run_node(ready_node=ready_node, config=config, **kwargs)
-                self.node_by_future[future] = ready_node.node
+                heapq.heappush(
+                    self.pending_nodes, (-ready_node.priority, next(self._pending_counter), ready_node, config, kwargs)
+                )
             else:
                 logger.error(
                     f"Node {ready_node.node.name} - {ready_node.node.id}: not ready to run."
                 )
 
+        self.submit_pending_nodes()
+
+    def submit_pending_nodes(self):
+        """Submits pending nodes to the pool while the number of in-flight nodes is below `max_workers`."""
+        while self.pending_nodes and (self.slots is None or self.slots.acquire(blocking=False)):
+            self._submit_pending_node()
+
+    def _submit_pending_node(self):
+        """Submits the pending node with the highest priority, its in-flight slot must be already taken."""
+        _, _, ready_node, config, kwargs = heapq.heappop(self.pending_nodes)
+        try:
+            future = self.run_node(ready_node=ready_node, config=ready_node.get_config(config), **kwargs)
+        except BaseException:
+            self._release_slot()
+            raise
+        self.node_by_future[future] = ready_node.node
+        self._time_start_by_future[future] = time.monotonic()
+
     def complete_nodes(
         self, completed_node_futures: list[futures.Future]
     ) -> dict[str, RunnableResult]:
@@ -106,6 +218,8 @@ class PoolExecutor(BaseExecutor):
         results = {}
         for f in completed_node_futures:
             node = self.node_by_future.pop(f)
+            self._release_slot()
+            self.node_durations[node.id] = time.monotonic() - self._time_start_by_future.pop(f)
             try:
                 node_result: RunnableResult = f.result()
             except Exception as e:
@@ -114,7 +228,11 @@ class PoolExecutor(BaseExecutor):
                 )
                 node_result = RunnableResult(status=RunnableStatus.FAILURE)
 
-            results[node.id] = node_result
+            # streaming pipelines complete the node together with its streaming consumers
+            if isinstance(node_result, dict):
+                results.update(node_result)
+            else:
+                results[node.id] = node_result
 
         return results
 
@@ -127,11 +245,15 @@ class PoolExecutor(BaseExecutor):
             config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
             **kwargs: Additional keyword arguments.
         """
+        if ready_node.stream_consumers:
+            return self.executor.submit(run_stream_pipeline, ready_node=ready_node, config=config, **kwargs)
+
         return self.executor.submit(
             ready_node.node.run,
             input_data=ready_node.input_data,
             config=config,
             depends_result=ready_node.depends_result,
+            transformed_input=ready_node.transformed_input,
             **kwargs,
         )
 
@@ -140,29 +262,77 @@ class ThreadExecutor(PoolExecutor):
     """
     A thread-based pool executor.
 
+    Runs nodes on the long-lived shared thread pool unless another pool is provided,
+    so worker threads are not created and torn down on every flow run. Flows nested in nodes running on
+    the shared pool run on the shared pool of the next nesting level.
+
     Args:
-        max_workers (int, optional): The maximum number of worker threads. Defaults to None.
+        max_workers (int, optional): The maximum number of concurrently running nodes. Defaults to None.
+        executor (futures.Executor, optional): Existing pool to attach to. Defaults to the shared nodes pool.
     """
 
-    def __init__(self, max_workers: int | None = None):
+    supports_streaming = True
+
+    def __init__(self, max_workers: int | None = None, executor: futures.Executor | None = None):
         max_workers = max_workers or MAX_WORKERS_THREAD_POOL_EXECUTOR
+        self.uses_shared_nodes_pool = executor is None
         super().__init__(
-            pool_executor=futures.ThreadPoolExecutor, max_workers=max_workers
+            pool_executor=futures.ThreadPoolExecutor,
+            max_workers=max_workers,
+            executor=executor or get_shared_thread_pool(SharedThreadPool.NODES, get_nesting_level()),
         )
 
+    def child(self) -> "ThreadExecutor":
+        """
+        Creates executor for a flow run nested in a node run by this executor.
+
+        Nested nodes take in-flight slots from the limit of the parent, but run on the shared pool of the next
+        nesting level, so the worker thread of the waiting node is not needed by them.
+
+        Returns:
+            ThreadExecutor: Executor sharing the in-flight limit.
+        """
+        child = super().child()
+        if self.uses_shared_nodes_pool:
+            child.executor = get_shared_thread_pool(SharedThreadPool.NODES, get_nesting_level())
+        return child
+
+
+class NodeNotRegistered:
+    """Marker returned by a worker process that has no registered node for the requested definition."""
+
+
+_worker_nodes: OrderedDict[tuple[str, str], Node] = OrderedDict()
+_worker_nodes_lock = threading.Lock()
+
 
 class ProcessExecutor(PoolExecutor):
     """
     A process-based pool executor.
 
+    Node definitions are registered once per worker process by node id and definition hash, so only
+    inputs and outputs cross the process boundary on subsequent runs. A worker that misses the definition
+    answers with `NodeNotRegistered` and the node is resubmitted together with its serialized definition.
+
     Args:
-        max_workers (int, optional): The maximum number of worker processes. Defaults to None.
+        max_workers (int, optional): The maximum number of concurrently running nodes. Defaults to None.
+        executor (futures.Executor, optional): Existing process pool to attach to. Defaults to the shared
+            process pool.
+
+    Attributes:
+        registered_node_keys (OrderedDict[tuple[str, str], None]): Keys of nodes recently sent to at least one
+            worker, bounded like the worker registries.
     """
 
-    def __init__(self, max_workers: int | None = None):
+    registered_node_keys: OrderedDict[tuple[str, str], None] = OrderedDict()
+    registered_node_keys_lock = threading.Lock()
+
+    def __init__(self, max_workers: int | None = None, executor: futures.Executor | None = None):
         max_workers = max_workers or MAX_WORKERS_PROCESS_POOL_EXECUTOR
         super().__init__(
-            pool_executor=futures.ProcessPoolExecutor, max_workers=max_workers
+            pool_executor=futures.ProcessPoolExecutor,
+            max_workers=max_workers,
+            executor=executor or get_shared_process_pool(),
         )
 
     @staticmethod
@@ -191,6 +361,40 @@ class ProcessExecutor(PoolExecutor):
         """
         return jsonpickle.decode(node_data)  # nosec
 
+    @staticmethod
+    def get_node_key(node: Node) -> tuple[str, str]:
+        """
+        Gets the key node definition is registered by in worker processes.
+
+        Args:
+            node (Node): Node instance.
+
+        Returns:
+            tuple[str, str]: Node id and hash of the node definition.
+        """
+        return node.id, node.get_definition_hash()
+
+    @classmethod
+    def register_node_key(cls, node_key: tuple[str, str]) -> bool:
+        """
+        Marks node key as sent to workers, evicting the least recently used keys over the limit.
+
+        Args:
+            node_key (tuple[str, str]): Node id and definition hash.
+
+        Returns:
+            bool: Whether the key was not registered yet.
+        """
+        with cls.registered_node_keys_lock:
+            if node_key in cls.registered_node_keys:
+                cls.registered_node_keys.move_to_end(node_key)
+                return False
+
+            cls.registered_node_keys[node_key] = None
+            while len(cls.registered_node_keys) > MAX_WORKER_REGISTERED_NODES:
+                cls.registered_node_keys.popitem(last=False)
+            return True
+
     @classmethod
     def _run_node(cls, node_data: str, **kwargs) -> RunnableResult:
         """
@@ -203,6 +407,34 @@ class ProcessExecutor(PoolExecutor):
         node_instance = cls.deserialize_node(node_data)
         return node_instance.run(**kwargs)
 
+    @classmethod
+    def _run_registered_node(
+        cls, node_key: tuple[str, str], node_data: str | None = None, **kwargs
+    ) -> RunnableResult | type[NodeNotRegistered]:
+        """
+        Runs the node registered in the worker process, registering it first if its definition is provided.
+
+        Args:
+            node_key (tuple[str, str]): Node id and definition hash.
+            node_data (str | None, optional): Serialized node data. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult | type[NodeNotRegistered]: Node result or marker if node is not registered.
+        """
+        # queue workers run nodes in threads, so the registry is shared by concurrent calls
+        with _worker_nodes_lock:
+            if node_data is not None:
+                _worker_nodes[node_key] = cls.deserialize_node(node_data)
+                while len(_worker_nodes) > MAX_WORKER_REGISTERED_NODES:
+                    _worker_nodes.popitem(last=False)
+            elif node_key not in _worker_nodes:
+                return NodeNotRegistered
+
+            _worker_nodes.move_to_end(node_key)
+            node = _worker_nodes[node_key]
+        return node.run(**kwargs)
+
     def run_node(self, ready_node: NodeReadyToRun, config: RunnableConfig = None, **kwargs):
         """
         Submits ready node for execution.
@@ -212,11 +444,264 @@ class ProcessExecutor(PoolExecutor):
             config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
             **kwargs: Additional keyword arguments.
         """
-        return self.executor.submit(
-            self._run_node,
-            node_data=self.serialize_node(ready_node.node),
+        if config and (
+            config.executor_pool or config.cancellation_token or config.node_executor or config.run_executor
+        ):
+            # Pools, executors and cancellation tokens are process-local and can not be sent to the worker process
+            config = config.model_copy(
+                update={"executor_pool": None, "cancellation_token": None, "node_executor": None, "run_executor": None}
+            )
+
+        node = ready_node.node
+        node_key = self.get_node_key(node)
+        submit = functools.partial(
+            self.executor.submit,
+            self._run_registered_node,
+            node_key=node_key,
             input_data=ready_node.input_data,
             config=config,
             depends_result=ready_node.depends_result,
+            transformed_input=ready_node.transformed_input,
             **kwargs,
         )
+        if self.register_node_key(node_key):
+            return submit(node_data=self.serialize_node(node))
+
+        future = futures.Future()
+
+        def on_done(worker_future: futures.Future):
+            try:
+                result = worker_future.result()
+            except BaseException as e:
+                future.set_exception(e)
+                return
+
+            if result is not NodeNotRegistered:
+                future.set_result(result)
+                return
+
+            logger.debug(f"Node {node.name} - {node.id}: registering definition in worker process.")
+            try:
+                submit(node_data=self.serialize_node(node)).add_done_callback(
+                    lambda registered_future: _chain_future(registered_future, future)
+                )
+            except BaseException as e:
+                future.set_exception(e)
+
+        submit().add_done_callback(on_done)
+        return future
+
+
+def _chain_future(source: futures.Future, target: futures.Future):
+    """
+    Copies the outcome of the completed source future to the target future.
+
+    Args:
+        source (futures.Future): Completed future.
+        target (futures.Future): Future to resolve.
+    """
+    if (exception := source.exception()) is not None:
+        target.set_exception(exception)
+    else:
+        target.set_result(source.result())
+
+
+class HybridExecutor(ThreadExecutor):
+    """
+    A pool executor routing each node by its `executor_affinity`.
+
+    Nodes with THREAD affinity (default) run on the shared thread pool, PROCESS ones on the shared process pool
+    and ASYNC ones as coroutines on the shared background event loop. In-flight limit and priorities apply
+    across all pools. Streaming pipelines always run on the thread pool.
+
+    Args:
+        max_workers (int, optional): The maximum number of concurrently running nodes. Defaults to None.
+        executor (futures.Executor, optional): Pool for THREAD nodes. Defaults to the shared nodes pool.
+    """
+
+    supports_streaming = True
+
+    def __init__(self, max_workers: int | None = None, executor: futures.Executor | None = None):
+        super().__init__(max_workers=max_workers, executor=executor)
+        self._process_executor = None
+
+    @property
+    def process_executor(self) -> ProcessExecutor:
+        """Executor attached to the shared process pool, created on first PROCESS node."""
+        if self._process_executor is None:
+            self._process_executor = ProcessExecutor(executor=get_shared_process_pool())
+        return self._process_executor
+
+    def run_node(self, ready_node: NodeReadyToRun, config: RunnableConfig = None, **kwargs):
+        """
+        Submits ready node for execution to the pool matching its affinity.
+
+        Args:
+            ready_node (NodeReadyToRun): node ready to run.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+        """
+        if ready_node.stream_consumers:
+            return super().run_node(ready_node=ready_node, config=config, **kwargs)
+
+        match ready_node.node.executor_affinity:
+            case ExecutorAffinity.PROCESS:
+                return self.process_executor.run_node(ready_node=ready_node, config=config, **kwargs)
+            case ExecutorAffinity.ASYNC:
+                return asyncio.run_coroutine_threadsafe(
+                    ready_node.node.arun(
+                        input_data=ready_node.input_data,
+                        config=config,
+                        depends_result=ready_node.depends_result,
+                        transformed_input=ready_node.transformed_input,
+                        **kwargs,
+                    ),
+                    get_shared_event_loop(),
+                )
+            case _:
+                return super().run_node(ready_node=ready_node, config=config, **kwargs)
+
+
+class AsyncExecutor(BaseExecutor):
+    """
+    An event loop based executor that runs nodes as asyncio tasks using `Node.arun`.
+
+    Nodes with native async clients do not occupy an OS thread while waiting for network responses.
+    Must be used from a running event loop.
+
+    Args:
+        max_workers (int, optional): The maximum number of concurrently running nodes. Defaults to None (no limit).
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        super().__init__(max_workers=max_workers)
+        self.node_by_task = {}
+        self.node_durations = {}
+        self.semaphore = asyncio.Semaphore(max_workers) if max_workers else None
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shuts down the executor.
+
+        Args:
+            wait (bool, optional): Whether to keep pending tasks running. Pending tasks are cancelled otherwise.
+                Defaults to True.
+        """
+        if not wait:
+            for task in self.node_by_task:
+                task.cancel()
+
+    async def execute(
+        self,
+        ready_nodes: list[NodeReadyToRun],
+        config: RunnableConfig = None,
+        **kwargs,
+    ) -> dict[str, RunnableResult]:
+        """
+        Executes the given ready nodes and returns results of the first completed ones.
+
+        Args:
+            ready_nodes (list[NodeReadyToRun]): List of nodes ready to run.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            dict[str, RunnableResult]: A dictionary of node IDs and their execution results.
+        """
+        self.run_nodes(ready_nodes=ready_nodes, config=config, **kwargs)
+        if not self.node_by_task:
+            return {}
+
+        completed_node_tasks, _ = await asyncio.wait(self.node_by_task.keys(), return_when=asyncio.FIRST_COMPLETED)
+        return self.complete_nodes(completed_node_tasks=completed_node_tasks)
+
+    def run_nodes(
+        self,
+        ready_nodes: list[NodeReadyToRun],
+        config: RunnableConfig = None,
+        **kwargs,
+    ):
+        """
+        Schedules ready nodes as event loop tasks.
+
+        Args:
+            ready_nodes (list[NodeReadyToRun]): List of nodes ready to run.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+                Overridden by the own configuration of the ready node, if any.
+            **kwargs: Additional keyword arguments.
+        """
+        for ready_node in sorted(ready_nodes, key=lambda ready_node: -ready_node.priority):
+            if ready_node.is_ready:
+                task = asyncio.create_task(self.run_node(ready_node=ready_node, config=config, **kwargs))
+                self.node_by_task[task] = ready_node.node
+            else:
+                logger.error(f"Node {ready_node.node.name} - {ready_node.node.id}: not ready to run.")
+
+    def complete_nodes(self, completed_node_tasks: set[asyncio.Task]) -> dict[str, RunnableResult]:
+        """
+        Processes completed node tasks and returns their results.
+
+        Args:
+            completed_node_tasks (set[asyncio.Task]): Set of completed node tasks.
+
+        Returns:
+            dict[str, RunnableResult]: A dictionary of node IDs and their execution results.
+        """
+        results = {}
+        for task in completed_node_tasks:
+            node = self.node_by_task.pop(task)
+            try:
+                node_result: RunnableResult = task.result()
+            except Exception as e:
+                logger.error(
+                    f"Node {node.name} - {node.id}: execution failed due the unexpected error. Error: {e}"
+                )
+                node_result = RunnableResult(status=RunnableStatus.FAILURE)
+
+            results[node.id] = node_result
+
+        return results
+
+    async def run_node(self, ready_node: NodeReadyToRun, config: RunnableConfig = None, **kwargs) -> RunnableResult:
+        """
+        Runs ready node on the event loop respecting the concurrency limit.
+
+        Args:
+            ready_node (NodeReadyToRun): node ready to run.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result of the node execution.
+        """
+        if self.semaphore is None:
+            return await self._run_node_timed(ready_node=ready_node, config=config, **kwargs)
+
+        async with self.semaphore:
+            return await self._run_node_timed(ready_node=ready_node, config=config, **kwargs)
+
+    async def _run_node_timed(
+        self, ready_node: NodeReadyToRun, config: RunnableConfig = None, **kwargs
+    ) -> RunnableResult:
+        """
+        Runs ready node on the event loop and records its duration.
+
+        Args:
+            ready_node (NodeReadyToRun): node ready to run.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result of the node execution.
+        """
+        time_start = time.monotonic()
+        try:
+            return await ready_node.node.arun(
+                input_data=ready_node.input_data,
+                config=ready_node.get_config(config),
+                depends_result=ready_node.depends_result,
+                transformed_input=ready_node.transformed_input,
+                **kwargs,
+            )
+        finally:
+            self.node_durations[ready_node.node.id] = time.monotonic() - time_start
@@ -0,0 +1,161 @@
+import asyncio
+import os
+import threading
+from concurrent import futures
+from enum import Enum
+
+MAX_WORKERS_SHARED_THREAD_POOL = int(os.getenv("DYNAMIQ_SHARED_THREAD_POOL_MAX_WORKERS", 64))
+MAX_WORKERS_SHARED_PROCESS_POOL = int(os.getenv("DYNAMIQ_SHARED_PROCESS_POOL_MAX_WORKERS", os.cpu_count() or 1))
+
+
+class SharedThreadPool(str, Enum):
+    """
+    Enumeration of long-lived thread pools shared across flow runs.
+
+    Attributes:
+        NODES: Pool running flow nodes.
+        TASKS: Pool running fan-out tasks submitted from inside nodes (e.g. parallel LLM calls). Kept separate
+            from `NODES` so a node waiting for its own tasks never starves the pool it runs on.
+        EXECUTIONS: Pool running node executions guarded by a timeout or cancellation token, so the waiting
+            caller can return as soon as the execution is canceled.
+    """
+
+    NODES = "nodes"
+    TASKS = "tasks"
+    EXECUTIONS = "executions"
+
+
+_shared_thread_pools: dict[tuple[SharedThreadPool, int], futures.ThreadPoolExecutor] = {}
+_shared_thread_pools_lock = threading.Lock()
+_shared_process_pool: futures.ProcessPoolExecutor | None = None
+_shared_event_loop: asyncio.AbstractEventLoop | None = None
+_worker_state = threading.local()
+
+
+def _init_worker(pool: SharedThreadPool, level: int):
+    """Records the shared pool and nesting level the worker thread belongs to."""
+    _worker_state.pool = pool
+    _worker_state.level = level
+
+
+def get_nesting_level(pool: SharedThreadPool = SharedThreadPool.NODES) -> int:
+    """
+    Gets nesting level of work submitted to the shared pool from the calling thread.
+
+    Work submitted outside of the pool is at level 0. Work submitted from a worker of the pool
+    of level N is at level N + 1.
+
+    Args:
+        pool (SharedThreadPool, optional): Shared pool the work is submitted to. Defaults to SharedThreadPool.NODES.
+
+    Returns:
+        int: Nesting level.
+    """
+    if getattr(_worker_state, "pool", None) is not pool:
+        return 0
+    return _worker_state.level + 1
+
+
+def get_shared_thread_pool(
+    pool: SharedThreadPool = SharedThreadPool.NODES,
+    level: int = 0,
+) -> futures.ThreadPoolExecutor:
+    """
+    Gets long-lived thread pool shared across flow runs, creating it on first use.
+
+    Worker threads stay warm between runs and the pool size bounds global concurrency of the process.
+    Each nesting level gets its own pool, so nodes waiting for flows nested in them never take the workers
+    the nested nodes need.
+
+    Args:
+        pool (SharedThreadPool, optional): Shared pool to get. Defaults to SharedThreadPool.NODES.
+        level (int, optional): Nesting level of the pool, see `get_nesting_level`. Defaults to 0.
+
+    Returns:
+        futures.ThreadPoolExecutor: Shared thread pool.
+    """
+    if (executor := _shared_thread_pools.get((pool, level))) is not None:
+        return executor
+
+    with _shared_thread_pools_lock:
+        if (executor := _shared_thread_pools.get((pool, level))) is None:
+            executor = futures.ThreadPoolExecutor(
+                max_workers=MAX_WORKERS_SHARED_THREAD_POOL,
+                thread_name_prefix=f"dynamiq-{pool.value}" + (f"-{level}" if level else ""),
+                initializer=_init_worker,
+                initargs=(pool, level),
+            )
+            _shared_thread_pools[(pool, level)] = executor
+
+    return executor
+
+
+def get_shared_process_pool() -> futures.ProcessPoolExecutor:
+    """
+    Gets long-lived process pool shared across flow runs, creating it on first use.
+
+    Returns:
+        futures.ProcessPoolExecutor: Shared process pool.
+    """
+    global _shared_process_pool
+
+    if _shared_process_pool is None:
+        with _shared_thread_pools_lock:
+            if _shared_process_pool is None:
+                _shared_process_pool = futures.ProcessPoolExecutor(max_workers=MAX_WORKERS_SHARED_PROCESS_POOL)
+
+    return _shared_process_pool
+
+
+def get_shared_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Gets long-lived event loop running in a background thread, creating it on first use.
+
+    Coroutines are submitted with `asyncio.run_coroutine_threadsafe`, which returns a `concurrent.futures.Future`.
+
+    Returns:
+        asyncio.AbstractEventLoop: Shared event loop.
+    """
+    global _shared_event_loop
+
+    if _shared_event_loop is None:
+        with _shared_thread_pools_lock:
+            if _shared_event_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="dynamiq-event-loop", daemon=True).start()
+                _shared_event_loop = loop
+
+    return _shared_event_loop
+
+
+def _reset_shared_pools_in_child():
+    """Drops pools inherited by a forked process, as their worker threads and processes are not copied by fork."""
+    global _shared_thread_pools_lock, _shared_process_pool, _shared_event_loop
+
+    _shared_thread_pools.clear()
+    _shared_thread_pools_lock = threading.Lock()
+    _shared_process_pool = None
+    _shared_event_loop = None
+
+
+os.register_at_fork(after_in_child=_reset_shared_pools_in_child)
+
+
+def shutdown_shared_thread_pools(wait: bool = True):
+    """
+    Shuts down all shared thread and process pools. Pools are recreated on next use.
+
+    Args:
+        wait (bool, optional): Whether to wait for running tasks to complete. Defaults to True.
+    """
+    global _shared_process_pool
+
+    with _shared_thread_pools_lock:
+        executors = list(_shared_thread_pools.values())
+        _shared_thread_pools.clear()
+        if _shared_process_pool is not None:
+            executors.append(_shared_process_pool)
+            _shared_process_pool = None
+
+    for executor in executors:
+        executor.shutdown(wait=wait)
@@ -0,0 +1,156 @@
+import threading
+import typing
+from collections import deque
+from concurrent import futures
+from typing import Any, Iterator
+
+from dynamiq.executors.shared import SharedThreadPool, get_nesting_level, get_shared_thread_pool
+from dynamiq.runnables import RunnableConfig, RunnableResult, RunnableStatus
+from dynamiq.types.cancellation import CanceledException
+from dynamiq.utils.logger import logger
+
+if typing.TYPE_CHECKING:
+    from dynamiq.nodes.node import NodeReadyToRun
+
+DEFAULT_STREAM_BUFFER_SIZE = 16
+
+
+class NodeOutputStream:
+    """
+    Bounded buffer passing output chunks of a node to a downstream node running at the same time.
+
+    The producer blocks while the buffer is full, so a slow consumer bounds the memory held between nodes.
+    Closing the stream ends the iteration on the consumer side and makes further `put` calls no-op,
+    so either side can stop the other.
+
+    Args:
+        maxsize (int, optional): Maximum number of buffered chunks. Defaults to DEFAULT_STREAM_BUFFER_SIZE.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_STREAM_BUFFER_SIZE):
+        self.maxsize = maxsize
+        self._chunks = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._error = None
+
+    def put(self, chunk: Any) -> bool:
+        """
+        Adds chunk to the buffer, blocking while the buffer is full.
+
+        Args:
+            chunk (Any): Output chunk.
+
+        Returns:
+            bool: Whether the chunk was added. False if the stream is closed.
+        """
+        with self._condition:
+            while len(self._chunks) >= self.maxsize and not self._closed:
+                self._condition.wait()
+            if self._closed:
+                return False
+            self._chunks.append(chunk)
+            self._condition.notify_all()
+            return True
+
+    def close(self, error: Exception | None = None):
+        """
+        Closes the stream. Buffered chunks are still delivered to the consumer.
+
+        Args:
+            error (Exception | None, optional): Error raised to the consumer after buffered chunks. Defaults to None.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._error = error
+            self._condition.notify_all()
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterates over chunks until the stream is closed.
+
+        Raises:
+            Exception: Error the stream was closed with.
+        """
+        while True:
+            with self._condition:
+                while not self._chunks and not self._closed:
+                    self._condition.wait()
+                if self._chunks:
+                    chunk = self._chunks.popleft()
+                    self._condition.notify_all()
+                elif self._error is not None:
+                    raise self._error
+                else:
+                    return
+            yield chunk
+
+
+def run_stream_pipeline(
+    ready_node: "NodeReadyToRun", config: RunnableConfig = None, **kwargs
+) -> dict[str, RunnableResult]:
+    """
+    Runs the node together with its streaming consumers, connected by bounded output streams.
+
+    The node runs in the calling thread and each consumer on a worker of the shared nodes pool of the next
+    nesting level, so consumers process chunks while upstream nodes are still producing them. Consumers never
+    wait for workers taken by their producers, so pipelines can not deadlock on a full pool.
+
+    Args:
+        ready_node (NodeReadyToRun): Producer node with its streaming consumers.
+        config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+        **kwargs: Additional keyword arguments.
+
+    Returns:
+        dict[str, RunnableResult]: Results of the pipeline nodes by node id.
+    """
+    results = {}
+    streams = []
+    stage_futures: list[futures.Future] = []
+
+    def run_stage(stage: "NodeReadyToRun", input_stream: NodeOutputStream | None = None):
+        node = stage.node
+        output_streams = []
+        try:
+            for consumer in stage.stream_consumers:
+                stream = NodeOutputStream(maxsize=ready_node.stream_buffer_size)
+                streams.append(stream)
+                output_streams.append(stream)
+                pool = get_shared_thread_pool(SharedThreadPool.NODES, get_nesting_level())
+                stage_futures.append(pool.submit(run_stage, consumer, stream))
+
+            results[node.id] = node.run_stream(
+                input_data=stage.input_data,
+                config=config,
+                depends_result=stage.depends_result,
+                input_stream=input_stream,
+                output_streams=output_streams,
+                transformed_input=stage.transformed_input,
+                **kwargs,
+            )
+        except Exception as e:
+            logger.error(f"Node {node.name} - {node.id}: streaming execution failed. Error: {e}")
+            results[node.id] = RunnableResult(status=RunnableStatus.FAILURE)
+            for stream in output_streams:
+                stream.close(e)
+            if input_stream is not None:
+                input_stream.close()
+
+    token = config.cancellation_token if config else None
+    cancel_callback = None
+    if token:
+        cancel_callback = token.on_cancel(
+            lambda: [stream.close(CanceledException(token.reason)) for stream in list(streams)]
+        )
+
+    try:
+        run_stage(ready_node)
+        while stage_futures:
+            stage_futures.pop().result()
+    finally:
+        if cancel_callback:
+            token.remove_on_cancel(cancel_callback)
+
+    return results
@@ -34,6 +34,27 @@ class BaseFlow(BaseModel, Runnable, ABC):
         """Reset the internal run state by clearing the results dictionary."""
         self._results = {}
 
+    def to_dict(self, **kwargs) -> dict:
+        """
+        Converts the flow to a dictionary passed to callbacks.
+
+        Args:
+            **kwargs: Additional keyword arguments passed to `model_dump`.
+
+        Returns:
+            dict: A dictionary representation of the flow.
+        """
+        return self.model_dump(**kwargs)
+
+    def to_dict_snapshot(self) -> dict:
+        """
+        Gets serialized flow passed to callbacks. Flows sharing it between runs override this method.
+
+        Returns:
+            dict: A dictionary representation of the flow.
+        """
+        return self.to_dict()
+
     def run_on_flow_start(
         self, input_data: Any, config: RunnableConfig = None, **kwargs: Any
     ):
@@ -46,8 +67,9 @@ class BaseFlow(BaseModel, Runnable, ABC):
             **kwargs: Additional keyword arguments to be passed to the callbacks.
         """
         if config and config.callbacks:
+            serialized = self.to_dict_snapshot()
             for callback in config.callbacks:
-                callback.on_flow_start(self.model_dump(), input_data, **kwargs)
+                callback.on_flow_start(serialized, input_data, **kwargs)
 
     def run_on_flow_end(
         self, output_data: Any, config: RunnableConfig = None, **kwargs: Any
@@ -61,8 +83,9 @@ class BaseFlow(BaseModel, Runnable, ABC):
             **kwargs: Additional keyword arguments to be passed to the callbacks.
         """
         if config and config.callbacks:
+            serialized = self.to_dict_snapshot()
             for callback in config.callbacks:
-                callback.on_flow_end(self.model_dump(), output_data, **kwargs)
+                callback.on_flow_end(serialized, output_data, **kwargs)
 
     def run_on_flow_error(
         self, error: BaseException, config: RunnableConfig = None, **kwargs: Any
@@ -76,5 +99,6 @@ class BaseFlow(BaseModel, Runnable, ABC):
             **kwargs: Additional keyword arguments to be passed to the callbacks.
         """
         if config and config.callbacks:
+            serialized = self.to_dict_snapshot()
             for callback in config.callbacks:
-                callback.on_flow_error(self.model_dump(), error, **kwargs)
+                callback.on_flow_error(serialized, error, **kwargs)
@@ -1,36 +1,263 @@
+import asyncio
+import functools
+from concurrent import futures
 from datetime import datetime
 from graphlib import CycleError, TopologicalSorter
 from io import BytesIO
-from typing import Any
-from uuid import uuid4
+from typing import Any, Callable, Generator, Iterable, Literal
+from uuid import UUID, uuid4
 
-from pydantic import field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from dynamiq.callbacks import DeferredCallbackHandler
+from dynamiq.checkpoints import BaseCheckpointStore, FlowCheckpoint
 from dynamiq.connections.managers import ConnectionManager
 from dynamiq.executors.base import BaseExecutor
-from dynamiq.executors.pool import ThreadExecutor
+from dynamiq.executors.pool import AsyncExecutor, PoolExecutor, ThreadExecutor
+from dynamiq.executors.streaming import DEFAULT_STREAM_BUFFER_SIZE
 from dynamiq.flows.base import BaseFlow
-from dynamiq.nodes.node import Node, NodeReadyToRun
+from dynamiq.flows.incremental import IncrementalResults
+from dynamiq.flows.scheduling import FlowGraph, NodeCostEstimator, NodeSorter
+from dynamiq.nodes.exceptions import NodeException
+from dynamiq.nodes.node import Node, NodeDependency, NodeReadyToRun, ensure_config
+from dynamiq.nodes.operators import Choice, Pass
 from dynamiq.runnables import RunnableConfig, RunnableResult, RunnableStatus
+from dynamiq.types.cancellation import CanceledException, CancellationToken
+from dynamiq.utils import jsonpath
 from dynamiq.utils.duration import format_duration
 from dynamiq.utils.logger import logger
 
+MAX_BATCH_CONCURRENCY = 32
+
+
+class FlowRunState(BaseModel):
+    """
+    Holds the state of a single flow run, so one Flow instance can serve many concurrent runs.
+
+    Attributes:
+        run_id (UUID): Identifier of the flow run.
+        input_data (Any): Input data of the flow run.
+        results (dict[str, RunnableResult]): Results of the flow nodes by node id.
+        topological_sorter (NodeSorter): Sorter tracking nodes progress of the run.
+        priorities (dict[str, float]): Scheduling priorities of the flow nodes by node id.
+        kwargs (dict[str, Any]): Keyword arguments of the run passed to callbacks.
+        time_start (datetime | None): Start time of the run.
+        checkpoint_id (str | None): Identifier the run progress is checkpointed under, if checkpointing is enabled.
+        fingerprints (dict[str, str]): Input fingerprints of executed nodes by node id, if incremental mode is enabled.
+        pipelined_node_ids (set[str]): Ids of streaming consumers started together with their running dependency.
+        yield_completed (bool): Whether results of completed nodes are collected for the results iterator.
+        completed_results (list[tuple[str, RunnableResult]]): Node ids and results of completed nodes not yet
+            yielded by the results iterator.
+        speculative_runs (dict[str, CancellationToken]): Cancellation tokens of nodes started ahead of their
+            `Choice` dependency by node id.
+        speculative_results (dict[str, RunnableResult]): Results of speculative runs completed before
+            the `Choice` they depend on.
+        speculative_callbacks (dict[str, DeferredCallbackHandler]): Callbacks of speculative runs holding their
+            events until the runs are confirmed.
+        discarded_node_ids (set[str]): Ids of nodes whose discarded speculative run is still in progress.
+        config (RunnableConfig | None): Configuration of the run with its latency budget applied.
+        budget_token (CancellationToken | None): Token expiring when the latency budget of the run runs out.
+        node_tokens (dict[str, CancellationToken]): Tokens limiting running nodes to their share of the time
+            left until the run deadline by node id.
+        pending_consumers (dict[str, int]): Number of dependants yet to complete by id of nodes whose input
+            and output are released once all of them complete, see `Flow.keep_outputs`.
+        dependencies (dict[str, list[str]]): Ids of dependencies by node id, to release consumed results.
+    """
+
+    run_id: UUID = Field(default_factory=uuid4)
+    input_data: Any = None
+    results: dict[str, RunnableResult] = {}
+    topological_sorter: NodeSorter
+    priorities: dict[str, float] = {}
+    kwargs: dict[str, Any] = {}
+    time_start: datetime | None = None
+    checkpoint_id: str | None = None
+    ready_node_ids: list[str] = []
+    fingerprints: dict[str, str] = {}
+    pipelined_node_ids: set[str] = set()
+    yield_completed: bool = False
+    completed_results: list[tuple[str, RunnableResult]] = []
+    speculative_runs: dict[str, CancellationToken] = {}
+    speculative_results: dict[str, RunnableResult] = {}
+    speculative_callbacks: dict[str, DeferredCallbackHandler] = {}
+    discarded_node_ids: set[str] = set()
+    config: RunnableConfig | None = None
+    budget_token: CancellationToken | None = None
+    node_tokens: dict[str, CancellationToken] = {}
+    pending_consumers: dict[str, int] = {}
+    dependencies: dict[str, list[str]] = {}
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the run still has nodes to process."""
+        return self.topological_sorter.is_active()
+
+    @property
+    def node_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments passed to nodes of the run."""
+        return self.kwargs | {"parent_run_id": self.run_id}
+
+    def update(self, results: dict[str, RunnableResult]):
+        """
+        Stores completed nodes results and marks them as done.
+
+        Args:
+            results (dict[str, RunnableResult]): Results of completed nodes by node id.
+        """
+        self.results.update(results)
+        # only the results iterator pops completed results, other runs would keep released results alive
+        if self.yield_completed:
+            self.completed_results.extend(results.items())
+        if self.pending_consumers:
+            self.release_consumed(results)
+        for node_id in results:
+            if node_token := self.node_tokens.pop(node_id, None):
+                node_token.release()
+        pipelined = self.pipelined_node_ids.intersection(results)
+        self.topological_sorter.done(*(node_id for node_id in results if node_id not in pipelined))
+
+        # consumers completed ahead of the sorter are marked done once their dependencies are
+        while pipelined and (ready_node_ids := self.topological_sorter.get_ready()):
+            for node_id in ready_node_ids:
+                if node_id in pipelined:
+                    pipelined.remove(node_id)
+                    self.pipelined_node_ids.discard(node_id)
+                    self.topological_sorter.done(node_id)
+                else:
+                    self.ready_node_ids.append(node_id)
+
+    def hold_speculative(self, results: dict[str, RunnableResult]) -> dict[str, RunnableResult]:
+        """
+        Holds results of speculative runs until the `Choice` they depend on completes.
+
+        Results of discarded speculative runs are dropped.
+
+        Args:
+            results (dict[str, RunnableResult]): Results of completed nodes by node id.
+
+        Returns:
+            dict[str, RunnableResult]: Results of completed nodes that are not speculative.
+        """
+        completed = {}
+        for node_id, result in results.items():
+            if node_id in self.speculative_runs:
+                self.speculative_results[node_id] = result
+            elif node_id in self.discarded_node_ids:
+                self.discarded_node_ids.remove(node_id)
+            else:
+                completed[node_id] = result
+        return completed
+
+    def release(self):
+        """Releases cancellation tokens created for the run, detaching them from the caller token."""
+        for token in self.speculative_runs.values():
+            token.cancel("Flow run finished.")
+        for callbacks in self.speculative_callbacks.values():
+            callbacks.discard()
+        for token in self.node_tokens.values():
+            token.release()
+        self.node_tokens.clear()
+        if self.budget_token:
+            self.budget_token.release()
+
+    def pop_completed(self) -> list[tuple[str, RunnableResult]]:
+        """
+        Pops results of nodes completed since the previous call.
+
+        Returns:
+            list[tuple[str, RunnableResult]]: Node ids and results in order of completion.
+        """
+        completed_results, self.completed_results = self.completed_results, []
+        return completed_results
+
+    def release_consumed(self, node_ids: Iterable[str]):
+        """
+        Drops input and output of nodes whose dependants all completed, keeping only their status.
+
+        Args:
+            node_ids (Iterable[str]): Ids of completed nodes.
+        """
+        for node_id in node_ids:
+            for dep_id in self.dependencies.get(node_id, ()):
+                if dep_id in self.pending_consumers:
+                    self.pending_consumers[dep_id] -= 1
+                    self._release_if_consumed(dep_id)
+            self._release_if_consumed(node_id)
+
+    def _release_if_consumed(self, node_id: str):
+        # streaming consumers may complete before their dependency result is stored
+        result = self.results[node_id]
+        if self.pending_consumers.get(node_id) == 0 and result.status != RunnableStatus.UNDEFINED:
+            del self.pending_consumers[node_id]
+            self.results[node_id] = RunnableResult(status=result.status)
+
+    def get_ready(self) -> list[str]:
+        """
+        Gets ids of nodes whose dependencies are done.
+
+        Returns:
+            list[str]: Ids of nodes ready to run.
+        """
+        ready_node_ids, self.ready_node_ids = self.ready_node_ids, []
+        return ready_node_ids + list(self.topological_sorter.get_ready())
+
+    def restore(self, results: dict[str, RunnableResult]):
+        """
+        Marks nodes completed by a previous attempt of the run as done, so only remaining nodes are executed.
+
+        Args:
+            results (dict[str, RunnableResult]): Results of previously completed nodes by node id.
+        """
+        while ready_node_ids := self.topological_sorter.get_ready():
+            restored = {node_id: results[node_id] for node_id in ready_node_ids if node_id in results}
+            self.ready_node_ids.extend(node_id for node_id in ready_node_ids if node_id not in restored)
+            if not restored:
+                break
+            self.update(restored)
+
 
 class Flow(BaseFlow):
     """
     Represents a flow of nodes to be executed.
 
+    When more nodes are ready than workers are available, nodes on the critical path are started first.
+    Node costs come from `Node.cost_hint` or are learned from durations of previous runs.
+
+    Nodes depending on a `ChoiceOption` marked as speculative start as soon as their other dependencies complete,
+    in parallel with the `Choice` and its upstream. If the option is not taken, the speculative run is canceled,
+    its result discarded and the node skipped as usual. Such nodes must not read the `Choice` output.
+
     Attributes:
         nodes (list[Node]): List of nodes in the flow.
         executor (type[BaseExecutor]): Executor class for running nodes. Defaults to ThreadExecutor.
         max_node_workers (int | None): Maximum number of concurrent node workers. Defaults to None.
+        executor_pool (futures.Executor | None): Long-lived pool to run nodes on. Defaults to None,
+            which uses the executor default (the shared thread pool for ThreadExecutor).
         connection_manager (ConnectionManager): Manager for handling connections. Defaults to ConnectionManager().
+        checkpoint_store (BaseCheckpointStore | None): Store recording results of completed nodes, so a failed run
+            can be resumed from the last successful node. Defaults to None.
+        incremental (bool): Whether to reuse outputs of nodes whose input did not change since the previous run
+            instead of executing them again. Nodes are assumed to be deterministic. Defaults to False.
+        stream_buffer_size (int): Maximum number of output chunks buffered on each streaming dependency.
+            Defaults to DEFAULT_STREAM_BUFFER_SIZE.
+        keep_outputs (Literal["all", "sinks"] | list[str]): Nodes that keep their input and output until the run
+            ends: all nodes, sinks (nodes without dependants) or nodes with the listed ids. Input and output of
+            other nodes are dropped as soon as all their dependants complete, so memory of flows passing large
+            payloads does not grow with the flow size. Their flow output entries only carry the status.
+            Defaults to "all".
     """
 
     nodes: list[Node] = []
     executor: type[BaseExecutor] = ThreadExecutor
     max_node_workers: int | None = None
+    executor_pool: futures.Executor | None = Field(default=None, exclude=True)
     connection_manager: ConnectionManager = ConnectionManager()
+    checkpoint_store: BaseCheckpointStore | None = Field(default=None, exclude=True)
+    incremental: bool = False
+    stream_buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE
+    keep_outputs: Literal["all", "sinks"] | list[str] = "all"
 
     def __init__(self, **kwargs):
         """
@@ -41,7 +268,12 @@ class Flow(BaseFlow):
         """
         super().__init__(**kwargs)
         self._node_by_id = {node.id: node for node in self.nodes}
-        self._ts = None
+        self._stream_consumers = self._get_stream_consumers_by_node_id(self.nodes)
+        self._speculative_dependencies = self._get_speculative_dependencies_by_node_id(self.nodes)
+        self._cost_estimator = NodeCostEstimator()
+        self._incremental_results = IncrementalResults()
+        self._graph: FlowGraph | None = None
+        self._serialized: tuple[list[dict], dict] | None = None
 
         self._init_components()
         self.reset_run_state()
@@ -76,6 +308,13 @@ class Flow(BaseFlow):
                     f"Flow node '{node.id}' has duplicated dependency ids. Node dependencies ids must be unique."
                 )
 
+            if len([dep for dep in node.depends if dep.stream]) > 1:
+                raise ValueError(f"Flow node '{node.id}' has more than one streaming dependency.")
+            if any(dep.stream and dep.option for dep in node.depends):
+                raise ValueError(f"Flow node '{node.id}' has streaming dependency with option.")
+            if any(dep.stream for dep in node.depends) and not node.supports_stream_input:
+                raise ValueError(f"Flow node '{node.id}' has streaming dependency but does not support stream input.")
+
             nodes_deps_ids_unique.update(node_deps_ids)
 
         if not nodes_deps_ids_unique.issubset(nodes_ids_unique):
@@ -85,55 +324,444 @@ class Flow(BaseFlow):
 
         return nodes
 
+    @model_validator(mode="after")
+    def validate_keep_outputs(self) -> "Flow":
+        """
+        Validates that nodes listed in `keep_outputs` are present in the flow.
+
+        Returns:
+            Flow: The validated flow.
+
+        Raises:
+            ValueError: If `keep_outputs` lists ids of nodes that are not present in the flow.
+        """
+        if isinstance(self.keep_outputs, list):
+            if unknown_ids := set(self.keep_outputs).difference(node.id for node in self.nodes):
+                raise ValueError(f"Flow keep_outputs has ids of nodes not present in the flow: {sorted(unknown_ids)}.")
+        return self
+
+    @staticmethod
+    def _get_stream_consumers_by_node_id(nodes: list[Node]) -> dict[str, list[Node]]:
+        """
+        Gets nodes consuming output chunks of each node through streaming dependencies.
+
+        Args:
+            nodes (list[Node]): Nodes of the flow.
+
+        Returns:
+            dict[str, list[Node]]: Streaming consumers by producer node id.
+        """
+        stream_consumers = {}
+        for node in nodes:
+            for dep in node.depends:
+                if dep.stream:
+                    stream_consumers.setdefault(dep.node.id, []).append(node)
+        return stream_consumers
+
+    @staticmethod
+    def _get_speculative_dependencies_by_node_id(nodes: list[Node]) -> dict[str, NodeDependency]:
+        """
+        Gets dependencies on speculative `Choice` options, which let nodes start before the choice completes.
+
+        Args:
+            nodes (list[Node]): Nodes of the flow.
+
+        Returns:
+            dict[str, NodeDependency]: Speculative dependency by node id.
+        """
+        speculative_dependencies = {}
+        for node in nodes:
+            for dep in node.depends:
+                if isinstance(dep.node, Choice) and any(
+                    option.id == dep.option and option.speculative for option in dep.node.options
+                ):
+                    speculative_dependencies[node.id] = dep
+                    break
+        return speculative_dependencies
+
     def _init_components(self):
         """Initializes components for nodes with postponed initialization."""
         for node in self.nodes:
             if node.is_postponed_component_init:
                 node.init_components(self.connection_manager)
 
-    def _get_nodes_ready_to_run(self, input_data: Any) -> list[NodeReadyToRun]:
+    def to_dict(self, **kwargs) -> dict:
+        """
+        Converts the flow to a dictionary passed to callbacks, with nodes taken from their shared snapshots.
+
+        Args:
+            **kwargs: Additional keyword arguments passed to `model_dump`.
+
+        Returns:
+            dict: A dictionary representation of the flow.
+        """
+        data = self.model_dump(exclude={"nodes"}, **kwargs)
+        data["nodes"] = [node.to_dict_snapshot() for node in self.nodes]
+        return data
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in self.model_fields:
+            self._serialized = None
+
+    def to_dict_snapshot(self) -> dict:
+        """
+        Gets serialized flow shared by all callbacks of all runs, created on first use.
+
+        The snapshot is recreated after a field of the flow is assigned or a node snapshot is recreated,
+        e.g. after nodes are added. Like node snapshots, it must not be modified.
+
+        Returns:
+            dict: A dictionary representation of the flow.
+        """
+        node_snapshots = [node.to_dict_snapshot() for node in self.nodes]
+        if (serialized := self._serialized) is None or not (
+            len(serialized[0]) == len(node_snapshots)
+            and all(cached is snapshot for cached, snapshot in zip(serialized[0], node_snapshots))
+        ):
+            data = self.model_dump(exclude={"nodes"})
+            data["nodes"] = node_snapshots
+            serialized = self._serialized = (node_snapshots, data)
+        return serialized[1]
+
+    def compile(self) -> "Flow":
+        """
+        Precomputes data shared by all runs of the flow, so runs do not derive it again.
+
+        Validates the dependency graph once and builds the graph run sorters and priorities start from,
+        and parses JSONPath expressions of node transformers, so executions reuse the parsed expressions.
+        Called on the first run and again after nodes are added.
+
+        Returns:
+            Flow: The compiled flow.
+
+        Raises:
+            CycleError: If a cycle is detected in node dependencies.
+        """
+        self.init_node_topological_sorter(nodes=self.nodes)
+        for node in self.nodes:
+            transformers = [node.input_transformer, node.output_transformer]
+            if isinstance(node, Pass):
+                transformers.extend(node.transformers)
+            for transformer in transformers:
+                for path in [transformer.path, *(transformer.selector or {}).values()]:
+                    if path:
+                        jsonpath.parse_jsonpath(path)
+
+        self._graph = FlowGraph(self.nodes)
+        return self
+
+    def init_run_state(self, input_data: Any, run_id: UUID | None = None) -> FlowRunState:
+        """
+        Initializes the state of a new flow run.
+
+        Args:
+            input_data (Any): Input data for the flow run.
+            run_id (UUID | None, optional): Identifier of the flow run. Defaults to None.
+
+        Returns:
+            FlowRunState: Fresh state of the flow run.
+        """
+        graph = self._graph or self.compile()._graph
+        pending_consumers = self._get_released_nodes_consumer_counts(graph)
+        return FlowRunState(
+            run_id=run_id or uuid4(),
+            input_data=input_data,
+            results={node.id: RunnableResult(status=RunnableStatus.UNDEFINED) for node in self.nodes},
+            topological_sorter=graph.get_sorter(),
+            priorities=self._cost_estimator.get_priorities(self.nodes, successors=graph.successors),
+            pending_consumers=pending_consumers,
+            dependencies=graph.predecessors if pending_consumers else {},
+        )
+
+    def _get_released_nodes_consumer_counts(self, graph: FlowGraph) -> dict[str, int]:
+        """
+        Gets number of dependants of nodes whose input and output are not kept until the run ends.
+
+        Args:
+            graph (FlowGraph): Compiled graph of the flow.
+
+        Returns:
+            dict[str, int]: Number of dependants by node id.
+        """
+        if self.keep_outputs == "all":
+            return {}
+        if self.keep_outputs == "sinks":
+            return {node_id: len(successors) for node_id, successors in graph.successors.items() if successors}
+        return {
+            node_id: len(successors)
+            for node_id, successors in graph.successors.items()
+            if node_id not in self.keep_outputs
+        }
+
+    def _get_nodes_ready_to_run(self, run_state: FlowRunState, stream: bool = False) -> list[NodeReadyToRun]:
         """
         Gets the list of nodes that are ready to run.
 
+        Nodes with failed or skipped dependencies or untaken `Choice` options are skipped in place instead of
+        being submitted to the executor, so whole skipped subtrees complete in a single call. In incremental
+        mode nodes whose input did not change since the previous run are completed with their previous results
+        instead of being returned. Speculatively started nodes are not returned again: their result is kept
+        if the speculation is confirmed, otherwise they are skipped.
+
         Args:
-            input_data (Any): Input data for the nodes.
+            run_state (FlowRunState): State of the flow run.
+            stream (bool, optional): Whether to start streaming consumers together with the ready nodes.
+                Defaults to False.
 
         Returns:
             list[NodeReadyToRun]: List of nodes ready to run.
         """
-        ready_ts_nodes = self._ts.get_ready()
         ready_nodes = []
-        for node_id in ready_ts_nodes:
+        while ready_ts_nodes := run_state.get_ready():
+            completed_results = {}
+            discarded_node_ids = []
+            for node_id in ready_ts_nodes:
+                node = self._node_by_id[node_id]
+                depends_result = {}
+                is_ready = True
+                for dep in node.depends:
+                    if (
+                        dep_result := run_state.results.get(dep.node.id)
+                    ) and dep_result.status != RunnableStatus.UNDEFINED:
+                        depends_result[dep.node.id] = dep_result
+                    else:
+                        is_ready = False
+
+                if node_id in run_state.speculative_runs:
+                    in_progress = node_id not in run_state.speculative_results
+                    if (result := self._resolve_speculative_run(run_state, node, depends_result)) is not None:
+                        completed_results[node_id] = result
+                        if in_progress:
+                            discarded_node_ids.append(node_id)
+                    continue
+
+                if is_ready and (skip_result := self._get_skip_result(run_state, node, depends_result)):
+                    completed_results[node_id] = skip_result
+                    continue
+
+                ready_node = NodeReadyToRun(
+                    node=node,
+                    is_ready=is_ready,
+                    input_data=run_state.input_data,
+                    depends_result=depends_result,
+                    priority=run_state.priorities.get(node_id, 0),
+                )
+                if self.incremental and is_ready:
+                    fingerprint = self._incremental_results.get_fingerprint(ready_node)
+                    if result := self._incremental_results.get(node_id, fingerprint):
+                        logger.info(f"Node {node.name} - {node.id}: input unchanged, previous output reused.")
+                        completed_results[node_id] = result
+                        continue
+                    run_state.fingerprints[node_id] = fingerprint
+
+                if is_ready:
+                    ready_node.config_factory = functools.partial(self._get_node_config, run_state, node)
+                if stream and is_ready:
+                    ready_node.stream_consumers = self._get_stream_consumers_ready_to_run(run_state, node)
+                    ready_node.stream_buffer_size = self.stream_buffer_size
+                ready_nodes.append(ready_node)
+
+            if not completed_results:
+                break
+            self._update_run_state(run_state, completed_results)
+            run_state.discarded_node_ids.update(discarded_node_ids)
+
+        return ready_nodes
+
+    def _get_node_config(self, run_state: FlowRunState, node: Node) -> RunnableConfig | None:
+        """
+        Gets configuration limiting the node run to its share of the time left until the run deadline.
+        Called when the node starts, so time the node waited for an in-flight slot is not counted in its share.
+
+        The share is the node cost relative to the costliest path from the node to the end of the flow,
+        so nodes on the critical path leave time for their dependants. Node timeouts, retries and backoff
+        are capped by the resulting deadline.
+
+        Args:
+            run_state (FlowRunState): State of the flow run.
+            node (Node): Node about to run.
+
+        Returns:
+            RunnableConfig | None: Configuration of the node run or None if the run has no deadline.
+        """
+        config = run_state.config
+        token = config.cancellation_token if config else None
+        if token is None or (remaining := token.remaining) is None:
+            return None
+
+        priority = run_state.priorities.get(node.id, 0)
+        share = remaining * min(self._cost_estimator.get_cost(node) / priority, 1) if priority > 0 else remaining
+        node_token = token.child(share)
+        run_state.node_tokens[node.id] = node_token
+        return config.model_copy(update={"cancellation_token": node_token})
+
+    def _resolve_speculative_run(
+        self, run_state: FlowRunState, node: Node, depends_result: dict[str, RunnableResult]
+    ) -> RunnableResult | None:
+        """
+        Confirms or discards the speculative run of the node once its `Choice` dependency has completed.
+
+        Args:
+            run_state (FlowRunState): State of the flow run.
+            node (Node): Speculatively started node whose dependencies are done.
+            depends_result (dict[str, RunnableResult]): Actual results of the node dependencies.
+
+        Returns:
+            RunnableResult | None: Result of the node or None if its confirmed speculative run is still in progress.
+        """
+        token = run_state.speculative_runs.pop(node.id)
+        speculative_result = run_state.speculative_results.pop(node.id, None)
+        callbacks = run_state.speculative_callbacks.pop(node.id, None)
+        if skip_result := self._get_skip_result(run_state, node, depends_result):
+            token.cancel("Speculative branch discarded.")
+            if callbacks:
+                callbacks.discard()
+            logger.info(f"Node {node.name} - {node.id}: speculative run discarded.")
+            return skip_result
+
+        token.release()
+        if callbacks:
+            callbacks.flush()
+        logger.info(f"Node {node.name} - {node.id}: speculative run confirmed.")
+        return speculative_result
+
+    @staticmethod
+    def _get_skip_result(
+        run_state: FlowRunState, node: Node, depends_result: dict[str, RunnableResult]
+    ) -> RunnableResult | None:
+        """
+        Skips the node in place if its dependencies do not allow it to run, firing skip callbacks as usual.
+
+        Args:
+            run_state (FlowRunState): State of the flow run.
+            node (Node): Node whose dependencies are done.
+            depends_result (dict[str, RunnableResult]): Results of the node dependencies.
+
+        Returns:
+            RunnableResult | None: Skipped node result or None if the node has to run.
+        """
+        try:
+            node.validate_depends(depends_result)
+        except NodeException as e:
+            kwargs = run_state.node_kwargs | {"run_id": uuid4()}
+            config = ensure_config(run_state.config)
+            return node.get_skip_result(e, run_state.input_data, depends_result, config, **kwargs)
+        return None
+
+    def _run_speculative_nodes(self, run_state: FlowRunState, run_executor: BaseExecutor):
+        """
+        Starts nodes depending on speculative `Choice` options whose other dependencies succeeded,
+        without waiting for the choice.
+
+        Each speculative run gets its own cancellation token, canceled if the option is not taken. Callback events
+        of the run are held until it is confirmed, so discarded runs only appear as skipped nodes.
+
+        Args:
+            run_state (FlowRunState): State of the flow run.
+            run_executor (BaseExecutor): Executor of the flow run.
+        """
+        for node_id, choice_dep in self._speculative_dependencies.items():
+            if (
+                node_id in run_state.speculative_runs
+                or run_state.results[node_id].status != RunnableStatus.UNDEFINED
+                or run_state.results[choice_dep.node.id].status != RunnableStatus.UNDEFINED
+            ):
+                continue
+
             node = self._node_by_id[node_id]
             depends_result = {}
-            is_ready = True
             for dep in node.depends:
-                if (
-                    dep_result := self._results.get(dep.node.id)
-                ) and dep_result.status != RunnableStatus.UNDEFINED:
-                    depends_result[dep.node.id] = dep_result
-                else:
-                    is_ready = False
+                if dep is choice_dep:
+                    continue
+                if (dep_result := run_state.results[dep.node.id]).status != RunnableStatus.SUCCESS:
+                    break
+                depends_result[dep.node.id] = dep_result
+            else:
+                # the node sees its option taken, the actual choice result is validated once the choice completes
+                depends_result[choice_dep.node.id] = RunnableResult(
+                    status=RunnableStatus.SUCCESS,
+                    output={choice_dep.option: RunnableResult(status=RunnableStatus.SUCCESS, output=True)},
+                )
+                config = ensure_config(run_state.config)
+                parent_token = config.cancellation_token
+                token = parent_token.child() if parent_token else CancellationToken()
+                run_state.speculative_runs[node_id] = token
+                update = {"cancellation_token": token}
+                if config.callbacks:
+                    callbacks = DeferredCallbackHandler(config.callbacks)
+                    run_state.speculative_callbacks[node_id] = callbacks
+                    update["callbacks"] = [callbacks]
+                logger.info(f"Node {node.name} - {node.id}: started speculatively ahead of {choice_dep.node.id}.")
+                run_executor.run_nodes(
+                    ready_nodes=[
+                        NodeReadyToRun(
+                            node=node,
+                            is_ready=True,
+                            input_data=run_state.input_data,
+                            depends_result=depends_result,
+                            priority=run_state.priorities.get(node_id, 0),
+                        )
+                    ],
+                    config=config.model_copy(update=update),
+                    **run_state.node_kwargs,
+                )
 
-            ready_node = NodeReadyToRun(
-                node=node,
-                is_ready=is_ready,
-                input_data=input_data,
-                depends_result=depends_result,
-            )
-            ready_nodes.append(ready_node)
+    def _get_stream_consumers_ready_to_run(self, run_state: FlowRunState, node: Node) -> list[NodeReadyToRun]:
+        """
+        Gets streaming consumers of the node that can start together with it.
 
-        return ready_nodes
+        A consumer starts with the node only if all its other dependencies are completed, otherwise it runs
+        after the node completes with its merged output.
+
+        Args:
+            run_state (FlowRunState): State of the flow run.
+            node (Node): Node about to run.
 
-    def _get_output(self) -> dict[str, dict]:
+        Returns:
+            list[NodeReadyToRun]: Streaming consumers ready to run with their own streaming consumers.
         """
-        Gets the output of the flow.
+        consumers = []
+        for consumer in self._stream_consumers.get(node.id, []):
+            depends_result = {}
+            for dep in consumer.depends:
+                if dep.node.id == node.id:
+                    continue
+                dep_result = run_state.results.get(dep.node.id)
+                if not dep_result or dep_result.status == RunnableStatus.UNDEFINED:
+                    break
+                depends_result[dep.node.id] = dep_result
+            else:
+                run_state.pipelined_node_ids.add(consumer.id)
+                consumers.append(
+                    NodeReadyToRun(
+                        node=consumer,
+                        is_ready=True,
+                        input_data=run_state.input_data,
+                        depends_result=depends_result,
+                        priority=run_state.priorities.get(consumer.id, 0),
+                        stream_consumers=self._get_stream_consumers_ready_to_run(run_state, consumer),
+                        stream_buffer_size=self.stream_buffer_size,
+                    )
+                )
+        return consumers
+
+    @staticmethod
+    def _get_output(run_state: FlowRunState) -> dict[str, dict]:
+        """
+        Gets the output of the flow run.
+
+        Args:
+            run_state (FlowRunState): State of the flow run.
 
         Returns:
             dict[str, dict]: Output of the flow.
         """
+        # containers shared by results (e.g. parts of the flow input in node inputs) are formatted once with the memo
+        memo = {}
         return {
-            node_id: result.to_dict(skip_format_types={BytesIO, bytes}) for node_id, result in self._results.items()
+            node_id: result.to_dict(skip_format_types={BytesIO, bytes}, memo=memo)
+            for node_id, result in run_state.results.items()
         }
 
     @staticmethod
@@ -162,74 +790,573 @@ class Flow(BaseFlow):
 
         return topological_sorter
 
+    def get_run_executor(self, config: RunnableConfig = None) -> BaseExecutor:
+        """
+        Gets the executor for a flow run attached to the configured long-lived pool, if any.
+
+        Flows run with the executor lent by the calling node (see `SubFlow`) reuse it, sharing its pool and
+        in-flight limit. Other nested runs get their own executor, as their calling node keeps its slot.
+
+        Args:
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+
+        Returns:
+            BaseExecutor: Executor for the flow run.
+        """
+        if config and isinstance(config.run_executor, PoolExecutor):
+            return config.run_executor.child()
+        max_workers = config.max_node_workers if config else self.max_node_workers
+        if executor_pool := (config.executor_pool if config else None) or self.executor_pool:
+            return self.executor(max_workers=max_workers, executor=executor_pool)
+        return self.executor(max_workers=max_workers)
+
+    @staticmethod
+    def _attach_run_executor(run_state: FlowRunState, run_executor: BaseExecutor):
+        """
+        Passes the executor of the flow run to its nodes, so nodes lending their slot can run nested flows on it.
+
+        Args:
+            run_state (FlowRunState): State of the flow run.
+            run_executor (BaseExecutor): Executor of the flow run.
+        """
+        if isinstance(run_executor, PoolExecutor):
+            run_state.config = ensure_config(run_state.config).model_copy(update={"node_executor": run_executor})
+
     def reset_run_state(self):
-        """Resets the run state of the flow."""
-        self._results = {
-            node.id: RunnableResult(status=RunnableStatus.UNDEFINED)
-            for node in self.nodes
-        }
-        self._ts = self.init_node_topological_sorter(nodes=self.nodes)
+        """Resets the results of the last flow run."""
+        self._results = {node.id: RunnableResult(status=RunnableStatus.UNDEFINED) for node in self.nodes}
 
-    def run(self, input_data: Any, config: RunnableConfig = None, **kwargs):
+    def _start_run(
+        self,
+        input_data: Any,
+        config: RunnableConfig = None,
+        checkpoint_id: str | None = None,
+        checkpoint: FlowCheckpoint | None = None,
+        **kwargs,
+    ) -> FlowRunState:
         """
-        Runs the flow with the given input data and configuration.
+        Initializes the state of a new flow run and runs flow start callbacks.
 
         Args:
             input_data (Any): Input data for the flow.
             config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            checkpoint_id (str | None, optional): Identifier to checkpoint the run under. Defaults to None,
+                which uses the run id of the config.
+            checkpoint (FlowCheckpoint | None, optional): Checkpoint of a previous attempt to resume. Defaults to None.
             **kwargs: Additional keyword arguments.
 
         Returns:
-            RunnableResult: Result of the flow execution.
+            FlowRunState: State of the started flow run.
         """
-        self.reset_run_state()
         run_id = uuid4()
-        merged_kwargs = kwargs | {
+        run_state = self.init_run_state(input_data=input_data, run_id=run_id)
+        run_state.config = config
+        if config and config.latency_budget is not None:
+            parent_token = config.cancellation_token
+            run_state.budget_token = (
+                parent_token.child(config.latency_budget)
+                if parent_token
+                else CancellationToken(timeout=config.latency_budget)
+            )
+            run_state.config = config.model_copy(
+                update={"cancellation_token": run_state.budget_token, "latency_budget": None}
+            )
+        if config and (config.run_executor is not None or config.node_executor is not None):
+            # executors of the parent run are not passed to nodes, flows nested in them get their own unless lent
+            run_state.config = run_state.config.model_copy(update={"run_executor": None, "node_executor": None})
+        run_state.kwargs = kwargs | {
             "run_id": run_id,
             "parent_run_id": kwargs.get("parent_run_id", run_id),
         }
 
+        if self.checkpoint_store:
+            run_state.checkpoint_id = checkpoint_id or getattr(config, "run_id", None) or str(run_id)
+            if checkpoint:
+                run_state.restore(checkpoint.results)
+                logger.info(
+                    f"Flow {self.id}: resuming run '{run_state.checkpoint_id}' "
+                    f"with {len(checkpoint.results)} completed nodes."
+                )
+            else:
+                self.checkpoint_store.create(run_state.checkpoint_id, self.id, input_data)
+
         logger.info(f"Flow {self.id}: execution started.")
-        self.run_on_flow_start(input_data, config, **merged_kwargs)
-        time_start = datetime.now()
+        self.run_on_flow_start(input_data, config, **run_state.kwargs)
+        run_state.time_start = datetime.now()
+        return run_state
+
+    def _update_run_state(self, run_state: FlowRunState, results: dict[str, RunnableResult]):
+        """
+        Stores completed nodes results in the run state and checkpoints the successful ones.
+
+        Args:
+            run_state (FlowRunState): State of the flow run.
+            results (dict[str, RunnableResult]): Results of completed nodes by node id.
+        """
+        results = run_state.hold_speculative(results)
+        run_state.update(results)
+        if self.incremental:
+            for node_id, result in results.items():
+                if fingerprint := run_state.fingerprints.pop(node_id, None):
+                    self._incremental_results.update(node_id, fingerprint, result)
+        if self.checkpoint_store:
+            for node_id, result in results.items():
+                if result.status in (RunnableStatus.SUCCESS, RunnableStatus.SKIP):
+                    self.checkpoint_store.save_result(run_state.checkpoint_id, node_id, result)
+
+    def _finish_run(self, run_state: FlowRunState, config: RunnableConfig = None) -> RunnableResult:
+        """
+        Runs flow end callbacks and builds the result of the succeeded flow run.
+
+        Args:
+            run_state (FlowRunState): State of the flow run.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+
+        Returns:
+            RunnableResult: Result of the flow execution.
+        """
+        self._results = run_state.results
+        run_state.release()
+        if (
+            self.checkpoint_store
+            and self.checkpoint_store.delete_on_success
+            and all(result.status != RunnableStatus.FAILURE for result in run_state.results.values())
+        ):
+            self.checkpoint_store.delete(run_state.checkpoint_id)
+        output = self._get_output(run_state)
+        self.run_on_flow_end(output, config, **run_state.kwargs)
+        logger.info(
+            f"Flow {self.id}: execution succeeded in {format_duration(run_state.time_start, datetime.now())}."
+        )
+        return RunnableResult(status=RunnableStatus.SUCCESS, input=run_state.input_data, output=output)
+
+    def _fail_run(self, run_state: FlowRunState, error: Exception, config: RunnableConfig = None) -> RunnableResult:
+        """
+        Runs flow error callbacks and builds the result of the failed flow run.
+
+        Args:
+            run_state (FlowRunState): State of the flow run.
+            error (Exception): Error of the flow run.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+
+        Returns:
+            RunnableResult: Result of the flow execution.
+        """
+        run_state.release()
+        self.run_on_flow_error(error, config, **run_state.kwargs)
+        logger.error(
+            f"Flow {self.id}: execution failed in {format_duration(run_state.time_start, datetime.now())}."
+        )
+        return RunnableResult(status=RunnableStatus.FAILURE, input=run_state.input_data)
+
+    def run(self, input_data: Any, config: RunnableConfig = None, **kwargs):
+        """
+        Runs the flow with the given input data and configuration.
+
+        Args:
+            input_data (Any): Input data for the flow.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result of the flow execution.
+        """
+        run_state = self._start_run(input_data, config, **kwargs)
+        return self._run(run_state, config)
+
+    def get_checkpoint(self, checkpoint_id: str) -> FlowCheckpoint:
+        """
+        Loads checkpoint of the flow run from the checkpoint store.
+
+        Args:
+            checkpoint_id (str): Identifier the run was checkpointed under.
+
+        Returns:
+            FlowCheckpoint: Checkpoint of the flow run.
+
+        Raises:
+            ValueError: If checkpoint store is not set, checkpoint is not found or belongs to another flow.
+        """
+        if self.checkpoint_store is None:
+            raise ValueError(f"Flow {self.id}: checkpoint store is not set.")
+
+        checkpoint = self.checkpoint_store.load(checkpoint_id)
+        if checkpoint is None:
+            raise ValueError(f"Flow {self.id}: checkpoint '{checkpoint_id}' not found.")
+        if checkpoint.flow_id != self.id:
+            raise ValueError(f"Flow {self.id}: checkpoint '{checkpoint_id}' belongs to flow {checkpoint.flow_id}.")
+
+        return checkpoint
+
+    def resume(self, checkpoint_id: str, config: RunnableConfig = None, **kwargs):
+        """
+        Resumes the checkpointed flow run, executing only nodes that did not complete successfully.
+
+        Args:
+            checkpoint_id (str): Identifier the run was checkpointed under, the run id of its config by default.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result of the flow execution.
+
+        Raises:
+            ValueError: If the checkpoint can not be loaded.
+        """
+        checkpoint = self.get_checkpoint(checkpoint_id)
+        run_state = self._start_run(
+            checkpoint.input_data, config, checkpoint_id=checkpoint_id, checkpoint=checkpoint, **kwargs
+        )
+        return self._run(run_state, config)
+
+    def run_iter(
+        self, input_data: Any, config: RunnableConfig = None, **kwargs
+    ) -> Generator[tuple[str, RunnableResult], None, RunnableResult]:
+        """
+        Runs the flow yielding result of each node as soon as the node completes.
+
+        Lets callers return partial results (e.g. retrieved sources) while slower nodes are still running.
+        Closing the iterator early stops the run. Result of the flow is the return value of the generator,
+        available with `yield from`.
+
+        Args:
+            input_data (Any): Input data for the flow.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Yields:
+            tuple[str, RunnableResult]: Node id and result of the completed node.
+
+        Returns:
+            RunnableResult: Result of the flow execution.
+        """
+        run_state = self._start_run(input_data, config, **kwargs)
+        run_state.yield_completed = True
+        return (yield from self._run_iter(run_state, config))
 
+    def _run(self, run_state: FlowRunState, config: RunnableConfig = None) -> RunnableResult:
+        """
+        Executes nodes of the started flow run until all of them complete.
+
+        Args:
+            run_state (FlowRunState): State of the flow run.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+
+        Returns:
+            RunnableResult: Result of the flow execution.
+        """
+        run_iter = self._run_iter(run_state, config)
+        while True:
+            try:
+                next(run_iter)
+            except StopIteration as e:
+                return e.value
+
+    def _run_iter(
+        self, run_state: FlowRunState, config: RunnableConfig = None
+    ) -> Generator[tuple[str, RunnableResult], None, RunnableResult]:
+        """
+        Executes nodes of the started flow run yielding their results as they complete.
+
+        Args:
+            run_state (FlowRunState): State of the flow run.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+
+        Yields:
+            tuple[str, RunnableResult]: Node id and result of the completed node.
+
+        Returns:
+            RunnableResult: Result of the flow execution.
+        """
+        run_executor = None
+        run_config = run_state.config
         try:
             if self.nodes:
-                max_workers = (
-                    config.max_node_workers if config else self.max_node_workers
-                )
-                run_executor = self.executor(max_workers=max_workers)
+                run_executor = self.get_run_executor(config=config)
+                self._attach_run_executor(run_state, run_executor)
+                run_config = run_state.config
 
-                while self._ts.is_active():
-                    ready_nodes = self._get_nodes_ready_to_run(input_data=input_data)
+                while run_state.is_active:
+                    if run_config and run_config.cancellation_token:
+                        run_config.cancellation_token.raise_if_canceled()
+                    ready_nodes = self._get_nodes_ready_to_run(
+                        run_state=run_state, stream=run_executor.supports_streaming
+                    )
+                    self._run_speculative_nodes(run_state, run_executor)
+                    yield from run_state.pop_completed()
                     results = run_executor.execute(
                         ready_nodes=ready_nodes,
-                        config=config,
-                        **(merged_kwargs | {"parent_run_id": run_id}),
+                        config=run_config,
+                        **run_state.node_kwargs,
                     )
-                    self._results.update(results)
-                    self._ts.done(*results.keys())
+                    self._update_run_state(run_state, results)
+                    yield from run_state.pop_completed()
 
                 run_executor.shutdown()
+                self._cost_estimator.update(run_executor.node_durations)
 
-            output = self._get_output()
-            self.run_on_flow_end(self._get_output(), config, **merged_kwargs)
-            logger.info(
-                f"Flow {self.id}: execution succeeded in {format_duration(time_start, datetime.now())}."
-            )
-            return RunnableResult(
-                status=RunnableStatus.SUCCESS, input=input_data, output=output
-            )
+            return self._finish_run(run_state, config)
+        except GeneratorExit:
+            if run_executor is not None:
+                run_executor.shutdown(wait=False)
+            self._fail_run(run_state, CanceledException("Flow results iterator closed."), config)
+            raise
         except Exception as e:
-            self.run_on_flow_error(e, config, **merged_kwargs)
-            logger.error(
-                f"Flow {self.id}: execution failed in "
-                f"{format_duration(time_start, datetime.now())}."
-            )
-            return RunnableResult(
-                status=RunnableStatus.FAILURE,
-                input=input_data,
-            )
+            if run_executor is not None:
+                run_executor.shutdown(wait=False)
+            return self._fail_run(run_state, e, config)
+
+    async def arun(self, input_data: Any, config: RunnableConfig = None, **kwargs):
+        """
+        Asynchronously runs the flow on the running event loop using the AsyncExecutor.
+
+        Args:
+            input_data (Any): Input data for the flow.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result of the flow execution.
+        """
+        run_state = self._start_run(input_data, config, **kwargs)
+        run_config = run_state.config
+        run_executor = None
+
+        try:
+            if self.nodes:
+                max_workers = config.max_node_workers if config else self.max_node_workers
+                run_executor = AsyncExecutor(max_workers=max_workers)
+
+                while run_state.is_active:
+                    if run_config and run_config.cancellation_token:
+                        run_config.cancellation_token.raise_if_canceled()
+                    ready_nodes = self._get_nodes_ready_to_run(run_state=run_state)
+                    self._run_speculative_nodes(run_state, run_executor)
+                    results = await run_executor.execute(
+                        ready_nodes=ready_nodes,
+                        config=run_config,
+                        **run_state.node_kwargs,
+                    )
+                    self._update_run_state(run_state, results)
+
+                run_executor.shutdown()
+                self._cost_estimator.update(run_executor.node_durations)
+
+            return self._finish_run(run_state, config)
+        except asyncio.CancelledError:
+            if run_executor is not None:
+                run_executor.shutdown(wait=False)
+            self._fail_run(run_state, CanceledException("Flow run task cancelled."), config)
+            raise
+        except Exception as e:
+            if run_executor is not None:
+                run_executor.shutdown(wait=False)
+            return self._fail_run(run_state, e, config)
+
+    def _get_batch_checkpoint_id(self, config: RunnableConfig | None, index: int) -> str | None:
+        """
+        Gets identifier to checkpoint the run of a batch under.
+
+        Args:
+            config (RunnableConfig | None): Configuration shared by all runs of the batch.
+            index (int): Index of the run input in the batch.
+
+        Returns:
+            str | None: Checkpoint identifier or None to fall back to the flow run id.
+        """
+        if config and config.run_id:
+            return f"{config.run_id}-{index}"
+        return None
+
+    def run_batch(
+        self,
+        inputs: Iterable[Any],
+        config: RunnableConfig = None,
+        max_concurrency: int | None = None,
+        on_run_start: Callable[[Any], dict] | None = None,
+        on_run_end: Callable[[RunnableResult, dict], RunnableResult] | None = None,
+        **kwargs,
+    ) -> list[RunnableResult]:
+        """
+        Runs the flow for many inputs concurrently, pipelining their nodes on one shared pool.
+
+        Up to `max_concurrency` runs are active at a time. Ready nodes of all active runs are scheduled on
+        the same pool as soon as their dependencies complete, so fast runs do not wait for slow ones.
+
+        Args:
+            inputs (Iterable[Any]): Input data for each flow run. Consumed lazily.
+            config (RunnableConfig, optional): Configuration shared by all runs. Defaults to None.
+            max_concurrency (int | None, optional): Maximum number of active runs. Defaults to None,
+                which uses `MAX_BATCH_CONCURRENCY`.
+            on_run_start (Callable[[Any], dict] | None, optional): Called when run is admitted with its
+                input data. Returns additional keyword arguments of the run. Defaults to None.
+            on_run_end (Callable[[RunnableResult, dict], RunnableResult] | None, optional): Called with the
+                result and keyword arguments of the finished run. Returns the result to store. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            list[RunnableResult]: Results of the flow runs in the order of inputs.
+        """
+        batch_executor = self.get_run_executor(config=config)
+        if not isinstance(batch_executor, PoolExecutor):
+            raise ValueError(f"Flow {self.id}: batch execution requires a pool executor.")
+
+        inputs_iter = enumerate(inputs)
+        max_concurrency = max_concurrency or MAX_BATCH_CONCURRENCY
+        results: dict[int, RunnableResult] = {}
+        active_runs: dict[int, tuple[FlowRunState, PoolExecutor, dict]] = {}
+
+        def finish(index: int, result: RunnableResult):
+            run_state, run_executor, run_kwargs = active_runs.pop(index)
+            run_executor.shutdown(wait=False)
+            self._cost_estimator.update(run_executor.node_durations)
+            results[index] = on_run_end(result, run_kwargs) if on_run_end else result
+
+        def schedule(index: int):
+            run_state, run_executor, _ = active_runs[index]
+            run_config = run_state.config
+            try:
+                if run_config and run_config.cancellation_token:
+                    run_config.cancellation_token.raise_if_canceled()
+                if run_state.is_active:
+                    run_executor.run_nodes(
+                        ready_nodes=self._get_nodes_ready_to_run(
+                            run_state=run_state, stream=run_executor.supports_streaming
+                        ),
+                        config=run_config,
+                        **run_state.node_kwargs,
+                    )
+                    self._run_speculative_nodes(run_state, run_executor)
+                if not run_executor.node_by_future:
+                    if run_state.is_active:
+                        raise ValueError("No nodes are able to run.")
+                    finish(index, self._finish_run(run_state, config))
+            except Exception as e:
+                finish(index, self._fail_run(run_state, e, config))
+
+        try:
+            while True:
+                while len(active_runs) < max_concurrency and (item := next(inputs_iter, None)) is not None:
+                    index, input_data = item
+                    run_kwargs = kwargs | (on_run_start(input_data) if on_run_start else {})
+                    run_executor = self.executor(
+                        max_workers=batch_executor.max_workers, executor=batch_executor.executor
+                    )
+                    run_state = self._start_run(
+                        input_data, config, checkpoint_id=self._get_batch_checkpoint_id(config, index), **run_kwargs
+                    )
+                    self._attach_run_executor(run_state, run_executor)
+                    active_runs[index] = (run_state, run_executor, run_kwargs)
+                    schedule(index)
+
+                if not active_runs:
+                    break
+
+                completed_node_futures, _ = futures.wait(
+                    fs=[f for _, run_executor, _ in active_runs.values() for f in run_executor.node_by_future],
+                    return_when=futures.FIRST_COMPLETED,
+                )
+                for index, (run_state, run_executor, _) in list(active_runs.items()):
+                    if run_completed := completed_node_futures.intersection(run_executor.node_by_future):
+                        self._update_run_state(
+                            run_state, run_executor.complete_nodes(completed_node_futures=run_completed)
+                        )
+                        run_executor.submit_pending_nodes()
+                        schedule(index)
+        finally:
+            batch_executor.shutdown(wait=not active_runs)
+
+        return [results[index] for index in sorted(results)]
+
+    async def arun_batch(
+        self,
+        inputs: Iterable[Any],
+        config: RunnableConfig = None,
+        max_concurrency: int | None = None,
+        on_run_start: Callable[[Any], dict] | None = None,
+        on_run_end: Callable[[RunnableResult, dict], RunnableResult] | None = None,
+        **kwargs,
+    ) -> list[RunnableResult]:
+        """
+        Asynchronously runs the flow for many inputs concurrently, pipelining their nodes on the event loop.
+
+        Args:
+            inputs (Iterable[Any]): Input data for each flow run. Consumed lazily.
+            config (RunnableConfig, optional): Configuration shared by all runs. Defaults to None.
+            max_concurrency (int | None, optional): Maximum number of active runs. Defaults to None,
+                which uses `MAX_BATCH_CONCURRENCY`.
+            on_run_start (Callable[[Any], dict] | None, optional): Called when run is admitted with its
+                input data. Returns additional keyword arguments of the run. Defaults to None.
+            on_run_end (Callable[[RunnableResult, dict], RunnableResult] | None, optional): Called with the
+                result and keyword arguments of the finished run. Returns the result to store. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            list[RunnableResult]: Results of the flow runs in the order of inputs.
+        """
+        inputs_iter = enumerate(inputs)
+        max_concurrency = max_concurrency or MAX_BATCH_CONCURRENCY
+        max_workers = config.max_node_workers if config else self.max_node_workers
+        results: dict[int, RunnableResult] = {}
+        active_runs: dict[int, tuple[FlowRunState, AsyncExecutor, dict]] = {}
+
+        def finish(index: int, result: RunnableResult):
+            run_state, run_executor, run_kwargs = active_runs.pop(index)
+            run_executor.shutdown(wait=False)
+            self._cost_estimator.update(run_executor.node_durations)
+            results[index] = on_run_end(result, run_kwargs) if on_run_end else result
+
+        def schedule(index: int):
+            run_state, run_executor, _ = active_runs[index]
+            run_config = run_state.config
+            try:
+                if run_config and run_config.cancellation_token:
+                    run_config.cancellation_token.raise_if_canceled()
+                if run_state.is_active:
+                    run_executor.run_nodes(
+                        ready_nodes=self._get_nodes_ready_to_run(run_state=run_state),
+                        config=run_config,
+                        **run_state.node_kwargs,
+                    )
+                    self._run_speculative_nodes(run_state, run_executor)
+                if not run_executor.node_by_task:
+                    if run_state.is_active:
+                        raise ValueError("No nodes are able to run.")
+                    finish(index, self._finish_run(run_state, config))
+            except Exception as e:
+                finish(index, self._fail_run(run_state, e, config))
+
+        try:
+            while True:
+                while len(active_runs) < max_concurrency and (item := next(inputs_iter, None)) is not None:
+                    index, input_data = item
+                    run_kwargs = kwargs | (on_run_start(input_data) if on_run_start else {})
+                    run_executor = AsyncExecutor(max_workers=max_workers)
+                    run_state = self._start_run(
+                        input_data, config, checkpoint_id=self._get_batch_checkpoint_id(config, index), **run_kwargs
+                    )
+                    self._attach_run_executor(run_state, run_executor)
+                    active_runs[index] = (run_state, run_executor, run_kwargs)
+                    schedule(index)
+
+                if not active_runs:
+                    break
+
+                completed_node_tasks, _ = await asyncio.wait(
+                    [t for _, run_executor, _ in active_runs.values() for t in run_executor.node_by_task],
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for index, (run_state, run_executor, _) in list(active_runs.items()):
+                    if run_completed := completed_node_tasks.intersection(run_executor.node_by_task):
+                        self._update_run_state(
+                            run_state, run_executor.complete_nodes(completed_node_tasks=run_completed)
+                        )
+                        schedule(index)
+        finally:
+            for _, run_executor, _ in active_runs.values():
+                run_executor.shutdown(wait=False)
+
+        return [results[index] for index in sorted(results)]
 
     def get_dependant_nodes(
         self, nodes_types_to_skip: set[str] | None = None
@@ -313,6 +1440,9 @@ class Flow(BaseFlow):
             self._node_by_id[node.id] = node
             if node.is_postponed_component_init:
                 node.init_components(self.connection_manager)
+        self._stream_consumers = self._get_stream_consumers_by_node_id(self.nodes)
+        self._speculative_dependencies = self._get_speculative_dependencies_by_node_id(self.nodes)
+        self._graph = None
         self.reset_run_state()
 
         return self  # enable chaining
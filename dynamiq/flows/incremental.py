@@ -0,0 +1,146 @@
+import hashlib
+import json
+from datetime import date, datetime
+from enum import Enum
+from io import BytesIO
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from dynamiq.nodes.node import Node, NodeReadyToRun
+from dynamiq.runnables import RunnableResult, RunnableStatus
+from dynamiq.utils.logger import logger
+
+
+def _encode_fingerprint_value(value: Any) -> Any:
+    """
+    Encodes values that are not JSON serializable for fingerprinting.
+
+    File contents are hashed instead of being identified by name, so edited files invalidate the fingerprint.
+    Values without a stable representation are rejected, as their string form may collide or change every run.
+
+    Args:
+        value (Any): Value to encode.
+
+    Returns:
+        Any: JSON serializable representation of the value.
+
+    Raises:
+        TypeError: If the value can not be fingerprinted.
+    """
+    if isinstance(value, BytesIO):
+        return hashlib.sha256(value.getvalue()).hexdigest()
+    if isinstance(value, bytes):
+        return hashlib.sha256(value).hexdigest()
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Value of type {type(value).__name__} can not be fingerprinted.")
+
+
+class IncrementalResults:
+    """
+    Keeps node results of previous flow runs by fingerprint of the node input, so unchanged nodes are not re-executed.
+
+    Fingerprint covers the node definition, the node input resolved from the flow input data and outputs of
+    upstream nodes, and statuses of upstream nodes. A node is executed again when any of them changes, so
+    changes of inputs the node does not select do not invalidate it. Only successful results are reused.
+
+    The definition part is recomputed only after a node field is assigned, like `Node.to_dict_snapshot`.
+    """
+
+    def __init__(self):
+        self._results: dict[str, tuple[str, RunnableResult]] = {}
+        self._definition_hashes: dict[str, tuple[dict, str]] = {}
+
+    def get_definition_hash(self, node: Node) -> str:
+        """
+        Gets hash of the node definition, reusing it while the node snapshot is unchanged.
+
+        Args:
+            node (Node): Node instance.
+
+        Returns:
+            str: Hash of the node definition.
+        """
+        snapshot = node.to_dict_snapshot()
+        if (cached := self._definition_hashes.get(node.id)) and cached[0] is snapshot:
+            return cached[1]
+
+        # upstream changes are covered by the resolved input, so upstream definitions do not invalidate the node
+        definition = snapshot | {"depends": [{"node": dep.node.id, "option": dep.option} for dep in node.depends]}
+        definition_hash = hashlib.sha256(
+            json.dumps(definition, sort_keys=True, default=_encode_fingerprint_value).encode()
+        ).hexdigest()
+        self._definition_hashes[node.id] = (snapshot, definition_hash)
+        return definition_hash
+
+    def get_fingerprint(self, ready_node: NodeReadyToRun) -> str | None:
+        """
+        Computes fingerprint of the node input.
+
+        The transformed input is kept on the ready node, so input transformers are not run again when the node runs.
+
+        Args:
+            ready_node (NodeReadyToRun): Node ready to run with its input data and dependencies results.
+
+        Returns:
+            str | None: Fingerprint of the node input or None if the input can not be fingerprinted.
+        """
+        node = ready_node.node
+        try:
+            ready_node.transformed_input = node.transform_input(
+                input_data=ready_node.input_data, depends_result=ready_node.depends_result
+            )
+            data = {
+                "node": self.get_definition_hash(node),
+                "input": ready_node.transformed_input,
+                "depends": {node_id: result.status for node_id, result in ready_node.depends_result.items()},
+            }
+            data = json.dumps(data, sort_keys=True, default=_encode_fingerprint_value)
+        except Exception as e:
+            logger.debug(f"Node {node.name} - {node.id}: input not fingerprinted, node is executed. Error: {e}")
+            return None
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def get(self, node_id: str, fingerprint: str) -> RunnableResult | None:
+        """
+        Gets result of the previous node run with the same fingerprint.
+
+        Args:
+            node_id (str): Identifier of the node.
+            fingerprint (str): Fingerprint of the node input.
+
+        Returns:
+            RunnableResult | None: Previous result or None if the node input changed.
+        """
+        if (previous := self._results.get(node_id)) and previous[0] == fingerprint:
+            return previous[1]
+        return None
+
+    def update(self, node_id: str, fingerprint: str, result: RunnableResult):
+        """
+        Stores result of the node run.
+
+        Args:
+            node_id (str): Identifier of the node.
+            fingerprint (str): Fingerprint of the node input.
+            result (RunnableResult): Result of the node run.
+        """
+        if result.status == RunnableStatus.SUCCESS:
+            self._results[node_id] = (fingerprint, result)
+        else:
+            self._results.pop(node_id, None)
+
+    def clear(self):
+        """Forgets all stored results, so the next run executes every node."""
+        self._results.clear()
+        self._definition_hashes.clear()
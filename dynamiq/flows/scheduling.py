@@ -0,0 +1,174 @@
+from dynamiq.nodes.node import Node
+
+DEFAULT_NODE_COST = 1.0
+
+
+class NodeCostEstimator:
+    """
+    Estimates node execution cost used to prioritize nodes on the critical path.
+
+    Static `Node.cost_hint` wins; otherwise the exponential moving average of durations observed in previous
+    runs is used, falling back to `default_cost` for nodes that never ran.
+
+    Args:
+        smoothing (float, optional): Weight of the latest observed duration. Defaults to 0.3.
+        default_cost (float, optional): Cost of nodes without hint and history. Defaults to DEFAULT_NODE_COST.
+    """
+
+    def __init__(self, smoothing: float = 0.3, default_cost: float = DEFAULT_NODE_COST):
+        self.smoothing = smoothing
+        self.default_cost = default_cost
+        self._durations: dict[str, float] = {}
+
+    def update(self, durations: dict[str, float]):
+        """
+        Updates learned costs with observed node durations.
+
+        Args:
+            durations (dict[str, float]): Observed durations in seconds by node id.
+        """
+        # concurrent runs may race on the same node, losing one sample is fine for an estimate
+        for node_id, duration in durations.items():
+            if (learned := self._durations.get(node_id)) is None:
+                self._durations[node_id] = duration
+            else:
+                self._durations[node_id] = learned + self.smoothing * (duration - learned)
+
+    def get_cost(self, node: Node) -> float:
+        """
+        Gets estimated cost of the node.
+
+        Args:
+            node (Node): Node to estimate.
+
+        Returns:
+            float: Estimated cost in seconds.
+        """
+        if node.cost_hint is not None:
+            return node.cost_hint
+        return self._durations.get(node.id, self.default_cost)
+
+    def get_priorities(self, nodes: list[Node], successors: dict[str, list[str]] | None = None) -> dict[str, float]:
+        """
+        Computes upward rank of each node: its cost plus the costliest path to any sink of the graph.
+
+        Nodes with higher rank lie on the critical path and should be started first.
+
+        Args:
+            nodes (list[Node]): Nodes of the acyclic flow graph.
+            successors (dict[str, list[str]] | None, optional): Precomputed ids of dependant nodes by node id.
+                Defaults to None, which derives them from node dependencies.
+
+        Returns:
+            dict[str, float]: Priority by node id.
+        """
+        if successors is None:
+            successors = FlowGraph(nodes).successors
+
+        costs = {node.id: self.get_cost(node) for node in nodes}
+        priorities: dict[str, float] = {}
+
+        for root_id in successors:
+            stack = [(root_id, False)]
+            while stack:
+                node_id, expanded = stack.pop()
+                if node_id in priorities:
+                    continue
+                if expanded:
+                    priorities[node_id] = costs[node_id] + max(
+                        (priorities[successor_id] for successor_id in successors[node_id]), default=0
+                    )
+                    continue
+                stack.append((node_id, True))
+                stack.extend(
+                    (successor_id, False) for successor_id in successors[node_id] if successor_id not in priorities
+                )
+
+        return priorities
+
+
+class FlowGraph:
+    """
+    Dependency graph of flow nodes, built once per flow and shared by all its runs.
+
+    Args:
+        nodes (list[Node]): Nodes of the acyclic flow graph.
+
+    Attributes:
+        successors (dict[str, list[str]]): Ids of dependant nodes by node id.
+        predecessors (dict[str, list[str]]): Ids of dependencies by node id.
+        predecessor_counts (dict[str, int]): Number of dependencies by node id.
+    """
+
+    def __init__(self, nodes: list[Node]):
+        self.successors: dict[str, list[str]] = {node.id: [] for node in nodes}
+        self.predecessors: dict[str, list[str]] = {}
+        self.predecessor_counts: dict[str, int] = {}
+        for node in nodes:
+            self.predecessors[node.id] = [dep.node.id for dep in node.depends]
+            self.predecessor_counts[node.id] = len(node.depends)
+            for dep in node.depends:
+                self.successors[dep.node.id].append(node.id)
+
+    def get_sorter(self) -> "NodeSorter":
+        """
+        Creates sorter tracking progress of a new flow run over the graph.
+
+        Returns:
+            NodeSorter: Sorter with root nodes ready.
+        """
+        return NodeSorter(self)
+
+
+class NodeSorter:
+    """
+    Tracks progress of a single flow run over the flow graph.
+
+    Lightweight equivalent of a prepared `graphlib.TopologicalSorter` that starts from the compiled graph
+    instead of adding nodes and checking them for cycles on every run.
+
+    Args:
+        graph (FlowGraph): Compiled graph of the flow.
+    """
+
+    def __init__(self, graph: FlowGraph):
+        self._successors = graph.successors
+        self._predecessor_counts = dict(graph.predecessor_counts)
+        self._ready = [node_id for node_id, count in self._predecessor_counts.items() if not count]
+        self._in_progress: set[str] = set()
+
+    def get_ready(self) -> tuple[str, ...]:
+        """
+        Returns nodes whose dependencies are all done and that were not returned before.
+
+        Returns:
+            tuple[str, ...]: Ids of ready nodes.
+        """
+        ready = tuple(self._ready)
+        self._in_progress.update(ready)
+        self._ready.clear()
+        return ready
+
+    def done(self, *node_ids: str):
+        """
+        Marks nodes returned by `get_ready` as done, unblocking their dependants.
+
+        Args:
+            *node_ids (str): Ids of completed nodes.
+
+        Raises:
+            ValueError: If a node was not returned by `get_ready` or is already done.
+        """
+        for node_id in node_ids:
+            if node_id not in self._in_progress:
+                raise ValueError(f"Node {node_id!r} was not passed out (still not ready) or is already done.")
+
+            self._in_progress.remove(node_id)
+            for successor_id in self._successors[node_id]:
+                self._predecessor_counts[successor_id] -= 1
+                if not self._predecessor_counts[successor_id]:
+                    self._ready.append(successor_id)
+
+    def is_active(self) -> bool:
+        """Whether nodes are ready or in progress, so the run can make progress."""
+        return bool(self._ready or self._in_progress)
@@ -488,12 +488,14 @@ class WorkflowYAMLLoader:
                     if isinstance(prompt_data, str)
                     else cls.init_prompt(prompt_data)
                 )
+            # flows are set after the init data is copied, as their nodes can not be deep copied
+            node_flows = {}
             if "flow" in node_init_data:
-                node_init_data["flow"] = cls.get_node_flow(
+                node_flows["flow"] = cls.get_node_flow(
                     node_id=node_id, node_data=node_data, flows=flows
                 )
             if "flows" in node_init_data:
-                node_init_data["flows"] = cls.get_node_flows(
+                node_flows["flows"] = cls.get_node_flows(
                     node_id=node_id, node_data=node_data, flows=flows
                 )
             try:
@@ -507,7 +509,7 @@ class WorkflowYAMLLoader:
                     connection_manager=connection_manager,
                     init_components=init_components,
                 )
-                node = node_cls(**node_init_data)
+                node = node_cls(**(node_init_data | node_flows))
                 if init_components:
                     node.init_components(connection_manager=connection_manager)
                     node.is_postponed_component_init = False
@@ -168,7 +168,7 @@ class Agent(Node):
         logger.debug(f"Agent {self.name} - {self.id}: started with input {input_data}")
         self.reset_run_state()
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         user_id = input_data.get("user_id", None)
         session_id = input_data.get("session_id", None)
@@ -473,7 +473,7 @@ class AgentManager(Agent):
         """Executes the manager agent with the given input data and action."""
         self.reset_run_state()
         config = config or RunnableConfig()
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
         logger.info(
             f"AgentManager {self.name} - {self.id}: started with input {input_data}"
         )
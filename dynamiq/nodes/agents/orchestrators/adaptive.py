@@ -314,7 +314,7 @@ class AdaptiveOrchestrator(Node):
         """
         self.reset_run_state()
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         objective = input_data.get("input") or self.objective
         logger.debug(
@@ -328,7 +328,7 @@ class LinearOrchestrator(Node):
         """
         self.reset_run_state()
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         self.input_task = input_data.get("input") or self.input_task
 
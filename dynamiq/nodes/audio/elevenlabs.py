@@ -116,7 +116,7 @@ class ElevenLabsTTS(ConnectionNode):
             },
         }
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
         response = self.client.request(
             method=self.connection.method,
             url=format_url("text-to-speech/", self.connection.url, self.voice_id),
@@ -202,7 +202,7 @@ class ElevenLabsSTS(ConnectionNode):
         }
         audio = input_data["audio"]
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
         response = self.client.request(
             method=self.connection.method,
             url=format_url("speech-to-speech/", self.connection.url, self.voice_id),
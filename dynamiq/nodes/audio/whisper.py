@@ -62,7 +62,7 @@ class WhisperSTT(ConnectionNode):
             str: A string containing the transcribe result.
         """
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         audio = input_data["audio"]
         if isinstance(audio, bytes):
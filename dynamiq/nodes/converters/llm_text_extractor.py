@@ -1,5 +1,4 @@
 import base64
-import concurrent.futures
 import copy
 import enum
 from io import BytesIO
@@ -14,6 +13,7 @@ if TYPE_CHECKING:
     from PIL import Image
 
 from dynamiq.connections.managers import ConnectionManager
+from dynamiq.executors.shared import SharedThreadPool, get_shared_thread_pool
 from dynamiq.nodes.node import Node, NodeDependency, NodeGroup, ensure_config
 from dynamiq.prompts import (
     Prompt,
@@ -174,7 +174,7 @@ class LLMImageConverter(Node):
         """
         config = ensure_config(config)
         self.reset_run_state()
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         documents = self.extract_text_from_images(
             file_paths=input_data.get("file_paths"),
@@ -331,15 +331,12 @@ class LLMImageConverter(Node):
 
         prompt = self.vision_prompt
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            llm_results = list(
-                executor.map(
-                    lambda input_data: self.call_llm(
-                        input_data, prompt, config, **run_kwargs
-                    ),
-                    inputs,
-                )
+        llm_results = list(
+            get_shared_thread_pool(SharedThreadPool.TASKS).map(
+                lambda input_data: self.call_llm(input_data, prompt, config, **run_kwargs),
+                inputs,
             )
+        )
 
         logger.debug(
             f"Node {self.name} - {self.id}: LLM processed {len(llm_results)} images"
@@ -526,7 +523,7 @@ class LLMPDFConverter(LLMImageConverter):
         """
         config = ensure_config(config)
         self.reset_run_state()
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         documents = self.extract_text_from_pdfs(
             file_paths=input_data.get("file_paths"),
@@ -1,4 +1,4 @@
-from typing import Any, Literal
+from typing import Any, Iterator, Literal
 
 from dynamiq.components.converters.pypdf import DocumentCreationMode, ExtractionMode
 from dynamiq.components.converters.pypdf import PyPDFFileConverter as PyPDFFileConverterComponent
@@ -73,7 +73,7 @@ class PyPDFConverter(Node):
             }
         """
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         file_paths = input_data.get("file_paths")
         files = input_data.get("files")
@@ -90,3 +90,20 @@ class PyPDFConverter(Node):
         )
 
         return {"documents": documents}
+
+    def split_stream_input(self, input_data: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """
+        Split the input into single files, so Documents of each file are passed downstream once it is converted.
+
+        Args:
+            input_data: Dict containing 'file_paths', 'files', and/or 'metadata' keys.
+
+        Yields:
+            Dict with the same keys describing one file.
+        """
+        for file_input in self.file_converter.split_inputs(
+            file_paths=input_data.get("file_paths"),
+            files=input_data.get("files"),
+            metadata=input_data.get("metadata"),
+        ):
+            yield input_data | file_input
@@ -88,13 +88,34 @@ class CohereDocumentEmbedder(ConnectionNode):
             The output from the document_embedder component, typically the computed embeddings.
         """
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         output = self.document_embedder.embed_documents(input_data["documents"])
         logger.debug("CohereDocumentEmbedder executed successfully.")
 
         return output
 
+    async def aexecute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        """
+        Asynchronously executes the document embedding process using the native async embedding client.
+
+        Args:
+            input_data (dict[str, Any]): A dictionary containing the input data. Expected to have a
+                'documents' key with the documents to embed.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            The output from the document_embedder component, typically the computed embeddings.
+        """
+        config = ensure_config(config)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
+
+        output = await self.document_embedder.aembed_documents(input_data["documents"])
+        logger.debug("CohereDocumentEmbedder executed successfully.")
+
+        return output
+
 
 class CohereTextEmbedder(ConnectionNode):
     """
@@ -175,7 +196,7 @@ class CohereTextEmbedder(ConnectionNode):
             dict: A dictionary containing the embedding and the original query.
         """
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         output = self.text_embedder.embed_text(input_data["query"])
         logger.debug(f"CohereTextEmbedder: {output['meta']}")
@@ -183,3 +204,25 @@ class CohereTextEmbedder(ConnectionNode):
             "embedding": output["embedding"],
             "query": input_data["query"],
         }
+
+    async def aexecute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs):
+        """
+        Asynchronously execute the text embedding process using the native async embedding client.
+
+        Args:
+            input_data (dict[str, Any]): The input data containing the query to embed.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            dict: A dictionary containing the embedding and the original query.
+        """
+        config = ensure_config(config)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
+
+        output = await self.text_embedder.aembed_text(input_data["query"])
+        logger.debug(f"CohereTextEmbedder: {output['meta']}")
+        return {
+            "embedding": output["embedding"],
+            "query": input_data["query"],
+        }
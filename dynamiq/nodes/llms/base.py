@@ -79,6 +79,7 @@ class BaseLLM(ConnectionNode):
     )
 
     _completion: Callable = PrivateAttr()
+    _acompletion: Callable = PrivateAttr()
     _stream_chunk_builder: Callable = PrivateAttr()
 
     @field_validator("model")
@@ -105,10 +106,11 @@ class BaseLLM(ConnectionNode):
         super().__init__(**kwargs)
 
         # Save a bit of loading time as litellm is slow
-        from litellm import completion, stream_chunk_builder
+        from litellm import acompletion, completion, stream_chunk_builder
 
         # Avoid the same imports multiple times and for future usage in execute
         self._completion = completion
+        self._acompletion = acompletion
         self._stream_chunk_builder = stream_chunk_builder
 
     @classmethod
@@ -173,7 +175,7 @@ class BaseLLM(ConnectionNode):
             tool_calls = [tc.model_dump() for tc in tool_calls]
 
         usage_data = self.get_usage_data(model=self.model, completion=response).model_dump()
-        self.run_on_node_execute_run(callbacks=config.callbacks, usage_data=usage_data, **kwargs)
+        self.run_on_node_execute_run(callbacks=self.get_callbacks(config), usage_data=usage_data, **kwargs)
 
         return {"content": content, "tool_calls": tool_calls}
 
@@ -197,6 +199,41 @@ class BaseLLM(ConnectionNode):
         """
         chunks = []
         for chunk in response:
+            if config.cancellation_token:
+                config.cancellation_token.raise_if_canceled()
+            chunks.append(chunk)
+
+            self.run_on_node_execute_stream(
+                config.callbacks,
+                chunk.model_dump(),
+                **kwargs,
+            )
+
+        full_response = self._stream_chunk_builder(chunks=chunks, messages=messages)
+        return self._handle_completion_response(response=full_response, config=config, **kwargs)
+
+    async def _ahandle_streaming_completion_response(
+        self,
+        response: "CustomStreamWrapper",
+        messages: list[dict],
+        config: RunnableConfig = None,
+        **kwargs,
+    ):
+        """Handle async streaming completion response.
+
+        Args:
+            response (CustomStreamWrapper): The async streaming response from the LLM.
+            messages (list[dict]): The messages used for the LLM.
+            config (RunnableConfig, optional): The configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            dict: A dictionary containing the generated content and tool calls.
+        """
+        chunks = []
+        async for chunk in response:
+            if config.cancellation_token:
+                config.cancellation_token.raise_if_canceled()
             chunks.append(chunk)
 
             self.run_on_node_execute_stream(
@@ -238,38 +275,34 @@ class BaseLLM(ConnectionNode):
 
         return response_format, tools
 
-    def execute(
+    def get_completion_params(
         self,
         input_data: dict[str, Any],
-        config: RunnableConfig = None,
+        config: RunnableConfig,
         prompt: Prompt | None = None,
         schema: dict | None = None,
         inference_mode: InferenceMode | None = None,
         **kwargs,
-    ):
-        """Execute the LLM node.
+    ) -> tuple[list[dict], dict[str, Any]]:
+        """Format the prompt and build LLM completion parameters.
 
-        This method processes the input data, formats the prompt, and generates a response using
-        the configured LLM.
+        The request timeout is capped by the deadline of the cancellation token, if any.
 
         Args:
             input_data (dict[str, Any]): The input data for the LLM.
-            config (RunnableConfig, optional): The configuration for the execution. Defaults to None.
+            config (RunnableConfig): The configuration for the execution.
             prompt (Prompt, optional): The prompt to use for this execution. Defaults to None.
             schema (Dict[str, Any], optional): schema_ for structured output or function calling.
-                Overrides instance schema_ if provided.
             inference_mode (InferenceMode, optional): Mode of inference.
-                Overrides instance inference_mode if provided.
             **kwargs: Additional keyword arguments.
 
         Returns:
-            dict: A dictionary containing the generated content and tool calls.
+            tuple[list[dict], dict[str, Any]]: Formatted messages and completion parameters.
         """
-        config = ensure_config(config)
         prompt = prompt or self.prompt or Prompt(messages=[], tools=None)
         messages = prompt.format_messages(**input_data)
         base_tools = prompt.format_tools(**input_data)
-        self.run_on_node_execute_run(callbacks=config.callbacks, prompt_messages=messages, **kwargs)
+        self.run_on_node_execute_run(callbacks=self.get_callbacks(config), prompt_messages=messages, **kwargs)
 
         # Use initialized client if it possible
         params = self.connection.conn_params
@@ -283,7 +316,7 @@ class BaseLLM(ConnectionNode):
         )
         tools = tools or base_tools
 
-        response = self._completion(
+        completion_params = dict(
             model=self.model,
             messages=messages,
             stream=self.streaming.enabled,
@@ -300,9 +333,87 @@ class BaseLLM(ConnectionNode):
             drop_params=True,
             **params,
         )
+        # cap the request timeout by the deadline, so timed out calls do not hold the worker thread
+        if config and config.cancellation_token and (remaining := config.cancellation_token.remaining) is not None:
+            timeout = completion_params.get("timeout")
+            completion_params["timeout"] = remaining if timeout is None else min(timeout, remaining)
+
+        return messages, completion_params
+
+    def execute(
+        self,
+        input_data: dict[str, Any],
+        config: RunnableConfig = None,
+        prompt: Prompt | None = None,
+        schema: dict | None = None,
+        inference_mode: InferenceMode | None = None,
+        **kwargs,
+    ):
+        """Execute the LLM node.
+
+        This method processes the input data, formats the prompt, and generates a response using
+        the configured LLM.
+
+        Args:
+            input_data (dict[str, Any]): The input data for the LLM.
+            config (RunnableConfig, optional): The configuration for the execution. Defaults to None.
+            prompt (Prompt, optional): The prompt to use for this execution. Defaults to None.
+            schema (Dict[str, Any], optional): schema_ for structured output or function calling.
+                Overrides instance schema_ if provided.
+            inference_mode (InferenceMode, optional): Mode of inference.
+                Overrides instance inference_mode if provided.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            dict: A dictionary containing the generated content and tool calls.
+        """
+        config = ensure_config(config)
+        messages, params = self.get_completion_params(
+            input_data, config, prompt=prompt, schema=schema, inference_mode=inference_mode, **kwargs
+        )
+        response = self._completion(**params)
 
         handle_completion = (
             self._handle_streaming_completion_response if self.streaming.enabled else self._handle_completion_response
         )
 
         return handle_completion(response=response, messages=messages, config=config, input_data=input_data, **kwargs)
+
+    async def aexecute(
+        self,
+        input_data: dict[str, Any],
+        config: RunnableConfig = None,
+        prompt: Prompt | None = None,
+        schema: dict | None = None,
+        inference_mode: InferenceMode | None = None,
+        **kwargs,
+    ):
+        """Asynchronously execute the LLM node using the native async completion client.
+
+        Args:
+            input_data (dict[str, Any]): The input data for the LLM.
+            config (RunnableConfig, optional): The configuration for the execution. Defaults to None.
+            prompt (Prompt, optional): The prompt to use for this execution. Defaults to None.
+            schema (Dict[str, Any], optional): schema_ for structured output or function calling.
+                Overrides instance schema_ if provided.
+            inference_mode (InferenceMode, optional): Mode of inference.
+                Overrides instance inference_mode if provided.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            dict: A dictionary containing the generated content and tool calls.
+        """
+        config = ensure_config(config)
+        messages, params = self.get_completion_params(
+            input_data, config, prompt=prompt, schema=schema, inference_mode=inference_mode, **kwargs
+        )
+        response = await self._acompletion(**params)
+
+        if self.streaming.enabled:
+            return await self._ahandle_streaming_completion_response(
+                response=response, messages=messages, config=config, input_data=input_data, **kwargs
+            )
+
+        return self._handle_completion_response(
+            response=response, messages=messages, config=config, input_data=input_data, **kwargs
+        )
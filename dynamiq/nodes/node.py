@@ -1,11 +1,16 @@
+import asyncio
+import hashlib
 import inspect
+import json
+import threading
 import time
+import weakref
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from concurrent.futures import TimeoutError
 from datetime import datetime
 from functools import cached_property
 from queue import Empty
-from typing import Any, Callable, ClassVar, Union
+from typing import Any, Callable, ClassVar, Generator, Iterator, Union
 from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field, model_validator
@@ -14,6 +19,8 @@ from dynamiq.cache.utils import cache_wf_entity
 from dynamiq.callbacks import BaseCallbackHandler
 from dynamiq.connections import BaseConnection
 from dynamiq.connections.managers import ConnectionManager
+from dynamiq.executors.shared import SharedThreadPool, get_nesting_level, get_shared_thread_pool
+from dynamiq.executors.streaming import DEFAULT_STREAM_BUFFER_SIZE, NodeOutputStream
 from dynamiq.nodes.exceptions import (
     NodeConditionFailedException,
     NodeConditionSkippedException,
@@ -21,15 +28,17 @@ from dynamiq.nodes.exceptions import (
     NodeFailedException,
     NodeSkippedException,
 )
-from dynamiq.nodes.types import NodeGroup
+from dynamiq.nodes.types import ExecutorAffinity, NodeGroup
 from dynamiq.runnables import Runnable, RunnableConfig, RunnableResult, RunnableStatus
 from dynamiq.storages.vector.base import BaseVectorStoreParams
+from dynamiq.types.cancellation import CancellationToken
 from dynamiq.types.streaming import STREAMING_EVENT, StreamingConfig, StreamingEventMessage
 from dynamiq.utils import format_value, generate_uuid, merge
 from dynamiq.utils.duration import format_duration
 from dynamiq.utils.jsonpath import filter as jsonpath_filter
 from dynamiq.utils.jsonpath import mapper as jsonpath_mapper
 from dynamiq.utils.logger import logger
+from dynamiq.utils.profiling import PhaseTimer
 
 
 def ensure_config(config: RunnableConfig = None) -> RunnableConfig:
@@ -105,14 +114,43 @@ class NodeReadyToRun(BaseModel):
         is_ready (bool): Whether the node is ready to run.
         input_data (Any): Input data for the node.
         depends_result (dict[str, Any]): Results of dependent nodes.
+        priority (float): Scheduling priority, nodes with higher priority are started first.
+        stream_consumers (list[NodeReadyToRun]): Downstream nodes consuming output chunks of the node
+            while it is running.
+        stream_buffer_size (int): Maximum number of output chunks buffered for each streaming consumer.
+        config (RunnableConfig | None): Configuration of the node run overriding the flow run one.
+        config_factory (Callable[[], RunnableConfig | None] | None): Creates the configuration of the node run
+            when the node starts, e.g. with the node share of the time left in the latency budget.
+        transformed_input (dict | None): Node input already transformed by the flow, e.g. to fingerprint it,
+            so it is not transformed again when the node runs. None transforms it when the node runs.
     """
     node: "Node"
     is_ready: bool
     input_data: Any = None
     depends_result: dict[str, Any] = {}
+    priority: float = 0
+    stream_consumers: list["NodeReadyToRun"] = []
+    stream_buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE
+    config: RunnableConfig | None = None
+    config_factory: Callable[[], RunnableConfig | None] | None = None
+    transformed_input: dict | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    def get_config(self, config: RunnableConfig | None = None) -> RunnableConfig | None:
+        """
+        Gets configuration of the node run. Executors call it when the node starts, not when it is queued.
+
+        Args:
+            config (RunnableConfig | None, optional): Configuration of the flow run. Defaults to None.
+
+        Returns:
+            RunnableConfig | None: Own configuration of the node run, if any, otherwise the flow run one.
+        """
+        if self.config is None and self.config_factory is not None:
+            self.config = self.config_factory()
+        return self.config or config
+
 
 class NodeDependency(BaseModel):
     """
@@ -121,12 +159,15 @@ class NodeDependency(BaseModel):
     Attributes:
         node (Node): The dependent node.
         option (str | None): Optional condition for the dependency.
+        stream (bool): Whether to consume output chunks of the dependency while it is still running.
+            The dependant node must support stream input, see `Node.split_stream_input`.
     """
     node: "Node"
     option: str | None = None
+    stream: bool = False
 
-    def __init__(self, node: "Node", option: str | None = None):
-        super().__init__(node=node, option=option)
+    def __init__(self, node: "Node", option: str | None = None, stream: bool = False):
+        super().__init__(node=node, option=option, stream=stream)
 
     def to_dict(self, **kwargs) -> dict:
         """Converts the instance to a dictionary.
@@ -135,11 +176,25 @@ class NodeDependency(BaseModel):
             dict: A dictionary representation of the instance.
         """
         return {
-            "node": self.node.to_dict(**kwargs),
+            "node": self.node.to_dict(**kwargs) if kwargs else self.node.to_dict_snapshot(),
             "option": self.option,
+            "stream": self.stream,
         }
 
 
+class NodeDependants(weakref.WeakValueDictionary):
+    """Nodes depending on the node by id. Dependants are registered per process, so copies are empty."""
+
+    def __copy__(self) -> "NodeDependants":
+        return NodeDependants()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "NodeDependants":
+        return NodeDependants()
+
+    def __reduce__(self) -> tuple:
+        return NodeDependants, ()
+
+
 class NodeMetadata(BaseModel):
     """
     Metadata for a node.
@@ -196,6 +251,10 @@ class Node(BaseModel, Runnable, ABC):
         is_postponed_component_init (bool): Whether component initialization is postponed.
         is_optimized_for_agents (bool): Whether to optimize output for agents. By default is set to False.
         supports_files (bool): Whether the node has access to files. By default is set to False.
+        cost_hint (float | None): Estimated execution time in seconds used to prioritize nodes on the critical
+            path. Learned from previous runs if not set.
+        executor_affinity (ExecutorAffinity | None): Pool the HybridExecutor routes the node to.
+            Defaults to None, which uses the thread pool.
     """
     id: str = Field(default_factory=generate_uuid)
     name: str | None = None
@@ -213,11 +272,17 @@ class Node(BaseModel, Runnable, ABC):
     is_postponed_component_init: bool = False
     is_optimized_for_agents: bool = False
     is_files_allowed: bool = False
+    cost_hint: float | None = None
+    executor_affinity: ExecutorAffinity | None = None
 
     _output_references: NodeOutputReferences = PrivateAttr()
+    _serialized: dict | None = PrivateAttr(default=None)
+    _definition_hash: str | None = PrivateAttr(default=None)
+    _dependants: NodeDependants = PrivateAttr(default_factory=NodeDependants)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
     input_schema: ClassVar[type[BaseModel] | None] = None
+    supports_stream_input: ClassVar[bool] = False
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -225,6 +290,42 @@ class Node(BaseModel, Runnable, ABC):
             self.init_components()
 
         self._output_references = NodeOutputReferences(node=self)
+        self._register_dependant()
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in self.model_fields:
+            self._reset_serialized()
+            if name == "depends":
+                self._register_dependant()
+
+    def __copy__(self):
+        node = super().__copy__()
+        node._serialized = None
+        node._definition_hash = None
+        node._dependants = NodeDependants()
+        node._register_dependant()
+        return node
+
+    def __setstate__(self, state: dict[Any, Any]):
+        super().__setstate__(state)
+        self._register_dependant()
+
+    def _register_dependant(self):
+        """Registers the node in its dependencies, so their changes reset its snapshot and definition hash."""
+        for depend in self.depends:
+            depend.node._dependants[id(self)] = self
+
+    def _reset_serialized(self):
+        """Resets the snapshot and the definition hash of the node and of nodes depending on it, which embed them."""
+        nodes, visited = [self], set()
+        while nodes:
+            if id(node := nodes.pop()) in visited:
+                continue
+            visited.add(id(node))
+            node._serialized = None
+            node._definition_hash = None
+            nodes.extend(node._dependants.values())
 
     @computed_field
     @cached_property
@@ -457,11 +558,41 @@ class Node(BaseModel, Runnable, ABC):
         data["input_mapping"] = format_value(self.input_mapping)
         return data
 
+    def to_dict_snapshot(self) -> dict:
+        """Gets serialized node shared by all callbacks of all runs, created on first use.
+
+        The snapshot is recreated after a field of the node or of one of its dependencies is assigned. It must
+        not be modified, and in-place changes of field values (e.g. appending to a list) are not tracked.
+
+        Returns:
+            dict: A dictionary representation of the node.
+        """
+        if (serialized := self._serialized) is None:
+            serialized = self._serialized = self.to_dict()
+        return serialized
+
+    def get_definition_hash(self) -> str:
+        """Gets hash of the node definition, computed on first use.
+
+        Unlike the snapshot, the definition includes connection secrets, so rotated credentials produce
+        a new hash. Like the snapshot, the hash is recomputed only after a field of the node or of one of its
+        dependencies is assigned.
+
+        Returns:
+            str: SHA-256 hex digest of the node definition.
+        """
+        if (definition_hash := self._definition_hash) is None:
+            exclude = {key: value for key, value in self.to_dict_exclude_params.items() if key != "connection"}
+            definition = json.dumps(self.to_dict(exclude=exclude), sort_keys=True, default=str)
+            definition_hash = self._definition_hash = hashlib.sha256(definition.encode()).hexdigest()
+        return definition_hash
+
     def run(
         self,
         input_data: Any,
         config: RunnableConfig = None,
         depends_result: dict = None,
+        transformed_input: dict | None = None,
         **kwargs,
     ) -> RunnableResult:
         """
@@ -471,83 +602,376 @@ class Node(BaseModel, Runnable, ABC):
             input_data (Any): Input data for the node.
             config (RunnableConfig, optional): Configuration for the run. Defaults to None.
             depends_result (dict, optional): Results of dependent nodes. Defaults to None.
+            transformed_input (dict | None, optional): Input already transformed from input data and results
+                of dependent nodes. Defaults to None, which transforms it.
             **kwargs: Additional keyword arguments.
 
         Returns:
             RunnableResult: Result of the node execution.
         """
-        from dynamiq.nodes.agents.exceptions import RecoverableAgentException
+        steps = self._run_steps(
+            self.execute_with_retry, input_data, config, depends_result, transformed_input, **kwargs
+        )
+        try:
+            execution = next(steps)
+            try:
+                output = execution()
+            except Exception as e:
+                steps.throw(e)
+            else:
+                steps.send(output)
+        except StopIteration as e:
+            return e.value
 
-        logger.info(f"Node {self.name} - {self.id}: execution started.")
-        time_start = datetime.now()
+    async def arun(
+        self,
+        input_data: Any,
+        config: RunnableConfig = None,
+        depends_result: dict = None,
+        transformed_input: dict | None = None,
+        **kwargs,
+    ) -> RunnableResult:
+        """
+        Asynchronously run the node with given input data and configuration.
 
+        Args:
+            input_data (Any): Input data for the node.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            depends_result (dict, optional): Results of dependent nodes. Defaults to None.
+            transformed_input (dict | None, optional): Input already transformed from input data and results
+                of dependent nodes. Defaults to None, which transforms it.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result of the node execution.
+        """
+        steps = self._run_steps(
+            self.aexecute_with_retry, input_data, config, depends_result, transformed_input, **kwargs
+        )
+        try:
+            execution = next(steps)
+            try:
+                output = await execution()
+            except Exception as e:
+                steps.throw(e)
+            else:
+                steps.send(output)
+        except StopIteration as e:
+            return e.value
+
+    def _run_steps(
+        self,
+        execute: Callable[..., Any],
+        input_data: Any,
+        config: RunnableConfig = None,
+        depends_result: dict = None,
+        transformed_input: dict | None = None,
+        **kwargs,
+    ) -> Generator[Callable[[], Any], Any, RunnableResult]:
+        """
+        Run the node around its execution, shared by `run` and `arun`.
+
+        Validates dependencies, transforms input, runs callbacks and builds the result. Yields the call executing
+        the node with retries and cache, which `run` calls and `arun` awaits, and receives its output or error.
+
+        Args:
+            execute (Callable[..., Any]): `execute_with_retry` or `aexecute_with_retry`.
+            input_data (Any): Input data for the node.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            depends_result (dict, optional): Results of dependent nodes. Defaults to None.
+            transformed_input (dict | None, optional): Input already transformed from input data and results
+                of dependent nodes. Defaults to None, which transforms it.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result of the node execution.
+        """
         config = ensure_config(config)
+        if not config.lean:
+            logger.info(f"Node {self.name} - {self.id}: execution started.")
+        time_start = datetime.now()
+
+        callbacks = self.get_callbacks(config)
         run_id = uuid4()
         merged_kwargs = merge(kwargs, {"run_id": run_id, "parent_run_id": kwargs.get("parent_run_id", run_id)})
         if depends_result is None:
             depends_result = {}
 
+        # phases are only timed for callbacks, runs without them skip all tracing-only work
+        timer = PhaseTimer(enabled=bool(callbacks))
+        timer.start("validate_depends")
         try:
             self.validate_depends(depends_result)
         except NodeException as e:
-            transformed_input = input_data | {
-                k: result.to_tracing_depend_dict() for k, result in depends_result.items()
-            }
-            skip_data = {"failed_dependency": e.failed_depend.to_dict()}
-            self.run_on_node_skip(
-                callbacks=config.callbacks,
-                skip_data=skip_data,
-                input_data=transformed_input,
-                **merged_kwargs,
-            )
-            logger.info(f"Node {self.name} - {self.id}: execution skipped.")
-            return RunnableResult(
-                status=RunnableStatus.SKIP,
-                input=transformed_input,
-                output=format_value(e),
-            )
+            timer.start("callbacks")
+            result = self.get_skip_result(e, input_data, depends_result, config, **merged_kwargs)
+            self.run_on_node_phases(callbacks, timer.stop(), **merged_kwargs)
+            return result
 
-        try:
-            transformed_input = self.transform_input(input_data=input_data, depends_result=depends_result)
+        if inspect.iscoroutinefunction(execute):
 
-            self.run_on_node_start(config.callbacks, transformed_input, **merged_kwargs)
+            async def timed_execute(*args, **kwargs):
+                timer.start("execute_with_retry")
+                output = await execute(*args, **kwargs)
+                timer.start("cache_store")
+                return output
 
-            cache = cache_wf_entity(
-                entity_id=self.id,
-                cache_enabled=self.caching.enabled,
-                cache_config=config.cache,
-            )
+        else:
 
-            output, from_cache = cache(self.execute_with_retry)(
-                transformed_input, config, **merged_kwargs
-            )
+            def timed_execute(*args, **kwargs):
+                timer.start("execute_with_retry")
+                output = execute(*args, **kwargs)
+                timer.start("cache_store")
+                return output
+
+        try:
+            timer.start("transform_input")
+            if transformed_input is None:
+                transformed_input = self.transform_input(input_data=input_data, depends_result=depends_result)
+
+            timer.start("callbacks")
+            self.run_on_node_start(callbacks, transformed_input, **merged_kwargs)
+
+            timer.start("cache_lookup")
+            if self.caching.enabled and config.cache:
+                cache = cache_wf_entity(
+                    entity_id=self.id,
+                    cache_enabled=self.caching.enabled,
+                    cache_config=config.cache,
+                )
+                output, from_cache = yield lambda: cache(timed_execute)(transformed_input, config, **merged_kwargs)
+            else:
+                output, from_cache = (yield lambda: timed_execute(transformed_input, config, **merged_kwargs)), False
 
             merged_kwargs["is_output_from_cache"] = from_cache
+            timer.start("transform_output")
             transformed_output = self.transform_output(output)
-            self.run_on_node_end(config.callbacks, transformed_output, **merged_kwargs)
+            timer.start("callbacks")
+            self.run_on_node_end(callbacks, transformed_output, **merged_kwargs)
 
-            logger.info(
-                f"Node {self.name} - {self.id}: execution succeeded in "
-                f"{format_duration(time_start, datetime.now())}."
-            )
-            return RunnableResult(
+            if not config.lean:
+                logger.info(
+                    f"Node {self.name} - {self.id}: execution succeeded in "
+                    f"{format_duration(time_start, datetime.now())}."
+                )
+            result = RunnableResult(
                 status=RunnableStatus.SUCCESS,
                 input=transformed_input,
                 output=transformed_output,
             )
         except Exception as e:
-            self.run_on_node_error(config.callbacks, e, **merged_kwargs)
-            logger.error(
-                f"Node {self.name} - {self.id}: execution failed in "
-                f"{format_duration(time_start, datetime.now())}."
+            timer.start("callbacks")
+            result = self.get_failure_result(e, input_data, time_start, config, **merged_kwargs)
+
+        self.run_on_node_phases(callbacks, timer.stop(), **merged_kwargs)
+        return result
+
+    def run_stream(
+        self,
+        input_data: Any,
+        config: RunnableConfig = None,
+        depends_result: dict = None,
+        input_stream: NodeOutputStream | None = None,
+        output_streams: list[NodeOutputStream] | None = None,
+        transformed_input: dict | None = None,
+        **kwargs,
+    ) -> RunnableResult:
+        """
+        Run the node as a stage of a streaming pipeline.
+
+        With `input_stream` the node is executed once per chunk of its streaming dependency as chunks arrive,
+        otherwise once. Each input is further split with `split_stream_input` and every part is executed with
+        retries, timeout and cache like in `run`. Every output chunk is passed to `output_streams` as soon as
+        it is produced. Result output is merged from all output chunks with `merge_stream_outputs`.
+
+        Args:
+            input_data (Any): Input data for the node.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            depends_result (dict, optional): Results of dependent nodes except the streaming one. Defaults to None.
+            input_stream (NodeOutputStream | None, optional): Output chunks of the streaming dependency.
+                Defaults to None.
+            output_streams (list[NodeOutputStream] | None, optional): Streams of downstream consumers.
+                Defaults to None.
+            transformed_input (dict | None, optional): Input already transformed from input data and results
+                of dependent nodes, used without the streaming dependency. Defaults to None, which transforms it.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result of the node execution.
+        """
+        config = ensure_config(config)
+        if not config.lean:
+            logger.info(f"Node {self.name} - {self.id}: streaming execution started.")
+        time_start = datetime.now()
+
+        callbacks = self.get_callbacks(config)
+        run_id = uuid4()
+        merged_kwargs = merge(kwargs, {"run_id": run_id, "parent_run_id": kwargs.get("parent_run_id", run_id)})
+        depends_result = depends_result or {}
+        output_streams = output_streams or []
+        stream_depend = next((dep for dep in self.depends if dep.stream), None) if input_stream else None
+
+        def execute(chunk_input: Any) -> Any:
+            if self.caching.enabled and config.cache:
+                cache = cache_wf_entity(
+                    entity_id=self.id,
+                    cache_enabled=self.caching.enabled,
+                    cache_config=config.cache,
+                )
+                output, _ = cache(self.execute_with_retry)(chunk_input, config, **merged_kwargs)
+                return output
+            return self.execute_with_retry(chunk_input, config, **merged_kwargs)
+
+        def iter_outputs(transformed_input: Any) -> Iterator[Any]:
+            is_split = False
+            for chunk_input in self.split_stream_input(transformed_input):
+                is_split = True
+                yield execute(chunk_input)
+            if not is_split:
+                yield execute(transformed_input)
+
+        pretransformed_input = transformed_input if stream_depend is None else None
+
+        def iter_depends_result():
+            if stream_depend is None:
+                yield depends_result
+                return
+            try:
+                for chunk in input_stream:
+                    yield depends_result | {
+                        stream_depend.node.id: RunnableResult(status=RunnableStatus.SUCCESS, output=chunk)
+                    }
+            except Exception as e:
+                raise NodeFailedException(
+                    failed_depend=stream_depend, message=f"Dependency {stream_depend.node.id}: failed. {e}"
+                )
+
+        inputs, outputs = [], []
+        try:
+            if stream_depend is not None:
+                self.validate_depends(
+                    depends_result | {stream_depend.node.id: RunnableResult(status=RunnableStatus.SUCCESS)}
+                )
+            else:
+                self.validate_depends(depends_result)
+
+            for chunk_depends_result in iter_depends_result():
+                if config.cancellation_token:
+                    config.cancellation_token.raise_if_canceled()
+                transformed_input = pretransformed_input
+                if transformed_input is None:
+                    transformed_input = self.transform_input(input_data=input_data, depends_result=chunk_depends_result)
+                if not inputs:
+                    self.run_on_node_start(callbacks, transformed_input, **merged_kwargs)
+                inputs.append(transformed_input)
+
+                for output in iter_outputs(transformed_input):
+                    output = self.transform_output(output)
+                    outputs.append(output)
+                    for stream in output_streams:
+                        stream.put(output)
+        except NodeException as e:
+            for stream in output_streams:
+                stream.close(e)
+            return self.get_skip_result(e, input_data, depends_result, config, **merged_kwargs)
+        except Exception as e:
+            for stream in output_streams:
+                stream.close(e)
+            return self.get_failure_result(e, input_data, time_start, config, **merged_kwargs)
+        finally:
+            if input_stream is not None:
+                input_stream.close()
+
+        for stream in output_streams:
+            stream.close()
+
+        if not inputs:
+            self.run_on_node_start(callbacks, {}, **merged_kwargs)
+        transformed_output = self.merge_stream_outputs(outputs)
+        self.run_on_node_end(callbacks, transformed_output, **merged_kwargs)
+        if not config.lean:
+            logger.info(
+                f"Node {self.name} - {self.id}: streaming execution succeeded in "
+                f"{format_duration(time_start, datetime.now())} with {len(outputs)} output chunks."
             )
+        return RunnableResult(
+            status=RunnableStatus.SUCCESS,
+            input=self.merge_stream_outputs(inputs),
+            output=transformed_output,
+        )
 
-            recoverable = isinstance(e, RecoverableAgentException)
-            return RunnableResult(
-                status=RunnableStatus.FAILURE,
-                input=input_data,
-                output=format_value(e, recoverable=recoverable),
+    def get_skip_result(
+        self,
+        error: NodeException,
+        input_data: Any,
+        depends_result: dict[str, RunnableResult],
+        config: RunnableConfig,
+        **kwargs,
+    ) -> RunnableResult:
+        """
+        Run skip callbacks and build the skipped node result.
+
+        Args:
+            error (NodeException): Dependency validation error.
+            input_data (Any): Input data for the node.
+            depends_result (dict[str, RunnableResult]): Results of dependent nodes.
+            config (RunnableConfig): Configuration for the run.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Skipped node result.
+        """
+        transformed_input = input_data | {k: result.to_tracing_depend_dict() for k, result in depends_result.items()}
+        if callbacks := self.get_callbacks(config):
+            self.run_on_node_skip(
+                callbacks=callbacks,
+                skip_data={"failed_dependency": error.failed_depend.to_dict()},
+                input_data=transformed_input,
+                **kwargs,
             )
+        if not config.lean:
+            logger.info(f"Node {self.name} - {self.id}: execution skipped.")
+        return RunnableResult(
+            status=RunnableStatus.SKIP,
+            input=transformed_input,
+            output=format_value(error),
+        )
+
+    def get_failure_result(
+        self,
+        error: Exception,
+        input_data: Any,
+        time_start: datetime,
+        config: RunnableConfig,
+        **kwargs,
+    ) -> RunnableResult:
+        """
+        Run error callbacks and build the failed node result.
+
+        Args:
+            error (Exception): Execution error.
+            input_data (Any): Input data for the node.
+            time_start (datetime): Node execution start time.
+            config (RunnableConfig): Configuration for the run.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Failed node result.
+        """
+        from dynamiq.nodes.agents.exceptions import RecoverableAgentException
+
+        self.run_on_node_error(self.get_callbacks(config), error, **kwargs)
+        logger.error(
+            f"Node {self.name} - {self.id}: execution failed in "
+            f"{format_duration(time_start, datetime.now())}."
+        )
+
+        recoverable = isinstance(error, RecoverableAgentException)
+        return RunnableResult(
+            status=RunnableStatus.FAILURE,
+            input=input_data,
+            output=format_value(error, recoverable=recoverable),
+        )
 
     def execute_with_retry(self, input_data: dict[str, Any] | BaseModel, config: RunnableConfig = None, **kwargs):
         """
@@ -565,13 +989,14 @@ class Node(BaseModel, Runnable, ABC):
             Exception: If all retry attempts fail.
         """
         config = ensure_config(config)
+        callbacks = self.get_callbacks(config)
 
         error = None
         n_attempt = self.error_handling.max_retries + 1
         for attempt in range(n_attempt):
-            merged_kwargs = merge(kwargs, {"execution_run_id": uuid4()})
+            merged_kwargs = merge(kwargs, {"execution_run_id": uuid4()}) if callbacks else kwargs
 
-            self.run_on_node_execute_start(config.callbacks, input_data, **merged_kwargs)
+            self.run_on_node_execute_start(callbacks, input_data, **merged_kwargs)
 
             try:
                 output = self.execute_with_timeout(
@@ -581,32 +1006,63 @@ class Node(BaseModel, Runnable, ABC):
                     **merged_kwargs,
                 )
 
-                self.run_on_node_execute_end(config.callbacks, output, **merged_kwargs)
+                self.run_on_node_execute_end(callbacks, output, **merged_kwargs)
                 return output
             except TimeoutError as e:
                 error = e
-                self.run_on_node_execute_error(config.callbacks, error, **merged_kwargs)
+                self.run_on_node_execute_error(callbacks, error, **merged_kwargs)
                 logger.warning(f"Node {self.name} - {self.id}: timeout.")
             except Exception as e:
                 error = e
-                self.run_on_node_execute_error(config.callbacks, error, **merged_kwargs)
+                self.run_on_node_execute_error(callbacks, error, **merged_kwargs)
                 logger.error(f"Node {self.name} - {self.id}: execution error: {e}")
 
+            if config.cancellation_token and config.cancellation_token.is_canceled:
+                # the whole run is canceled, retries are pointless
+                raise error
+
             # do not sleep after the last attempt
             if attempt < n_attempt - 1:
                 time_to_sleep = self.error_handling.retry_interval_seconds * (
                     self.error_handling.backoff_rate**attempt
                 )
+                if not self._can_retry_before_deadline(time_to_sleep, config):
+                    break
                 logger.info(
                     f"Node {self.name} - {self.id}: retrying in {time_to_sleep} seconds."
                 )
-                time.sleep(time_to_sleep)
+                if config.cancellation_token:
+                    if config.cancellation_token.wait(timeout=time_to_sleep):
+                        raise error
+                else:
+                    time.sleep(time_to_sleep)
 
         logger.error(
             f"Node {self.name} - {self.id}: execution failed after {n_attempt} attempts."
         )
         raise error
 
+    def _can_retry_before_deadline(self, time_to_sleep: float, config: RunnableConfig) -> bool:
+        """
+        Check whether the retry backoff ends before the deadline of the cancellation token.
+
+        Args:
+            time_to_sleep (float): Backoff before the next attempt in seconds.
+            config (RunnableConfig): Configuration for the runnable.
+
+        Returns:
+            bool: Whether the next attempt can start before the deadline.
+        """
+        token = config.cancellation_token
+        if token is None or (remaining := token.remaining) is None or time_to_sleep < remaining:
+            return True
+
+        logger.warning(
+            f"Node {self.name} - {self.id}: retry skipped, backoff of {time_to_sleep} seconds "
+            f"exceeds {remaining:.3f} seconds left until the deadline."
+        )
+        return False
+
     def execute_with_timeout(
         self,
         timeout: float | None,
@@ -629,15 +1085,146 @@ class Node(BaseModel, Runnable, ABC):
         Raises:
             Exception: If execution fails or times out.
         """
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(self.execute, input_data, config=config, **kwargs)
+        config = ensure_config(config)
+        parent_token = config.cancellation_token
+        level = get_nesting_level(SharedThreadPool.EXECUTIONS)
+        if timeout is None and (parent_token is None or level):
+            # Nested executions without own timeout already run on a guarded worker preempted by the outer guard.
+            return self.execute(input_data, config=config, **kwargs)
+
+        token = parent_token.child(timeout) if parent_token else CancellationToken(timeout=timeout)
+        token.raise_if_canceled()
+
+        completed = threading.Event()
+        # nested executions run on the pool of the next level, so they never wait for workers of their callers
+        future = get_shared_thread_pool(SharedThreadPool.EXECUTIONS, level).submit(
+            self.execute,
+            input_data,
+            config=config.model_copy(update={"cancellation_token": token}),
+            **kwargs,
+        )
+        future.add_done_callback(lambda _: completed.set())
+        on_cancel = token.on_cancel(completed.set)
+        try:
+            completed.wait()
+            if not future.done():
+                # Return immediately, the hung call observes the canceled token and frees the worker.
+                future.cancel()
+                token.raise_if_canceled()
+            return future.result()
+        finally:
+            token.remove_on_cancel(on_cancel)
+            token.release()
+
+    async def aexecute_with_retry(
+        self, input_data: dict[str, Any] | BaseModel, config: RunnableConfig = None, **kwargs
+    ):
+        """
+        Asynchronously execute the node with retry logic.
+
+        Args:
+            input_data (dict[str, Any]): Input data for the node.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Any: Result of the node execution.
+
+        Raises:
+            Exception: If all retry attempts fail.
+        """
+        config = ensure_config(config)
+        callbacks = self.get_callbacks(config)
+
+        error = None
+        n_attempt = self.error_handling.max_retries + 1
+        for attempt in range(n_attempt):
+            merged_kwargs = merge(kwargs, {"execution_run_id": uuid4()}) if callbacks else kwargs
+
+            self.run_on_node_execute_start(callbacks, input_data, **merged_kwargs)
 
             try:
-                result = future.result(timeout=timeout)
+                output = await self.aexecute_with_timeout(
+                    self.error_handling.timeout_seconds,
+                    input_data,
+                    config,
+                    **merged_kwargs,
+                )
+
+                self.run_on_node_execute_end(callbacks, output, **merged_kwargs)
+                return output
+            except (asyncio.TimeoutError, TimeoutError) as e:
+                error = e
+                self.run_on_node_execute_error(callbacks, error, **merged_kwargs)
+                logger.warning(f"Node {self.name} - {self.id}: timeout.")
             except Exception as e:
-                raise e
+                error = e
+                self.run_on_node_execute_error(callbacks, error, **merged_kwargs)
+                logger.error(f"Node {self.name} - {self.id}: execution error: {e}")
 
-            return result
+            if config.cancellation_token and config.cancellation_token.is_canceled:
+                raise error
+
+            # do not sleep after the last attempt
+            if attempt < n_attempt - 1:
+                time_to_sleep = self.error_handling.retry_interval_seconds * (
+                    self.error_handling.backoff_rate**attempt
+                )
+                if not self._can_retry_before_deadline(time_to_sleep, config):
+                    break
+                logger.info(
+                    f"Node {self.name} - {self.id}: retrying in {time_to_sleep} seconds."
+                )
+                await asyncio.sleep(time_to_sleep)
+
+        logger.error(
+            f"Node {self.name} - {self.id}: execution failed after {n_attempt} attempts."
+        )
+        raise error
+
+    async def aexecute_with_timeout(
+        self,
+        timeout: float | None,
+        input_data: dict[str, Any] | BaseModel,
+        config: RunnableConfig = None,
+        **kwargs,
+    ):
+        """
+        Asynchronously execute the node with a timeout. Timed out execution is cancelled.
+
+        Args:
+            timeout (float | None): Timeout duration in seconds.
+            input_data (dict[str, Any]): Input data for the node.
+            config (RunnableConfig, optional): Configuration for the runnable.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Any: Result of the execution.
+
+        Raises:
+            Exception: If execution fails or times out.
+        """
+        config = ensure_config(config)
+        parent_token = config.cancellation_token
+        if parent_token is None:
+            return await asyncio.wait_for(self.aexecute(input_data, config=config, **kwargs), timeout=timeout)
+
+        token = parent_token.child(timeout)
+        token.raise_if_canceled()
+
+        loop = asyncio.get_running_loop()
+        task = asyncio.ensure_future(
+            self.aexecute(input_data, config=config.model_copy(update={"cancellation_token": token}), **kwargs)
+        )
+        on_cancel = token.on_cancel(lambda: loop.call_soon_threadsafe(task.cancel))
+        try:
+            return await task
+        except asyncio.CancelledError:
+            token.raise_if_canceled()
+            raise
+        finally:
+            token.remove_on_cancel(on_cancel)
+            token.release()
 
     def get_input_streaming_event(
         self,
@@ -678,6 +1265,19 @@ class Node(BaseModel, Runnable, ABC):
 
         raise ValueError("Input streaming is not enabled.")
 
+    @staticmethod
+    def get_callbacks(config: RunnableConfig) -> list[BaseCallbackHandler]:
+        """
+        Get callbacks node run events are dispatched to.
+
+        Args:
+            config (RunnableConfig): Configuration for the run.
+
+        Returns:
+            list[BaseCallbackHandler]: Callback handlers, none in lean run mode.
+        """
+        return [] if config.lean else config.callbacks
+
     def run_on_node_start(
         self,
         callbacks: list[BaseCallbackHandler],
@@ -692,12 +1292,14 @@ class Node(BaseModel, Runnable, ABC):
             input_data (dict[str, Any]): Input data for the node.
             **kwargs: Additional keyword arguments.
         """
+        if not callbacks:
+            return
 
         if isinstance(input_data, BaseModel):
             input_data = dict(input_data)
 
         for callback in callbacks:
-            callback.on_node_start(self.to_dict(), input_data, **kwargs)
+            callback.on_node_start(self.to_dict_snapshot(), input_data, **kwargs)
 
     def run_on_node_end(
         self,
@@ -714,7 +1316,7 @@ class Node(BaseModel, Runnable, ABC):
             **kwargs: Additional keyword arguments.
         """
         for callback in callbacks:
-            callback.on_node_end(self.model_dump(), output_data, **kwargs)
+            callback.on_node_end(self.to_dict_snapshot(), output_data, **kwargs)
 
     def run_on_node_error(
         self,
@@ -731,7 +1333,7 @@ class Node(BaseModel, Runnable, ABC):
             **kwargs: Additional keyword arguments.
         """
         for callback in callbacks:
-            callback.on_node_error(self.to_dict(), error, **kwargs)
+            callback.on_node_error(self.to_dict_snapshot(), error, **kwargs)
 
     def run_on_node_skip(
         self,
@@ -750,7 +1352,24 @@ class Node(BaseModel, Runnable, ABC):
             **kwargs: Additional keyword arguments.
         """
         for callback in callbacks:
-            callback.on_node_skip(self.to_dict(), skip_data, input_data, **kwargs)
+            callback.on_node_skip(self.to_dict_snapshot(), skip_data, input_data, **kwargs)
+
+    def run_on_node_phases(
+        self,
+        callbacks: list[BaseCallbackHandler],
+        phases: list[tuple[str, float, float]],
+        **kwargs,
+    ):
+        """
+        Run callbacks on node phases.
+
+        Args:
+            callbacks (list[BaseCallbackHandler]): List of callback handlers.
+            phases (list[tuple[str, float, float]]): Timed phases of the node run.
+            **kwargs: Additional keyword arguments.
+        """
+        for callback in callbacks:
+            callback.on_node_phases(phases, **kwargs)
 
     def run_on_node_execute_start(
         self,
@@ -770,7 +1389,7 @@ class Node(BaseModel, Runnable, ABC):
             input_data = dict(input_data)
 
         for callback in callbacks:
-            callback.on_node_execute_start(self.to_dict(), input_data, **kwargs)
+            callback.on_node_execute_start(self.to_dict_snapshot(), input_data, **kwargs)
 
     def run_on_node_execute_end(
         self,
@@ -787,7 +1406,7 @@ class Node(BaseModel, Runnable, ABC):
             **kwargs: Additional keyword arguments.
         """
         for callback in callbacks:
-            callback.on_node_execute_end(self.to_dict(), output_data, **kwargs)
+            callback.on_node_execute_end(self.to_dict_snapshot(), output_data, **kwargs)
 
     def run_on_node_execute_error(
         self,
@@ -804,7 +1423,7 @@ class Node(BaseModel, Runnable, ABC):
             **kwargs: Additional keyword arguments.
         """
         for callback in callbacks:
-            callback.on_node_execute_error(self.model_dump(), error, **kwargs)
+            callback.on_node_execute_error(self.to_dict_snapshot(), error, **kwargs)
 
     def run_on_node_execute_run(
         self,
@@ -819,7 +1438,7 @@ class Node(BaseModel, Runnable, ABC):
             **kwargs: Additional keyword arguments.
         """
         for callback in callbacks:
-            callback.on_node_execute_run(self.to_dict(), **kwargs)
+            callback.on_node_execute_run(self.to_dict_snapshot(), **kwargs)
 
     def run_on_node_execute_stream(
         self,
@@ -836,7 +1455,7 @@ class Node(BaseModel, Runnable, ABC):
             **kwargs: Additional keyword arguments.
         """
         for callback in callbacks:
-            callback.on_node_execute_stream(self.to_dict(), chunk, **kwargs)
+            callback.on_node_execute_stream(self.to_dict_snapshot(), chunk, **kwargs)
 
     @abstractmethod
     def execute(self, input_data: dict[str, Any] | BaseModel, config: RunnableConfig = None, **kwargs) -> Any:
@@ -853,6 +1472,84 @@ class Node(BaseModel, Runnable, ABC):
         """
         pass
 
+    def split_stream_input(self, input_data: dict[str, Any] | BaseModel) -> Iterator[dict[str, Any] | BaseModel]:
+        """
+        Split the node input into parts executed one by one when the node runs as a stage of a streaming pipeline.
+
+        Nodes processing items independently (e.g. converters, splitters) override this method, so outputs of
+        the first parts are passed downstream while the rest are still executed. Such nodes set
+        `supports_stream_input`, as their output for the whole input equals the merged outputs of its parts,
+        and may consume streaming dependencies chunk by chunk. By default the input is not split.
+
+        Args:
+            input_data (dict[str, Any]): Input data for the node.
+
+        Yields:
+            dict[str, Any]: Input data of one part with the same structure as the node input.
+        """
+        yield input_data
+
+    def merge_stream_outputs(self, outputs: list[Any]) -> Any:
+        """
+        Merge output chunks of the streaming execution into the node output.
+
+        List values of dictionary chunks are concatenated and nested dictionaries are merged recursively.
+        Other values must be equal in all chunks.
+
+        Args:
+            outputs (list[Any]): Output chunks.
+
+        Returns:
+            Any: Merged output.
+
+        Raises:
+            ValueError: If chunks have different values that are not lists.
+        """
+        if not outputs:
+            return {}
+
+        def copy_value(value: Any) -> Any:
+            if isinstance(value, dict):
+                return {key: copy_value(item) for key, item in value.items()}
+            if isinstance(value, list):
+                return list(value)
+            return value
+
+        # chunks were already passed downstream, so merge into copies instead of mutating them
+        def merge_value(merged: Any, value: Any) -> Any:
+            if isinstance(merged, dict) and isinstance(value, dict):
+                for key, item in value.items():
+                    merged[key] = merge_value(merged[key], item) if key in merged else copy_value(item)
+                return merged
+            if isinstance(merged, list) and isinstance(value, list):
+                merged.extend(value)
+                return merged
+            if merged is not value and merged != value:
+                raise ValueError(f"Node {self.name} - {self.id}: output chunks can not be merged.")
+            return merged
+
+        merged_output = copy_value(outputs[0])
+        for output in outputs[1:]:
+            merged_output = merge_value(merged_output, output)
+        return merged_output
+
+    async def aexecute(self, input_data: dict[str, Any] | BaseModel, config: RunnableConfig = None, **kwargs) -> Any:
+        """
+        Asynchronously execute the node with the given input.
+
+        Nodes with native async clients override this method. By default the blocking `execute` is
+        offloaded to a worker thread so the event loop stays responsive.
+
+        Args:
+            input_data (dict[str, Any]): Input data for the node.
+            config (RunnableConfig, optional): Configuration for the runnable.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Any: Result of the execution.
+        """
+        return await asyncio.to_thread(self.execute, input_data, config, **kwargs)
+
     def depends_on(self, nodes: Union["Node", list["Node"]]):
         """
         Add dependencies for this node. Accepts either a single node or a list of nodes.
@@ -885,6 +1582,8 @@ class Node(BaseModel, Runnable, ABC):
         # Add each node as a dependency
         for node in nodes:
             self.depends.append(NodeDependency(node))
+        self._register_dependant()
+        self._reset_serialized()
 
         return self  # enable chaining
 
@@ -52,11 +52,17 @@ class ChoiceCondition(BaseModel):
 
 
 class ChoiceOption(BaseModel):
-    """Represents an option for a choice node."""
+    """
+    Represents an option for a choice node.
+
+    Nodes depending on a speculative option are started before the choice is evaluated and canceled
+    if the option is not taken. Mark only likely options whose branches are cheap to cancel.
+    """
 
     id: str = Field(default_factory=generate_uuid)
     name: str | None = None
     condition: ChoiceCondition | None = None
+    speculative: bool = False
 
 
 class ChoiceExecute(BaseModel):
@@ -112,7 +118,7 @@ class Choice(Node):
             config = ensure_config(config)
             merged_kwargs = {**kwargs, "parent_run_id": run_id}
 
-            self.run_on_node_execute_run(config.callbacks, **merged_kwargs)
+            self.run_on_node_execute_run(self.get_callbacks(config), **merged_kwargs)
 
             is_success_evaluation = False
             for option in self.options:
@@ -250,7 +256,7 @@ class Map(Node):
         config = ensure_config(config)
         merged_kwargs = {**kwargs, "parent_run_id": run_id}
 
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         for index, data in enumerate(input_data, start=1):
             result = self.node.run(data, config, **merged_kwargs)
@@ -288,6 +294,25 @@ class Pass(Node):
 
         return input_data
 
+    async def aexecute_with_retry(
+        self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs
+    ):
+        """
+        Asynchronously executes the pass node with retry logic.
+
+        Args:
+            input_data: The input data for the node.
+            config: The runnable configuration.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            The input data if no transformers are present, otherwise the transformed data.
+        """
+        if self.transformers:
+            return await super().aexecute_with_retry(input_data, config, **kwargs)
+
+        return input_data
+
     def execute(
         self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs
     ):
@@ -308,7 +333,7 @@ class Pass(Node):
             config = ensure_config(config)
             merged_kwargs = {**kwargs, "parent_run_id": run_id}
 
-            self.run_on_node_execute_run(config.callbacks, **merged_kwargs)
+            self.run_on_node_execute_run(self.get_callbacks(config), **merged_kwargs)
 
             for transformer in self.transformers:
                 output = self.transform(output, transformer, self.id)
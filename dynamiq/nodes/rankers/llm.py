@@ -1,7 +1,7 @@
-import concurrent.futures
 from typing import Any, Literal
 
 from dynamiq.connections.managers import ConnectionManager
+from dynamiq.executors.shared import SharedThreadPool, get_shared_thread_pool
 from dynamiq.nodes.node import Node, NodeDependency, NodeGroup, ensure_config
 from dynamiq.prompts import prompts
 from dynamiq.runnables import RunnableConfig, RunnableStatus
@@ -141,7 +141,7 @@ class LLMDocumentRanker(Node):
         """
         config = ensure_config(config)
         self.reset_run_state()
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         ranked_documents = self.perform_llm_ranking(
             query=input_data["query"],
@@ -190,15 +190,12 @@ class LLMDocumentRanker(Node):
             messages=[prompts.Message(role="user", content=self.prompt_template)]
         )
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            llm_results = list(
-                executor.map(
-                    lambda input_data: self.call_llm(
-                        input_data, prompt, config, **run_kwargs
-                    ),
-                    inputs,
-                )
+        llm_results = list(
+            get_shared_thread_pool(SharedThreadPool.TASKS).map(
+                lambda input_data: self.call_llm(input_data, prompt, config, **run_kwargs),
+                inputs,
             )
+        )
 
         logger.debug(
             f"Node {self.name} - {self.id}: LLM processed {len(llm_results)} documents"
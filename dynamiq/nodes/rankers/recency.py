@@ -103,7 +103,7 @@ class TimeWeightedDocumentRanker(Node):
             # output will be a dictionary with ranked documents
         """
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         documents = input_data["documents"]
 
@@ -99,7 +99,7 @@ class PineconeDocumentRetriever(VectorStoreNode, PineconeVectorStoreParams):
             dict: A dictionary containing the retrieved documents.
         """
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         query_embedding = input_data["embedding"]
         filters = input_data.get("filters") or self.filters
@@ -1,4 +1,4 @@
-from typing import Any, Literal
+from typing import Any, ClassVar, Iterator, Literal
 
 from dynamiq.components.splitters.document import DocumentSplitBy
 from dynamiq.components.splitters.document import (
@@ -35,6 +35,7 @@ class DocumentSplitter(Node):
     """
 
     group: Literal[NodeGroup.SPLITTERS] = NodeGroup.SPLITTERS
+    supports_stream_input: ClassVar[bool] = True
     name: str = "DocumentSplitter"
     split_by: DocumentSplitBy = DocumentSplitBy.PASSAGE
     split_length: int = 10
@@ -76,7 +77,7 @@ class DocumentSplitter(Node):
             dict[str, Any]: A dictionary containing the split documents under the key "documents".
         """
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         documents = input_data["documents"]
         logger.debug(f"Splitting {len(documents)} documents")
@@ -90,3 +91,15 @@ class DocumentSplitter(Node):
         return {
             "documents": split_documents,
         }
+
+    def split_stream_input(self, input_data: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """Splits the input into single documents, so parts of each document are passed downstream once it is split.
+
+        Args:
+            input_data (dict[str, Any]): The input data containing the documents to split.
+
+        Yields:
+            dict[str, Any]: The input data containing one document.
+        """
+        for document in input_data["documents"]:
+            yield input_data | {"documents": [document]}
@@ -285,7 +285,7 @@ class E2BInterpreterTool(ConnectionNode):
     ) -> dict[str, Any]:
         """Executes the requested action based on the input data."""
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         if self.persistent_sandbox:
             sandbox = self._sandbox
@@ -86,7 +86,7 @@ class FirecrawlTool(ConnectionNode):
         logger.debug(f"Tool {self.name} - {self.id}: started with input data {input_data.model_dump()}")
 
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         url = input_data.url or self.url
         if not url:
@@ -45,7 +45,7 @@ class FunctionTool(Node, Generic[T]):
         :return: Dictionary with the execution result.
         """
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         result = self.run_func(input_data)
 
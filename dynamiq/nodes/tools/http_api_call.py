@@ -83,24 +83,79 @@ class HttpApiCall(ConnectionNode):
                 - "status_code" (int): The status code of the request.
         """
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
-        data = input_data.data
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
+        response = self.client.request(**self.get_request_params(input_data, config))
+        return self.get_response_output(response)
+
+    async def aexecute(self, input_data: HttpApiCallInputSchema, config: RunnableConfig = None, **kwargs):
+        """Asynchronously execute the API call using the native async httpx client.
+
+        Args:
+            input_data (dict[str, Any]): The input data containing(optionally) data, headers,
+                params for request.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+             dict: A dictionary with the following keys:
+                - "content" (bytes|string|dict[str,Any]): Value containing the result of request.
+                - "status_code" (int): The status code of the request.
+        """
+        config = ensure_config(config)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
+
+        client = await self.connection.get_async_client()
+        response = await client.request(**self.get_request_params(input_data, config))
+        return self.get_response_output(response)
+
+    def get_request_params(self, input_data: HttpApiCallInputSchema, config: RunnableConfig = None) -> dict[str, Any]:
+        """Build request parameters from connection, node and input data.
+
+        The request timeout is capped by the deadline of the cancellation token, if any.
+
+        Args:
+            input_data (HttpApiCallInputSchema): The input data for request.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+
+        Returns:
+            dict[str, Any]: Request parameters.
+
+        Raises:
+            ValueError: If url is not provided.
+        """
         url = input_data.url or self.url or self.connection.url
         if not url:
             raise ValueError("No url provided.")
-        headers = input_data.headers
-        params = input_data.params
-
-        response = self.client.request(
-            method=self.connection.method,
-            url=url,
-            headers=self.connection.headers | self.headers | headers,
-            params=self.connection.params | self.params | params,
-            data=self.connection.data | self.data | data,
-            timeout=self.timeout,
-        )
 
+        timeout = self.timeout
+        if config and config.cancellation_token:
+            config.cancellation_token.raise_if_canceled()
+            if (remaining := config.cancellation_token.remaining) is not None:
+                timeout = min(timeout, remaining)
+
+        return {
+            "method": self.connection.method,
+            "url": url,
+            "headers": self.connection.headers | self.headers | input_data.headers,
+            "params": self.connection.params | self.params | input_data.params,
+            "data": self.connection.data | self.data | input_data.data,
+            "timeout": timeout,
+        }
+
+    def get_response_output(self, response: Any) -> dict[str, Any]:
+        """Validate response status and extract its content.
+
+        Args:
+            response (Any): Response of the request.
+
+        Returns:
+            dict[str, Any]: Response content and status code.
+
+        Raises:
+            ToolExecutionException: If response status code is not successful.
+            ValueError: If response type is not supported.
+        """
         if response.status_code not in self.success_codes:
             raise ToolExecutionException(
                 f"Request failed with unexpected status code: {response.status_code} and response: {response.text}"
@@ -141,7 +141,7 @@ class HumanFeedbackTool(Node):
         """
         logger.debug(f"Tool {self.name} - {self.id}: started with input data {input_data.model_dump()}")
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         input_text = input_data.input
         if isinstance(self.input_method, InputMethod):
@@ -175,7 +175,7 @@ class SummarizerTool(Node):
         """
         config = ensure_config(config)
         self.reset_run_state()
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         input_text = input_data.input
         logger.debug(
@@ -94,7 +94,7 @@ class Python(Node):
         logger.debug(f"Tool {self.name} - {self.id}: started with input data {dict(input_data)}")
 
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
         stdout = io.StringIO()
 
         def safe_print(*args, **kwargs):
@@ -105,7 +105,7 @@ class ScaleSerpTool(ConnectionNode):
         logger.debug(f"Tool {self.name} - {self.id}: started with input data {input_data.model_dump()}")
 
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         query: str | None = input_data.query
         url: str | None = input_data.url
@@ -53,7 +53,7 @@ class ZenRowsTool(ConnectionNode):
 
         # Ensure the config is set up correctly
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         params = {
             "url": input_data.url,
@@ -24,6 +24,19 @@ class NodeGroup(Enum):
     VALIDATORS = "validators"
 
 
+class ExecutorAffinity(str, Enum):
+    """
+    Enumeration of pools a node can be routed to by the HybridExecutor.
+
+    THREAD suits I/O-bound nodes, PROCESS suits CPU-bound nodes that hold the GIL
+    and ASYNC suits nodes with native async clients.
+    """
+
+    THREAD = "thread"
+    PROCESS = "process"
+    ASYNC = "async"
+
+
 class InferenceMode(Enum):
     """
     Enumeration of inference types.
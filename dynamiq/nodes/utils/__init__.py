@@ -1 +1 @@
-from .utils import Input, Output
+from .utils import Input, Output, SubFlow
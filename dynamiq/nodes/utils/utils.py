@@ -1,7 +1,10 @@
-from typing import Literal, Any
+from typing import Any, Literal
 
+from dynamiq.flows import Flow
 from dynamiq.nodes import NodeGroup
+from dynamiq.nodes.node import Node, ensure_config
 from dynamiq.nodes.operators import Pass
+from dynamiq.runnables import RunnableConfig, RunnableStatus
 
 
 class Input(Pass):
@@ -36,3 +39,78 @@ class Output(Pass):
     name: str | None = "End"
     group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
     schema: dict[str, Any] | None = None
+
+
+class SubFlow(Node):
+    """
+    A utility node running a nested flow as a single step of the parent flow.
+
+    The nested flow runs on the executor of the parent flow run: its nodes are submitted to the same pool
+    and take in-flight slots from the same limit, while the slot of this node is lent to them. Callbacks,
+    cache and cancellation token of the parent run are reused, so the nested run is traced under this node
+    and bounded by its deadline.
+
+    Attributes:
+        group (Literal[NodeGroup.UTILS]): The group the node belongs to, set to UTILS.
+        flow (Flow): The nested flow to run.
+    """
+
+    name: str | None = "SubFlow"
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    flow: Flow
+
+    @property
+    def to_dict_exclude_params(self):
+        """
+        Property to define which parameters should be excluded when converting the class instance to a dictionary.
+
+        Returns:
+            dict: A dictionary defining the parameters to exclude.
+        """
+        return super().to_dict_exclude_params | {"flow": True}
+
+    def to_dict(self, **kwargs) -> dict:
+        """Converts the instance to a dictionary.
+
+        Returns:
+            dict: A dictionary representation of the instance.
+        """
+        data = super().to_dict(**kwargs)
+        data["flow"] = {"id": self.flow.id, "nodes": [node.to_dict(**kwargs) for node in self.flow.nodes]}
+        return data
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        """
+        Executes the nested flow.
+
+        Args:
+            input_data (dict[str, Any]): Input data of the nested flow.
+            config (RunnableConfig, optional): Configuration of the parent flow run. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            dict[str, Any]: Results of the nested flow nodes by node id.
+
+        Raises:
+            ValueError: If the nested flow run fails.
+        """
+        config = ensure_config(config)
+        merged_kwargs = kwargs | {"parent_run_id": kwargs.get("run_id")}
+
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
+
+        if (node_executor := config.node_executor) is not None:
+            # the slot of this node is lent to the nested run, so it runs on the executor of the parent run
+            with node_executor.lend_slot():
+                result = self.flow.run(
+                    input_data=input_data,
+                    config=config.model_copy(update={"run_executor": node_executor}),
+                    **merged_kwargs,
+                )
+        else:
+            result = self.flow.run(input_data=input_data, config=config, **merged_kwargs)
+
+        if result.status != RunnableStatus.SUCCESS:
+            raise ValueError(f"SubFlow node failed to execute: flow {self.flow.id} has failed.")
+
+        return result.output
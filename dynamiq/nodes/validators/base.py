@@ -31,7 +31,7 @@ class BaseValidator(Node):
             ValueError: If the value is not valid and behavior equal raise type.
         """
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
         try:
             self.validate(input_data["content"])
         except Exception as error:
@@ -69,7 +69,7 @@ class MilvusDocumentWriter(VectorStoreNode, BaseWriterVectorStoreParams):
             Any exceptions raised by the vector store's write_documents method.
         """
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         documents = input_data["documents"]
 
@@ -93,7 +93,7 @@ class PineconeDocumentWriter(VectorStoreNode, PineconeWriterVectorStoreParams):
             Any exceptions raised by the vector store's write_documents method.
         """
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         documents = input_data["documents"]
 
@@ -64,7 +64,7 @@ class QdrantDocumentWriter(VectorStoreNode, QdrantWriterVectorStoreParams):
             dict: A dictionary containing the count of upserted documents.
         """
         config = ensure_config(config)
-        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        self.run_on_node_execute_run(self.get_callbacks(config), **kwargs)
 
         documents = input_data["documents"]
 
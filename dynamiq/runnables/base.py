@@ -1,12 +1,15 @@
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent import futures
 from enum import Enum
 from io import BytesIO
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from dynamiq.cache.config import CacheConfig
 from dynamiq.callbacks import BaseCallbackHandler
+from dynamiq.types.cancellation import CancellationToken
 from dynamiq.types.streaming import StreamingConfig
 from dynamiq.utils import format_value, generate_uuid
 
@@ -23,12 +26,30 @@ class RunnableConfig(BaseModel):
         callbacks (list[BaseCallbackHandler]): List of callback handlers.
         cache (CacheConfig | None): Cache configuration.
         max_node_workers (int | None): Maximum number of node workers.
+        executor_pool (futures.Executor | None): Long-lived pool flows attach to instead of the default one.
+        node_executor (Any): Executor of the flow run the node runs in, set by the flow.
+        run_executor (Any): Executor lent to the flow run by the calling node, set by nodes lending their
+            in-flight slot to the nested run (e.g. `SubFlow`). The flow executes its nodes on it instead of
+            creating its own executor.
+        cancellation_token (CancellationToken | None): Token to cooperatively cancel the run.
+        latency_budget (float | None): Seconds the flow run may take. Flows turn it into the deadline of
+            the cancellation token and divide the remaining time across remaining nodes, capping their
+            timeouts, retries and backoff.
+        lean (bool): Whether nodes run in lean mode, for batch runs that do not trace nodes. Node events
+            are not dispatched to callbacks (flow, workflow and streaming events still are), node phases
+            are not timed and per-node info logs are not written.
     """
 
     run_id: str | None = Field(default_factory=generate_uuid)
     callbacks: list[BaseCallbackHandler] = []
     cache: CacheConfig | None = None
     max_node_workers: int | None = None
+    executor_pool: futures.Executor | None = Field(default=None, exclude=True)
+    node_executor: Any = Field(default=None, exclude=True)
+    run_executor: Any = Field(default=None, exclude=True)
+    cancellation_token: CancellationToken | None = Field(default=None, exclude=True)
+    latency_budget: float | None = None
+    lean: bool = False
     nodes_override: dict[str, NodeRunnableConfig] = {}
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -51,10 +72,29 @@ class RunnableStatus(Enum):
     SKIP = "skip"
 
 
+def _copy_containers(value: Any) -> Any:
+    """Copy dicts, lists, tuples and sets of the formatted value, other values are shared as formatted."""
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _copy_containers(item) for key, item in value.items()}
+    if value_type is list:
+        return [_copy_containers(item) for item in value]
+    if value_type is tuple:
+        return tuple(_copy_containers(item) for item in value)
+    if value_type is set:
+        return set(value)
+    return value
+
+
 class RunnableResult(BaseModel):
     """
     Dataclass representing the result of a Runnable execution.
 
+    Dictionary views are formatted lazily and memoized, so a result read by many consumers (e.g. dependent
+    nodes) is formatted once. Each view gets its own copy of the formatted containers, unless `copy=False`
+    is passed to `to_dict`, which returns the memoized values that must not be modified.
+    Assigning a field resets the views, in-place changes of input or output are not tracked.
+
     Attributes:
         status (RunnableStatus): The status of the execution.
         input (Any): The input data of the execution.
@@ -65,6 +105,39 @@ class RunnableResult(BaseModel):
     input: Any = None
     output: Any = None
 
+    _formatted: dict[tuple, Any] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in self.model_fields:
+            self._formatted = {}
+
+    def __copy__(self):
+        result = super().__copy__()
+        result._formatted = {}
+        return result
+
+    def __getstate__(self) -> dict[Any, Any]:
+        state = super().__getstate__()
+        return state | {"__pydantic_private__": {**state["__pydantic_private__"], "_formatted": {}}}
+
+    def _format_field(
+        self,
+        name: str,
+        skip_format_types: set | None,
+        force_format_types: set | None,
+        copy: bool = True,
+        memo: dict | None = None,
+    ) -> Any:
+        """Format the field once per formatting options, returning a copy of the memoized value if `copy` is set."""
+        key = (name, frozenset(skip_format_types or ()), frozenset(force_format_types or ()), copy)
+        if key not in self._formatted:
+            self._formatted[key] = format_value(
+                getattr(self, name), skip_format_types, force_format_types, copy, memo
+            )
+        formatted = self._formatted[key]
+        return _copy_containers(formatted) if copy else formatted
+
     def to_depend_dict(
         self,
         skip_format_types: set | None = None,
@@ -77,14 +150,7 @@ class RunnableResult(BaseModel):
         Returns:
             dict: A dictionary representation of the RunnableResult.
         """
-        if skip_format_types is None:
-            skip_format_types = set()
-        skip_format_types.update({BytesIO, BaseModel, bytes})
-
-        if force_format_types is None:
-            force_format_types = set()
-        force_format_types.add(RunnableResult)
-
+        skip_format_types, force_format_types = self._get_depend_format_types(skip_format_types, force_format_types)
         return self.to_dict(skip_format_types, force_format_types, **kwargs)
 
     def to_tracing_depend_dict(
@@ -97,28 +163,51 @@ class RunnableResult(BaseModel):
             dict: A dictionary representation of the RunnableResult.
         """
 
-        depend_dict = self.to_depend_dict(skip_format_types, force_format_types, **kwargs)
-        depend_dict.pop("input", None)
+        skip_format_types, force_format_types = self._get_depend_format_types(skip_format_types, force_format_types)
+        # input is not part of the tracing view, so it is not formatted at all
+        return {
+            "status": self.status.value,
+            "output": self._format_field("output", skip_format_types, force_format_types),
+        }
+
+    @staticmethod
+    def _get_depend_format_types(skip_format_types: set | None, force_format_types: set | None) -> tuple[set, set]:
+        """Add types formatted differently in dependency context to the formatting options."""
+        if skip_format_types is None:
+            skip_format_types = set()
+        skip_format_types.update({BytesIO, BaseModel, bytes})
+
+        if force_format_types is None:
+            force_format_types = set()
+        force_format_types.add(RunnableResult)
 
-        return depend_dict
+        return skip_format_types, force_format_types
 
     def to_dict(
         self,
         skip_format_types: set | None = None,
         force_format_types: set | None = None,
+        copy: bool = True,
+        memo: dict | None = None,
         **kwargs
     ) -> dict:
         """
         Convert the RunnableResult instance to a dictionary.
 
+        Args:
+            skip_format_types (set | None): Types to skip formatting.
+            force_format_types (set | None): Types to force formatting.
+            copy (bool): Whether input and output containers are always copied, see `format_value`.
+            memo (dict | None): Formatted containers shared between results, see `format_value`.
+
         Returns:
             dict: A dictionary representation of the RunnableResult.
         """
 
         return {
             "status": self.status.value,
-            "input": format_value(self.input, skip_format_types, force_format_types),
-            "output": format_value(self.output, skip_format_types, force_format_types),
+            "input": self._format_field("input", skip_format_types, force_format_types, copy, memo),
+            "output": self._format_field("output", skip_format_types, force_format_types, copy, memo),
         }
 
 
@@ -143,3 +232,22 @@ class Runnable(ABC):
             RunnableResult: The result of the execution.
         """
         pass
+
+    async def arun(
+        self, input_data: Any, config: RunnableConfig = None, **kwargs
+    ) -> RunnableResult:
+        """
+        Asynchronously run the Runnable object.
+
+        Default implementation offloads the synchronous `run` to a worker thread, so every Runnable
+        can be awaited. Subclasses override it with a native event loop implementation.
+
+        Args:
+            input_data (Any): The input data for the execution.
+            config (RunnableConfig, optional): Configuration for the execution.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: The result of the execution.
+        """
+        return await asyncio.to_thread(self.run, input_data, config, **kwargs)
@@ -0,0 +1,264 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import TimeoutError
+from typing import Callable
+
+
+class CanceledException(Exception):
+    """
+    Exception raised when execution is stopped by a cancellation token.
+
+    This exception is a subclass of Exception and inherits its attributes and methods.
+    """
+
+    pass
+
+
+class TimerHandle:
+    """
+    Handle of a callback scheduled on the TimerScheduler.
+
+    Attributes:
+        deadline (float): Monotonic time when the callback fires.
+        callback (Callable[[], None]): Callback to fire.
+        canceled (bool): Whether the timer was canceled.
+    """
+
+    def __init__(self, deadline: float, callback: Callable[[], None], scheduler: "TimerScheduler | None" = None):
+        self.deadline = deadline
+        self.callback = callback
+        self.canceled = False
+        self._scheduler = scheduler
+
+    def cancel(self):
+        """Cancels the timer. The callback is not fired if it did not fire yet."""
+        if self.canceled:
+            return
+        self.canceled = True
+        if self._scheduler is not None:
+            self._scheduler._on_cancel()
+
+
+class TimerScheduler:
+    """
+    Single daemon thread firing scheduled callbacks at their deadlines.
+
+    Shared by all cancellation tokens, so timeouts do not need a thread or pool per call.
+    Callbacks run on the scheduler thread and must be short and non-blocking.
+    """
+
+    def __init__(self):
+        self._timers: list[tuple[float, int, TimerHandle]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._canceled_count = 0
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        """
+        Schedules callback to fire after the delay.
+
+        Args:
+            delay (float): Delay in seconds.
+            callback (Callable[[], None]): Callback to fire.
+
+        Returns:
+            TimerHandle: Handle to cancel the timer.
+        """
+        handle = TimerHandle(deadline=time.monotonic() + max(delay, 0), callback=callback, scheduler=self)
+        with self._condition:
+            heapq.heappush(self._timers, (handle.deadline, next(self._counter), handle))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="dynamiq-timer", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return handle
+
+    def _on_cancel(self):
+        """Drops canceled timers once they make up more than half of the heap."""
+        with self._condition:
+            self._canceled_count += 1
+            if self._canceled_count * 2 > len(self._timers):
+                self._timers = [timer for timer in self._timers if not timer[2].canceled]
+                heapq.heapify(self._timers)
+                self._canceled_count = 0
+                self._condition.notify()
+
+    def _run(self):
+        """Fires due callbacks, sleeping until the nearest deadline."""
+        while True:
+            with self._condition:
+                while not self._timers:
+                    self._condition.wait()
+                deadline, _, handle = self._timers[0]
+                if handle.canceled:
+                    heapq.heappop(self._timers)
+                    self._canceled_count = max(self._canceled_count - 1, 0)
+                    continue
+                now = time.monotonic()
+                if deadline > now:
+                    self._condition.wait(timeout=deadline - now)
+                    continue
+                heapq.heappop(self._timers)
+                handle._scheduler = None
+
+            if not handle.canceled:
+                try:
+                    handle.callback()
+                except Exception:  # nosec
+                    pass
+
+
+timer_scheduler = TimerScheduler()
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation signal propagated through `RunnableConfig`.
+
+    Long-running calls poll `is_canceled` or register `on_cancel` callbacks. Tokens form a tree:
+    canceling a token cancels all of its children, and a child deadline never exceeds its parent's one.
+
+    Attributes:
+        reason (str | None): Reason of the cancellation.
+        timed_out (bool): Whether the token was canceled because its deadline passed.
+        deadline (float | None): Monotonic time after which the token is canceled.
+    """
+
+    def __init__(self, timeout: float | None = None, parent: "CancellationToken | None" = None):
+        """
+        Initializes the CancellationToken instance.
+
+        Args:
+            timeout (float | None, optional): Seconds after which the token is canceled. Defaults to None.
+            parent (CancellationToken | None, optional): Token whose cancellation propagates. Defaults to None.
+        """
+        self.reason = None
+        self.timed_out = False
+        self.deadline = None
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: list[Callable[[], None]] = []
+        self._timer = None
+        self._parent = parent
+        self._parent_callback = None
+
+        if parent is not None:
+            self.deadline = parent.deadline
+            self._parent_callback = parent.on_cancel(lambda: self.cancel(parent.reason, timed_out=parent.timed_out))
+
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+            if self.deadline is None or deadline < self.deadline:
+                self.deadline = deadline
+                self._timer = timer_scheduler.schedule(
+                    timeout, lambda: self.cancel(f"Timeout {timeout}s exceeded.", timed_out=True)
+                )
+
+    @property
+    def is_canceled(self) -> bool:
+        """Whether the token is canceled."""
+        return self._event.is_set()
+
+    @property
+    def remaining(self) -> float | None:
+        """Seconds left until the deadline or None if the token has no deadline."""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0)
+
+    def child(self, timeout: float | None = None) -> "CancellationToken":
+        """
+        Creates a token canceled together with this one.
+
+        Args:
+            timeout (float | None, optional): Timeout of the child token. Defaults to None.
+
+        Returns:
+            CancellationToken: Child token.
+        """
+        return CancellationToken(timeout=timeout, parent=self)
+
+    def cancel(self, reason: str | None = None, timed_out: bool = False):
+        """
+        Cancels the token and fires registered callbacks once.
+
+        Args:
+            reason (str | None, optional): Reason of the cancellation. Defaults to None.
+            timed_out (bool, optional): Whether cancellation is caused by the deadline. Defaults to False.
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason or "Execution canceled."
+            self.timed_out = timed_out
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+
+        self.release()
+        for callback in callbacks:
+            callback()
+
+    def release(self):
+        """Cancels the token timer and detaches it from the parent. Call when the guarded work is finished."""
+        if self._timer is not None:
+            self._timer.cancel()
+        if self._parent is not None and self._parent_callback is not None:
+            self._parent.remove_on_cancel(self._parent_callback)
+            self._parent_callback = None
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Registers callback fired on cancellation. Fires immediately if the token is already canceled.
+
+        Args:
+            callback (Callable[[], None]): Callback to fire.
+
+        Returns:
+            Callable[[], None]: Registered callback to pass to `remove_on_cancel`.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return callback
+
+        callback()
+        return callback
+
+    def remove_on_cancel(self, callback: Callable[[], None]):
+        """
+        Removes previously registered cancellation callback.
+
+        Args:
+            callback (Callable[[], None]): Callback to remove.
+        """
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Blocks until the token is canceled or the timeout expires.
+
+        Args:
+            timeout (float | None, optional): Maximum time to wait in seconds. Defaults to None.
+
+        Returns:
+            bool: Whether the token is canceled.
+        """
+        return self._event.wait(timeout=timeout)
+
+    def raise_if_canceled(self):
+        """
+        Raises if the token is canceled.
+
+        Raises:
+            TimeoutError: If the token deadline passed.
+            CanceledException: If the token is canceled.
+        """
+        if self.is_canceled:
+            if self.timed_out:
+                raise TimeoutError(self.reason)
+            raise CanceledException(self.reason)
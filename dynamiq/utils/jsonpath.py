@@ -1,6 +1,43 @@
-from jsonpath_ng import parse
+from functools import lru_cache
+
+from jsonpath_ng import JSONPath, parse
 from jsonpath_ng.exceptions import JsonPathParserError
 
+MAX_PARSED_JSONPATHS = 4096
+
+
+@lru_cache(maxsize=MAX_PARSED_JSONPATHS)
+def _parse_jsonpath(path: str) -> JSONPath | None:
+    """
+    Parse JSONPath expression, caching the outcome for the process lifetime.
+
+    Args:
+        path (str): The string to be parsed.
+
+    Returns:
+        JSONPath | None: Parsed expression, or None if the string is not a valid JSONPath expression.
+    """
+    try:
+        return parse(path)
+    except JsonPathParserError:
+        return None
+
+
+def parse_jsonpath(path: str) -> JSONPath | None:
+    """
+    Parse JSONPath expression once, so repeated executions of nodes reuse the parsed expression.
+
+    Args:
+        path (str): The string to be parsed.
+
+    Returns:
+        JSONPath | None: Parsed expression, or None if the string is not a valid JSONPath expression.
+    """
+    if not isinstance(path, str):
+        # not cacheable, parsing reports the invalid type
+        return parse(path)
+    return _parse_jsonpath(path)
+
 
 def is_jsonpath(path: str) -> bool:
     """
@@ -12,11 +49,7 @@ def is_jsonpath(path: str) -> bool:
     Returns:
         bool: True if the string is a valid JSONPath expression, False otherwise.
     """
-    try:
-        parse(path)
-        return True
-    except JsonPathParserError:
-        return False
+    return parse_jsonpath(path) is not None
 
 
 def mapper(json: dict | list, map: dict, node_id: str) -> dict:
@@ -46,11 +79,11 @@ def mapper(json: dict | list, map: dict, node_id: str) -> dict:
 
     new_json = {}
     for key, path in map.items():
-        if not is_jsonpath(path):
+        if (expression := parse_jsonpath(path)) is None:
             new_json[key] = path
             continue
         try:
-            found = parse(path).find(json)
+            found = expression.find(json)
             if not found:
                 new_json[key] = None
             elif len(found) == 1:
@@ -80,12 +113,12 @@ def filter(json: dict, filter: str, node_id: str):
     """
     if not filter:
         return json
-    if not is_jsonpath(filter):
+    if (expression := parse_jsonpath(filter)) is None:
         raise ValueError(f"Invalid filter of node {node_id}: filter must be a jsonpath")
 
     filtered_data = None
     try:
-        value = parse(filter).find(json)
+        value = expression.find(json)
         if value:
             filtered_data = [v.value for v in value]
             if len(filtered_data) == 1:
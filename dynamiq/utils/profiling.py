@@ -0,0 +1,44 @@
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class PhaseTimer:
+    """Records consecutive phases of an execution as `(name, start, end)` spans.
+
+    Starting a phase ends the current one, so sequential code is instrumented with a single call
+    per phase. Times are `time.perf_counter` values in seconds.
+
+    Attributes:
+        enabled (bool): Whether phases are recorded, disabled timers make all calls no-ops.
+        phases (list[tuple[str, float, float]]): Finished phases.
+    """
+
+    enabled: bool = True
+    phases: list[tuple[str, float, float]] = field(default_factory=list)
+    _name: str | None = field(default=None, repr=False)
+    _start: float = field(default=0.0, repr=False)
+
+    def start(self, name: str):
+        """Finish the current phase and start a new one.
+
+        Args:
+            name (str): Name of the phase.
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._name is not None:
+            self.phases.append((self._name, self._start, now))
+        self._name, self._start = name, now
+
+    def stop(self) -> list[tuple[str, float, float]]:
+        """Finish the current phase.
+
+        Returns:
+            list[tuple[str, float, float]]: Finished phases.
+        """
+        if self._name is not None:
+            self.phases.append((self._name, self._start, time.perf_counter()))
+            self._name = None
+        return self.phases
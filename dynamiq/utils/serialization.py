@@ -0,0 +1,106 @@
+import builtins
+import json
+from typing import Any
+
+from jsonpickle import tags
+from jsonpickle.unpickler import Unpickler, loadclass
+
+# Modules whose classes and functions can be restored from serialized data by default
+DEFAULT_ALLOWED_MODULES = ("dynamiq",)
+# Standard library data types restored besides builtin classes
+ALLOWED_DATA_TYPES = frozenset(
+    {
+        "_io.BytesIO",
+        "collections.OrderedDict",
+        "collections.defaultdict",
+        "collections.deque",
+        "datetime.date",
+        "datetime.datetime",
+        "datetime.time",
+        "datetime.timedelta",
+        "datetime.timezone",
+        "decimal.Decimal",
+        "uuid.UUID",
+    }
+)
+
+
+def _is_allowed_module(module: str, allowed_modules: tuple[str, ...]) -> bool:
+    """
+    Check if the module is one of the allowed modules or their submodules.
+
+    Args:
+        module (str): Module name.
+        allowed_modules (tuple[str, ...]): Allowed modules.
+
+    Returns:
+        bool: Whether the module is allowed.
+    """
+    return any(module == name or module.startswith(f"{name}.") for name in allowed_modules)
+
+
+def _check_reference(tag: str, path: str, allowed_modules: tuple[str, ...]):
+    """
+    Check that the class or function referenced by the serialized data can be restored.
+
+    Classes are restored from the allowed modules, builtins and `ALLOWED_DATA_TYPES`, functions only from
+    the allowed modules. The referenced object is checked, not the path, as the path may reach other modules
+    through attributes.
+
+    Args:
+        tag (str): jsonpickle tag of the reference.
+        path (str): Import path of the class or function.
+        allowed_modules (tuple[str, ...]): Modules classes and functions can be restored from.
+
+    Raises:
+        ValueError: If the reference is not allowed.
+    """
+    is_allowed = False
+    # modules are imported only when the path is allowed, as importing may run code
+    if path.startswith("builtins.") or path in ALLOWED_DATA_TYPES or _is_allowed_module(path, allowed_modules):
+        obj = loadclass(path)
+        module = getattr(obj, "__module__", None) or ""
+        if tag == tags.FUNCTION:
+            is_allowed = callable(obj) and _is_allowed_module(module, allowed_modules)
+        elif isinstance(obj, type):
+            is_allowed = (
+                (module == "builtins" and getattr(builtins, obj.__qualname__, None) is obj)
+                or f"{module}.{obj.__qualname__}" in ALLOWED_DATA_TYPES
+                or _is_allowed_module(module, allowed_modules)
+            )
+
+    if not is_allowed:
+        raise ValueError(f"Restoring '{path}' is not allowed.")
+
+
+def restricted_decode(message: str | bytes, allowed_modules: tuple[str, ...] = DEFAULT_ALLOWED_MODULES) -> Any:
+    """
+    Decode jsonpickle message, restoring only classes and functions of the allowed modules.
+
+    Args:
+        message (str | bytes): Serialized message.
+        allowed_modules (tuple[str, ...], optional): Modules classes and functions can be restored from.
+            Defaults to DEFAULT_ALLOWED_MODULES.
+
+    Returns:
+        Any: Decoded message.
+
+    Raises:
+        ValueError: If the message references not allowed classes or functions.
+    """
+    data = json.loads(message)
+    checked = set()
+    values = [data]
+    while values:
+        value = values.pop()
+        if isinstance(value, list):
+            values.extend(value)
+        elif isinstance(value, dict):
+            if tags.REPR in value:
+                raise ValueError("Restoring objects from repr is not allowed.")
+            for tag in (tags.OBJECT, tags.TYPE, tags.FUNCTION):
+                if tag in value and (reference := (tag, str(value[tag]))) not in checked:
+                    _check_reference(*reference, allowed_modules)
+                    checked.add(reference)
+            values.extend(value.values())
+    return Unpickler(safe=True).restore(data)
@@ -2,11 +2,12 @@ import base64
 from datetime import date, datetime
 from enum import Enum
 from io import BytesIO
+from itertools import islice
 from json import JSONEncoder, loads
-from typing import Any
+from typing import Any, Callable, NamedTuple
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, PydanticUserError, RootModel
+from pydantic import BaseModel, PydanticUserError, TypeAdapter
 
 
 def generate_uuid() -> str:
@@ -96,55 +97,140 @@ class JsonWorkflowEncoder(JSONEncoder):
         return JSONEncoder.default(self, obj)
 
 
-def format_value(value: Any, skip_format_types: set = None, force_format_types: set = None, **kwargs) -> Any:
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+_FORMATTERS: dict[type, Callable[..., Any]] = {}
+
+
+class _FormatOptions(NamedTuple):
+    skip: tuple[type, ...]
+    force: tuple[type, ...]
+    copy: bool
+    memo: dict[int, tuple[Any, Any]] | None
+
+
+def format_value(
+    value: Any,
+    skip_format_types: set = None,
+    force_format_types: set = None,
+    copy: bool = True,
+    memo: dict | None = None,
+    **kwargs,
+) -> Any:
     """Format a value for serialization.
 
+    Formatters are resolved once per value type and cached, scalars are returned as is.
+
     Args:
         value (Any): The value to format.
         skip_format_types (set, optional): Types to skip formatting.
         force_format_types (set, optional): Types to force formatting.
+        copy (bool): Whether containers are always copied. If False, containers with nothing to format
+            are returned unchanged, so the result may share structure with the value.
+        memo (dict | None): Formatted containers by identity, shared between calls with the same options to
+            format containers referenced from several values once. Results then share formatted containers.
         **kwargs: Additional keyword arguments.
 
     Returns:
         Any: Formatted value.
     """
-    from dynamiq.nodes.tools.python import PythonInputSchema
-    from dynamiq.runnables import RunnableResult
+    if type(value) in _SCALAR_TYPES:
+        return value
+    skip = tuple(skip_format_types) if skip_format_types else ()
+    force = tuple(force_format_types) if force_format_types else ()
+    return _format_value(value, _FormatOptions(skip, force, copy, memo), kwargs)
 
-    if skip_format_types is None:
-        skip_format_types = set()
-    if force_format_types is None:
-        force_format_types = set()
 
-    if not isinstance(value, tuple(force_format_types)) and isinstance(
-        value, tuple(skip_format_types)
-    ):
+def _format_value(value: Any, options: _FormatOptions, kwargs: dict) -> Any:
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES:
         return value
+    if options.skip and isinstance(value, options.skip) and not (options.force and isinstance(value, options.force)):
+        return value
+
+    formatter = _FORMATTERS.get(value_type)
+    if formatter is None:
+        formatter = _FORMATTERS[value_type] = _resolve_formatter(value)
+    return formatter(value, options, kwargs)
+
+
+def _memoized(format_container: Callable[..., Any]) -> Callable[..., Any]:
+    """Look up and store formatted containers in the memo of the options, if any."""
+
+    def wrapper(value: Any, options: _FormatOptions, kwargs: dict) -> Any:
+        if options.memo is None:
+            return format_container(value, options, kwargs)
+        if (cached := options.memo.get(id(value))) is not None:
+            return cached[1]
+        formatted = format_container(value, options, kwargs)
+        # the value is kept alive with the result, so its id is not reused while the memo exists
+        options.memo[id(value)] = (value, formatted)
+        return formatted
+
+    return wrapper
+
+
+@_memoized
+def _format_dict(value: dict, options: _FormatOptions, kwargs: dict) -> dict:
+    if options.copy:
+        return {k: v if type(v) in _SCALAR_TYPES else _format_value(v, options, {}) for k, v in value.items()}
+
+    formatted = None
+    for k, v in value.items():
+        if type(v) in _SCALAR_TYPES:
+            continue
+        formatted_v = _format_value(v, options, {})
+        if formatted_v is not v:
+            if formatted is None:
+                formatted = dict(value)
+            formatted[k] = formatted_v
+    return value if formatted is None else formatted
+
+
+@_memoized
+def _format_collection(value: list | tuple | set, options: _FormatOptions, kwargs: dict) -> Any:
+    if options.copy:
+        return type(value)(v if type(v) in _SCALAR_TYPES else _format_value(v, options, {}) for v in value)
+
+    formatted = None
+    for i, v in enumerate(value):
+        formatted_v = v if type(v) in _SCALAR_TYPES else _format_value(v, options, {})
+        if formatted is not None:
+            formatted.append(formatted_v)
+        elif formatted_v is not v:
+            formatted = [*islice(value, i), formatted_v]
+    return value if formatted is None else type(value)(formatted)
+
+
+def _resolve_formatter(value: Any) -> Callable[..., Any]:
+    """Resolve the formatter for the type of the value, called once per type."""
+    from dynamiq.nodes.tools.python import PythonInputSchema
+    from dynamiq.runnables import RunnableResult
 
     if isinstance(value, BytesIO):
-        return getattr(value, "name", None) or encode_bytes(value.getvalue())
+        return lambda v, *_: getattr(v, "name", None) or encode_bytes(v.getvalue())
     if isinstance(value, bytes):
-        return encode_bytes(value)
+        return lambda v, *_: encode_bytes(v)
     if isinstance(value, dict):
-        return {
-            k: format_value(v, skip_format_types, force_format_types)
-            for k, v in value.items()
-        }
+        return _format_dict
     if isinstance(value, (list, tuple, set)):
-        return type(value)(
-            format_value(v, skip_format_types, force_format_types) for v in value
-        )
+        return _format_collection
     if isinstance(value, (RunnableResult, PythonInputSchema)):
-        return value.to_dict(skip_format_types=skip_format_types, force_format_types=force_format_types)
+        return lambda v, options, _: v.to_dict(
+            skip_format_types=options.skip, force_format_types=options.force, copy=options.copy, memo=options.memo
+        )
     if isinstance(value, BaseModel):
-        return value.to_dict() if hasattr(value, "to_dict") else value.model_dump()
+        return lambda v, *_: v.to_dict() if hasattr(v, "to_dict") else v.model_dump()
     if isinstance(value, Exception):
-        recoverable = bool(kwargs.get("recoverable"))
-        return {"content": f"{str(value)}", "error_type": type(value).__name__, "recoverable": recoverable}
+        return lambda v, options, kwargs: {
+            "content": f"{str(v)}",
+            "error_type": type(v).__name__,
+            "recoverable": bool(kwargs.get("recoverable")),
+        }
     if callable(value):
-        return f"func: {getattr(value, '__name__', str(value))}"
+        return lambda v, *_: f"func: {getattr(v, '__name__', str(v))}"
 
     try:
-        return RootModel[type(value)](value).model_dump()
+        adapter = TypeAdapter(type(value))
     except PydanticUserError:
-        return str(value)
+        return lambda v, *_: str(v)
+    return lambda v, *_: adapter.dump_python(v)
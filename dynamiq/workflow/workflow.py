@@ -1,9 +1,9 @@
 import typing
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable, Generator, Iterable
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from dynamiq.connections.managers import ConnectionManager
 from dynamiq.flows import BaseFlow, Flow
@@ -27,6 +27,13 @@ class Workflow(BaseModel, Runnable):
     flow: BaseFlow = Flow()
     version: str | None = None
 
+    _serialized: tuple[dict, dict] | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in self.model_fields:
+            self._serialized = None
+
     def __enter__(self):
         return self
 
@@ -93,10 +100,8 @@ class Workflow(BaseModel, Runnable):
             logger.error(f"Failed to load workflow from YAML. {e}")
             raise
 
-    def run(
-        self, input_data: Any, config: RunnableConfig = None, **kwargs
-    ) -> RunnableResult:
-        """Run the workflow with given input data and configuration.
+    def _start_run(self, input_data: Any, config: RunnableConfig = None, **kwargs) -> tuple[dict, datetime]:
+        """Run workflow start callbacks.
 
         Args:
             input_data (Any): Input data for the workflow.
@@ -104,7 +109,7 @@ class Workflow(BaseModel, Runnable):
             **kwargs: Additional keyword arguments.
 
         Returns:
-            RunnableResult: Result of the workflow execution.
+            tuple[dict, datetime]: Keyword arguments of the run and its start time.
         """
         run_id = uuid4()
         logger.info(f"Workflow {self.id}: execution started.")
@@ -112,16 +117,35 @@ class Workflow(BaseModel, Runnable):
         # update kwargs with run_id
         merged_kwargs = merge(kwargs, {"run_id": run_id, "wf_run_id": getattr(config, "run_id", None)})
         self.run_on_workflow_start(input_data, config, **merged_kwargs)
-        time_start = datetime.now()
+        return merged_kwargs, datetime.now()
 
-        result = self.flow.run(input_data, config, **merge(merged_kwargs, {"parent_run_id": run_id}))
+    def _finish_run(
+        self,
+        input_data: Any,
+        result: RunnableResult,
+        config: RunnableConfig,
+        run_kwargs: dict,
+        time_start: datetime,
+    ) -> RunnableResult:
+        """Run workflow end or error callbacks depending on the flow result.
+
+        Args:
+            input_data (Any): Input data for the workflow.
+            result (RunnableResult): Result of the flow execution.
+            config (RunnableConfig): Configuration for the run.
+            run_kwargs (dict): Keyword arguments of the run.
+            time_start (datetime): Start time of the run.
+
+        Returns:
+            RunnableResult: Result of the workflow execution.
+        """
         if result.status == RunnableStatus.SUCCESS:
-            self.run_on_workflow_end(result.output, config, **merged_kwargs)
+            self.run_on_workflow_end(result.output, config, **run_kwargs)
             logger.info(
                 f"Workflow {self.id}: execution succeeded in {format_duration(time_start, datetime.now())}."
             )
         else:
-            self.run_on_workflow_error(result.output, config, **merged_kwargs)
+            self.run_on_workflow_error(result.output, config, **run_kwargs)
             logger.error(
                 f"Workflow {self.id}: execution failed in {format_duration(time_start, datetime.now())}."
             )
@@ -130,6 +154,185 @@ class Workflow(BaseModel, Runnable):
             status=result.status, input=input_data, output=result.output
         )
 
+    def run(
+        self, input_data: Any, config: RunnableConfig = None, **kwargs
+    ) -> RunnableResult:
+        """Run the workflow with given input data and configuration.
+
+        Args:
+            input_data (Any): Input data for the workflow.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result of the workflow execution.
+        """
+        merged_kwargs, time_start = self._start_run(input_data, config, **kwargs)
+        result = self.flow.run(input_data, config, **merge(merged_kwargs, {"parent_run_id": merged_kwargs["run_id"]}))
+        return self._finish_run(input_data, result, config, merged_kwargs, time_start)
+
+    def run_iter(
+        self, input_data: Any, config: RunnableConfig = None, **kwargs
+    ) -> Generator[tuple[str, RunnableResult], None, RunnableResult]:
+        """Run the workflow yielding result of each node as soon as the node completes.
+
+        Args:
+            input_data (Any): Input data for the workflow.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Yields:
+            tuple[str, RunnableResult]: Node id and result of the completed node.
+
+        Returns:
+            RunnableResult: Result of the workflow execution.
+
+        Raises:
+            ValueError: If the flow does not support iterating over node results.
+        """
+        if not isinstance(self.flow, Flow):
+            raise ValueError(f"Workflow {self.id}: flow does not support iterating over node results.")
+
+        merged_kwargs, time_start = self._start_run(input_data, config, **kwargs)
+        try:
+            result = yield from self.flow.run_iter(
+                input_data, config, **merge(merged_kwargs, {"parent_run_id": merged_kwargs["run_id"]})
+            )
+        except GeneratorExit:
+            self._finish_run(
+                input_data, RunnableResult(status=RunnableStatus.FAILURE), config, merged_kwargs, time_start
+            )
+            raise
+        return self._finish_run(input_data, result, config, merged_kwargs, time_start)
+
+    async def arun(self, input_data: Any, config: RunnableConfig = None, **kwargs) -> RunnableResult:
+        """Asynchronously run the workflow on the running event loop.
+
+        Args:
+            input_data (Any): Input data for the workflow.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result of the workflow execution.
+        """
+        merged_kwargs, time_start = self._start_run(input_data, config, **kwargs)
+        result = await self.flow.arun(
+            input_data, config, **merge(merged_kwargs, {"parent_run_id": merged_kwargs["run_id"]})
+        )
+        return self._finish_run(input_data, result, config, merged_kwargs, time_start)
+
+    def resume(self, checkpoint_id: str, config: RunnableConfig = None, **kwargs) -> RunnableResult:
+        """Resume the checkpointed workflow run, executing only nodes that did not complete successfully.
+
+        Args:
+            checkpoint_id (str): Identifier the run was checkpointed under, the run id of its config by default.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result of the workflow execution.
+
+        Raises:
+            ValueError: If the flow does not support checkpoints or the checkpoint can not be loaded.
+        """
+        if not isinstance(self.flow, Flow):
+            raise ValueError(f"Workflow {self.id}: flow does not support resuming from checkpoints.")
+
+        input_data = self.flow.get_checkpoint(checkpoint_id).input_data
+        merged_kwargs, time_start = self._start_run(input_data, config, **kwargs)
+        result = self.flow.resume(
+            checkpoint_id, config, **merge(merged_kwargs, {"parent_run_id": merged_kwargs["run_id"]})
+        )
+        return self._finish_run(input_data, result, config, merged_kwargs, time_start)
+
+    def _get_batch_run_hooks(self, config: RunnableConfig = None, **kwargs) -> dict[str, Callable]:
+        """Build hooks running workflow callbacks around each flow run of a batch.
+
+        Args:
+            config (RunnableConfig, optional): Configuration for the runs. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            dict[str, Callable]: `on_run_start` and `on_run_end` hooks of the flow batch execution.
+        """
+        batch_runs = {}
+
+        def on_run_start(input_data: Any) -> dict:
+            merged_kwargs, time_start = self._start_run(input_data, config, **kwargs)
+            run_id = merged_kwargs["run_id"]
+            batch_runs[run_id] = (input_data, merged_kwargs, time_start)
+            return merge(merged_kwargs, {"parent_run_id": run_id})
+
+        def on_run_end(result: RunnableResult, run_kwargs: dict) -> RunnableResult:
+            input_data, merged_kwargs, time_start = batch_runs.pop(run_kwargs["parent_run_id"])
+            return self._finish_run(input_data, result, config, merged_kwargs, time_start)
+
+        return {"on_run_start": on_run_start, "on_run_end": on_run_end}
+
+    def run_batch(
+        self,
+        inputs: Iterable[Any],
+        config: RunnableConfig = None,
+        max_concurrency: int | None = None,
+        **kwargs,
+    ) -> list[RunnableResult]:
+        """Run the workflow for many inputs concurrently.
+
+        Ready nodes of different inputs are scheduled on one shared pool instead of running
+        whole workflows one after another.
+
+        Args:
+            inputs (Iterable[Any]): Input data for each workflow run. Consumed lazily.
+            config (RunnableConfig, optional): Configuration shared by all runs. Defaults to None.
+            max_concurrency (int | None, optional): Maximum number of concurrently active runs. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            list[RunnableResult]: Results of the workflow runs in the order of inputs.
+        """
+        return self.flow.run_batch(
+            inputs, config, max_concurrency=max_concurrency, **self._get_batch_run_hooks(config, **kwargs)
+        )
+
+    async def arun_batch(
+        self,
+        inputs: Iterable[Any],
+        config: RunnableConfig = None,
+        max_concurrency: int | None = None,
+        **kwargs,
+    ) -> list[RunnableResult]:
+        """Asynchronously run the workflow for many inputs concurrently on the running event loop.
+
+        Args:
+            inputs (Iterable[Any]): Input data for each workflow run. Consumed lazily.
+            config (RunnableConfig, optional): Configuration shared by all runs. Defaults to None.
+            max_concurrency (int | None, optional): Maximum number of concurrently active runs. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            list[RunnableResult]: Results of the workflow runs in the order of inputs.
+        """
+        return await self.flow.arun_batch(
+            inputs, config, max_concurrency=max_concurrency, **self._get_batch_run_hooks(config, **kwargs)
+        )
+
+    def to_dict_snapshot(self) -> dict:
+        """Gets serialized workflow shared by all callbacks of all runs, created on first use.
+
+        The flow is taken from its snapshot, so the workflow snapshot is recreated after a field of the workflow
+        is assigned or the flow snapshot is recreated. It must not be modified.
+
+        Returns:
+            dict: A dictionary representation of the workflow.
+        """
+        flow_snapshot = self.flow.to_dict_snapshot()
+        if (serialized := self._serialized) is None or serialized[0] is not flow_snapshot:
+            data = self.model_dump(exclude={"flow"})
+            data["flow"] = flow_snapshot
+            serialized = self._serialized = (flow_snapshot, data)
+        return serialized[1]
+
     def run_on_workflow_start(self, input_data: Any, config: RunnableConfig = None, **kwargs: Any):
         """Run callbacks on workflow start.
 
@@ -139,8 +342,9 @@ class Workflow(BaseModel, Runnable):
             **kwargs: Additional keyword arguments.
         """
         if config and config.callbacks:
+            serialized = self.to_dict_snapshot()
             for callback in config.callbacks:
-                callback.on_workflow_start(self.model_dump(), input_data, **kwargs)
+                callback.on_workflow_start(serialized, input_data, **kwargs)
 
     def run_on_workflow_end(
         self, output: Any, config: RunnableConfig = None, **kwargs: Any
@@ -153,8 +357,9 @@ class Workflow(BaseModel, Runnable):
             **kwargs: Additional keyword arguments.
         """
         if config and config.callbacks:
+            serialized = self.to_dict_snapshot()
             for callback in config.callbacks:
-                callback.on_workflow_end(self.model_dump(), output, **kwargs)
+                callback.on_workflow_end(serialized, output, **kwargs)
 
     def run_on_workflow_error(
         self, error: BaseException, config: RunnableConfig = None, **kwargs: Any
@@ -167,5 +372,6 @@ class Workflow(BaseModel, Runnable):
             **kwargs: Additional keyword arguments.
         """
         if config and config.callbacks:
+            serialized = self.to_dict_snapshot()
             for callback in config.callbacks:
-                callback.on_workflow_error(self.model_dump(), error, **kwargs)
+                callback.on_workflow_error(serialized, error, **kwargs)
@@ -38,11 +38,11 @@ async def run_wf_async(
     streaming_handler: AsyncStreamingIteratorCallbackHandler,
     tracing_handler: TracingCallbackHandler,
 ):
-    asyncio.get_running_loop().run_in_executor(
-        None,
-        wf.run,
-        wf_input,
-        RunnableConfig(callbacks=[streaming_handler, tracing_handler]),
+    asyncio.create_task(
+        wf.arun(
+            wf_input,
+            RunnableConfig(callbacks=[streaming_handler, tracing_handler]),
+        )
     )
 
 
@@ -59,6 +59,26 @@ def mock_llm_executor(mocker, mock_llm_response_text):
     yield mock_llm
 
 
+@pytest.fixture
+def mock_llm_async_executor(mocker, mock_llm_response_text):
+    async def mock_completion_streaming_obj(mock_response):
+        for chunk in mock_response:
+            model_r = ModelResponse(stream=True)
+            model_r.choices[0].delta = Delta(**{"role": "assistant", "content": chunk})
+            yield model_r
+
+    async def response(stream: bool, *args, **kwargs):
+        if stream:
+            return mock_completion_streaming_obj(mock_response=mock_llm_response_text)
+
+        model_r = ModelResponse()
+        model_r["choices"][0]["message"]["content"] = mock_llm_response_text
+        return model_r
+
+    mock_llm = mocker.patch("dynamiq.nodes.llms.base.BaseLLM._acompletion", side_effect=response)
+    yield mock_llm
+
+
 @pytest.fixture
 def mock_embedding_executor(mocker):
     def response(*args, **kwargs):
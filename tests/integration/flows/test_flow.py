@@ -1,6 +1,9 @@
+import asyncio
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from typing import Any, Literal
 from unittest import mock
 from unittest.mock import ANY
 
@@ -9,7 +12,11 @@ import pytest
 from dynamiq import Workflow, flows
 from dynamiq.callbacks import TracingCallbackHandler
 from dynamiq.callbacks.tracing import RunStatus
-from dynamiq.nodes.node import NodeDependency
+from dynamiq.checkpoints import InMemoryCheckpointStore
+from dynamiq.executors.pool import HybridExecutor, ThreadExecutor
+from dynamiq.nodes import NodeGroup
+from dynamiq.nodes.node import InputTransformer, Node, NodeDependency
+from dynamiq.nodes.types import ExecutorAffinity
 from dynamiq.nodes.utils import Output
 from dynamiq.runnables import RunnableConfig, RunnableResult, RunnableStatus
 from dynamiq.utils import format_value
@@ -121,6 +128,7 @@ def test_workflow_with_depend_nodes_with_tracing(
             client=ANY,
             response_format=None,
             drop_params=True,
+            timeout=ANY,
         ),
         mock.call(
             tools=None,
@@ -138,6 +146,7 @@ def test_workflow_with_depend_nodes_with_tracing(
             api_key=anthropic_node_with_dependency.connection.api_key,
             response_format=None,
             drop_params=True,
+            timeout=ANY,
         ),
     ]
 
@@ -268,6 +277,7 @@ def test_workflow_with_depend_nodes_and_depend_fail(
             top_p=None,
             response_format=None,
             drop_params=True,
+            timeout=ANY,
         )
     ]
 
@@ -327,6 +337,23 @@ def test_workflow_with_depend_nodes_and_depend_fail(
     assert output_node_run.tags == []
 
 
+def test_workflow_skips_downstream_nodes_without_submitting_them(
+    wf, openai_node, anthropic_node_with_dependency, output_node, mock_llm_executor
+):
+    tracing = TracingCallbackHandler()
+    mock_llm_executor.side_effect = ValueError("Error")
+    run_node = ThreadExecutor.run_node
+
+    with mock.patch.object(ThreadExecutor, "run_node", autospec=True, side_effect=run_node) as mock_run_node:
+        response = wf.run(input_data={"a": 1}, config=RunnableConfig(callbacks=[tracing]))
+
+    assert [call.kwargs["ready_node"].node.id for call in mock_run_node.call_args_list] == [openai_node.id]
+    assert response.output[anthropic_node_with_dependency.id]["status"] == RunnableStatus.SKIP.value
+    assert response.output[output_node.id]["status"] == RunnableStatus.SKIP.value
+    skipped_runs = [run for run in tracing.runs.values() if run.status == RunStatus.SKIPPED]
+    assert len(skipped_runs) == 2
+
+
 def test_workflow_with_failed_flow(
     openai_node,
     mock_llm_response_text,
@@ -411,3 +438,286 @@ def test_workflow_with_input_mappings(
 
     assert response == RunnableResult(status=RunnableStatus.SUCCESS, input=input_data, output=expected_output)
     assert json.dumps({"runs": [run.to_dict() for run in tracing.runs.values()]}, cls=JsonWorkflowEncoder)
+
+
+def test_workflow_arun_with_depend_nodes(
+    wf,
+    openai_node,
+    anthropic_node_with_dependency,
+    output_node,
+    mock_llm_response_text,
+    mock_llm_executor,
+    mock_llm_async_executor,
+):
+    input_data = {"a": 1}
+    tracing = TracingCallbackHandler()
+
+    response = asyncio.run(wf.arun(input_data=input_data, config=RunnableConfig(callbacks=[tracing])))
+
+    expected_output_llm = {"content": mock_llm_response_text, "tool_calls": None}
+    expected_result_openai = RunnableResult(status=RunnableStatus.SUCCESS, input=input_data, output=expected_output_llm)
+    expected_input_anthropic = input_data | {openai_node.id: expected_result_openai.to_tracing_depend_dict()}
+    expected_result_anthropic = RunnableResult(
+        status=RunnableStatus.SUCCESS, input=expected_input_anthropic, output=expected_output_llm
+    )
+    expected_input_output = expected_input_anthropic | {
+        anthropic_node_with_dependency.id: expected_result_anthropic.to_tracing_depend_dict()
+    }
+    expected_result_output = RunnableResult(
+        status=RunnableStatus.SUCCESS, input=expected_input_output, output=expected_input_output
+    )
+    expected_output = {
+        openai_node.id: expected_result_openai.to_dict(skip_format_types={BytesIO, bytes}),
+        anthropic_node_with_dependency.id: expected_result_anthropic.to_dict(skip_format_types={BytesIO, bytes}),
+        output_node.id: expected_result_output.to_dict(skip_format_types={BytesIO, bytes}),
+    }
+
+    assert response == RunnableResult(status=RunnableStatus.SUCCESS, input=input_data, output=expected_output)
+    assert mock_llm_async_executor.call_count == 2
+    assert mock_llm_executor.call_count == 0
+
+    tracing_runs = list(tracing.runs.values())
+    assert len(tracing_runs) == 5
+    assert [run.status for run in tracing_runs] == [RunStatus.SUCCEEDED] * 5
+    assert tracing_runs[2].metadata.get("usage")
+
+
+def test_workflow_concurrent_runs_isolated(wf, output_node, mock_llm_executor):
+    inputs = [{"a": i} for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=len(inputs)) as pool:
+        responses = list(pool.map(lambda input_data: wf.run(input_data=input_data), inputs))
+
+    for input_data, response in zip(inputs, responses):
+        assert response.status == RunnableStatus.SUCCESS
+        assert response.input == input_data
+        assert response.output[output_node.id]["input"]["a"] == input_data["a"]
+    assert mock_llm_executor.call_count == 2 * len(inputs)
+
+
+def test_workflow_with_executor_pool_from_config(wf, output_node, mock_llm_executor):
+    input_data = {"a": 1}
+    executor_pool = ThreadPoolExecutor(max_workers=2)
+
+    with mock.patch.object(executor_pool, "submit", wraps=executor_pool.submit) as mock_submit:
+        response = wf.run(input_data=input_data, config=RunnableConfig(executor_pool=executor_pool))
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[output_node.id]["status"] == RunnableStatus.SUCCESS.value
+    assert mock_submit.call_count == 3
+    assert executor_pool.submit(lambda: 1).result() == 1
+    executor_pool.shutdown()
+
+
+def test_workflow_run_batch(wf, openai_node, output_node, mock_llm_executor):
+    inputs = [{"a": i} for i in range(5)]
+    tracing = TracingCallbackHandler()
+
+    responses = wf.run_batch(inputs, config=RunnableConfig(callbacks=[tracing]), max_concurrency=2)
+
+    assert len(responses) == len(inputs)
+    for input_data, response in zip(inputs, responses):
+        assert response.status == RunnableStatus.SUCCESS
+        assert response.input == input_data
+        assert response.output[output_node.id]["input"]["a"] == input_data["a"]
+    assert mock_llm_executor.call_count == 2 * len(inputs)
+
+    tracing_runs = list(tracing.runs.values())
+    assert len(tracing_runs) == 5 * len(inputs)
+    assert all(run.status == RunStatus.SUCCEEDED for run in tracing_runs)
+    wf_runs = [run for run in tracing_runs if run.parent_run_id is None]
+    assert len(wf_runs) == len(inputs)
+    openai_runs = [run for run in tracing_runs if run.metadata.get("node", {}).get("id") == openai_node.id]
+    assert len({run.trace_id for run in openai_runs}) == 1
+    assert len({run.parent_run_id for run in openai_runs}) == len(inputs)
+
+
+def test_workflow_arun_batch(wf, output_node, mock_llm_async_executor):
+    inputs = [{"a": i} for i in range(5)]
+
+    responses = asyncio.run(wf.arun_batch(inputs, max_concurrency=2))
+
+    assert [response.status for response in responses] == [RunnableStatus.SUCCESS] * len(inputs)
+    assert [response.output[output_node.id]["input"]["a"] for response in responses] == list(range(len(inputs)))
+    assert mock_llm_async_executor.call_count == 2 * len(inputs)
+
+
+def test_workflow_resume_from_checkpoint(
+    wf, openai_node, anthropic_node_with_dependency, output_node, mock_llm_executor, mock_llm_response_text
+):
+    checkpoint_store = InMemoryCheckpointStore()
+    wf.flow.checkpoint_store = checkpoint_store
+    completion = mock_llm_executor.side_effect
+    mock_llm_executor.side_effect = [completion(stream=False), ValueError("LLM unavailable")]
+    input_data = {"a": 1}
+    config = RunnableConfig(callbacks=[])
+
+    response = wf.run(input_data=input_data, config=config)
+
+    assert response.output[anthropic_node_with_dependency.id]["status"] == RunnableStatus.FAILURE.value
+    checkpoint = checkpoint_store.load(config.run_id)
+    assert checkpoint.results[openai_node.id].status == RunnableStatus.SUCCESS
+    assert anthropic_node_with_dependency.id not in checkpoint.results
+    assert checkpoint.input_data == input_data
+
+    mock_llm_executor.side_effect = completion
+    response = wf.resume(config.run_id)
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.input == input_data
+    assert response.output[openai_node.id]["output"]["content"] == mock_llm_response_text
+    assert response.output[anthropic_node_with_dependency.id]["status"] == RunnableStatus.SUCCESS.value
+    assert response.output[output_node.id]["status"] == RunnableStatus.SUCCESS.value
+    assert mock_llm_executor.call_count == 3
+    assert checkpoint_store.load(config.run_id) is None
+
+
+def test_workflow_incremental_reuses_unchanged_nodes(wf, openai_node, output_node, mock_llm_executor):
+    wf.flow.incremental = True
+
+    response = wf.run(input_data={"a": 1})
+    response_unchanged = wf.run(input_data={"a": 1})
+
+    assert response_unchanged.status == RunnableStatus.SUCCESS
+    assert response_unchanged.output == response.output
+    assert mock_llm_executor.call_count == 2
+
+    prompt = openai_node.prompt.model_copy(deep=True)
+    prompt.messages[0].content += " Be brief."
+    openai_node.prompt = prompt
+    response_changed = wf.run(input_data={"a": 1})
+
+    assert response_changed.output[output_node.id]["status"] == RunnableStatus.SUCCESS.value
+    assert mock_llm_executor.call_count == 3
+
+    response_new_input = wf.run(input_data={"a": 2})
+
+    assert response_new_input.output[output_node.id]["input"]["a"] == 2
+    assert mock_llm_executor.call_count == 5
+
+
+def test_workflow_incremental_fingerprints_resolved_node_input(mocker):
+    first_node = Output(id="first")
+    selecting_node = Output(
+        id="selecting",
+        depends=[NodeDependency(first_node)],
+        input_transformer=InputTransformer(selector={"a": "$.a"}),
+    )
+    wf = Workflow(flow=flows.Flow(nodes=[first_node, selecting_node], incremental=True))
+    run = mocker.spy(Output, "run")
+    to_dict = mocker.spy(Output, "to_dict")
+
+    wf.run(input_data={"a": 1, "b": 1})
+    wf.run(input_data={"a": 1, "b": 2})
+    # input without stable representation is never fingerprinted
+    response = wf.run(input_data={"a": 1, "b": 2, "value": object()})
+
+    assert [call.args[0].id for call in run.call_args_list] == ["first", "selecting", "first", "first"]
+    assert response.status == RunnableStatus.SUCCESS
+    # node definitions are serialized once and reused across runs
+    assert to_dict.call_count == 2
+
+
+@pytest.mark.parametrize("executor", [ThreadExecutor, HybridExecutor])
+def test_workflow_incremental_transforms_node_input_once(mocker, executor):
+    first_node = Output(id="first")
+    selecting_node = Output(
+        id="selecting",
+        depends=[NodeDependency(first_node)],
+        input_transformer=InputTransformer(selector={"a": "$.a"}),
+    )
+    wf = Workflow(flow=flows.Flow(nodes=[first_node, selecting_node], incremental=True, executor=executor))
+    transform_input = mocker.spy(Output, "transform_input")
+
+    response = wf.run(input_data={"a": 1, "b": 1})
+
+    assert response.output[selecting_node.id]["input"] == {"a": 1}
+    assert [call.args[0].id for call in transform_input.call_args_list] == ["first", "selecting"]
+
+
+def test_workflow_run_iter_yields_node_results(
+    wf, openai_node, anthropic_node_with_dependency, output_node, mock_llm_executor, mock_llm_response_text
+):
+    run_iter = wf.run_iter(input_data={"a": 1})
+    node_results = []
+    while True:
+        try:
+            node_results.append(next(run_iter))
+        except StopIteration as e:
+            response = e.value
+            break
+
+    node_ids = [node_id for node_id, _ in node_results]
+    assert node_ids == [openai_node.id, anthropic_node_with_dependency.id, output_node.id]
+    assert node_results[0][1].status == RunnableStatus.SUCCESS
+    assert node_results[0][1].output["content"] == mock_llm_response_text
+    assert response.status == RunnableStatus.SUCCESS
+    assert set(response.output) == {openai_node.id, anthropic_node_with_dependency.id, output_node.id}
+
+
+def test_workflow_run_iter_closed_early_stops_run(wf, openai_node, mock_llm_executor):
+    tracing = TracingCallbackHandler()
+    run_iter = wf.run_iter(input_data={"a": 1}, config=RunnableConfig(callbacks=[tracing]))
+
+    node_id, _ = next(run_iter)
+    run_iter.close()
+
+    assert node_id == openai_node.id
+    assert mock_llm_executor.call_count == 1
+    wf_run = next(run for run in tracing.runs.values() if run.parent_run_id is None)
+    assert wf_run.status == RunStatus.FAILED
+
+
+def test_workflow_with_hybrid_executor(openai_node, mock_llm_response_text, mock_llm_async_executor):
+    openai_node.executor_affinity = ExecutorAffinity.ASYNC
+    process_node = Output(id="process", executor_affinity=ExecutorAffinity.PROCESS)
+    thread_node = Output(id="thread", depends=[NodeDependency(openai_node), NodeDependency(process_node)])
+    wf = Workflow(flow=flows.Flow(nodes=[openai_node, process_node, thread_node], executor=HybridExecutor))
+    input_data = {"a": 1}
+
+    response = wf.run(input_data=input_data)
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[openai_node.id]["output"]["content"] == mock_llm_response_text
+    assert response.output[process_node.id]["output"] == input_data
+    assert response.output[thread_node.id]["status"] == RunnableStatus.SUCCESS.value
+    assert mock_llm_async_executor.call_count == 1
+
+
+class AsyncSleepNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    name: str = "AsyncSleep"
+    sleep_seconds: float = 0
+    cancelled: bool = False
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        return {}
+
+    async def aexecute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        try:
+            await asyncio.sleep(self.sleep_seconds)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return {}
+
+
+class FailingCheckpointStore(InMemoryCheckpointStore):
+    def save_result(self, *args, **kwargs):
+        raise ValueError("Store unavailable")
+
+
+def test_flow_arun_failure_cancels_running_nodes():
+    slow_node = AsyncSleepNode(sleep_seconds=5)
+    flow = flows.Flow(nodes=[AsyncSleepNode(), slow_node], checkpoint_store=FailingCheckpointStore())
+
+    async def run():
+        result = await flow.arun(input_data={})
+        await asyncio.sleep(0)
+        # checked before the event loop closes and cancels tasks left running
+        return result, slow_node.cancelled
+
+    result, cancelled = asyncio.run(run())
+
+    assert result.status == RunnableStatus.FAILURE
+    assert cancelled
@@ -0,0 +1,73 @@
+import time
+from typing import Any, Literal
+
+from dynamiq import Workflow, flows
+from dynamiq.nodes import ErrorHandling, NodeGroup
+from dynamiq.nodes.node import Node, NodeDependency
+from dynamiq.runnables import RunnableConfig, RunnableStatus
+
+
+class SleepNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    name: str = "Sleep"
+    sleep_seconds: float = 0
+    fail: bool = False
+    attempts: int = 0
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        self.attempts += 1
+        if config.cancellation_token.wait(timeout=self.sleep_seconds) or self.fail:
+            raise ValueError("Error")
+        return {"remaining": config.cancellation_token.remaining}
+
+
+def test_workflow_latency_budget_caps_node_timeout():
+    slow_node = SleepNode(sleep_seconds=5, cost_hint=1)
+    next_node = SleepNode(depends=[NodeDependency(slow_node)], cost_hint=7)
+    wf = Workflow(flow=flows.Flow(nodes=[slow_node, next_node]))
+    time_start = time.monotonic()
+
+    response = wf.run(input_data={}, config=RunnableConfig(latency_budget=2))
+
+    assert time.monotonic() - time_start < 1.5
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[slow_node.id]["status"] == RunnableStatus.FAILURE.value
+    assert response.output[next_node.id]["status"] == RunnableStatus.SKIP.value
+
+
+def test_workflow_latency_budget_divided_across_remaining_nodes():
+    first_node = SleepNode(cost_hint=1)
+    last_node = SleepNode(depends=[NodeDependency(first_node)], cost_hint=3)
+    wf = Workflow(flow=flows.Flow(nodes=[first_node, last_node]))
+
+    response = wf.run(input_data={}, config=RunnableConfig(latency_budget=10))
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[first_node.id]["output"]["remaining"] <= 2.5
+    assert 2.5 < response.output[last_node.id]["output"]["remaining"] <= 10
+
+
+def test_workflow_latency_budget_caps_retries():
+    node = SleepNode(
+        fail=True, error_handling=ErrorHandling(max_retries=3, retry_interval_seconds=10, timeout_seconds=60)
+    )
+    wf = Workflow(flow=flows.Flow(nodes=[node]))
+    time_start = time.monotonic()
+
+    response = wf.run(input_data={}, config=RunnableConfig(latency_budget=1))
+
+    assert time.monotonic() - time_start < 2
+    assert response.output[node.id]["status"] == RunnableStatus.FAILURE.value
+    assert node.attempts == 1
+
+
+def test_workflow_latency_budget_share_starts_with_node_execution():
+    first_nodes = [SleepNode(sleep_seconds=1, cost_hint=1) for _ in range(2)]
+    last_nodes = [SleepNode(depends=[NodeDependency(node)], cost_hint=3) for node in first_nodes]
+    wf = Workflow(flow=flows.Flow(nodes=first_nodes + last_nodes))
+
+    response = wf.run(input_data={}, config=RunnableConfig(latency_budget=20, max_node_workers=1))
+
+    assert response.status == RunnableStatus.SUCCESS
+    # the node waiting for the in-flight slot gets its share of the time left when it starts
+    assert all(response.output[node.id]["output"]["remaining"] > 3.5 for node in first_nodes)
@@ -0,0 +1,100 @@
+import asyncio
+import weakref
+from typing import Any, ClassVar, Literal
+
+import pytest
+from pydantic import BaseModel
+
+from dynamiq import Workflow, flows
+from dynamiq.nodes import NodeGroup
+from dynamiq.nodes.node import Node, NodeDependency
+from dynamiq.runnables import RunnableConfig, RunnableStatus
+
+
+class Payload(BaseModel):
+    data: bytes
+
+
+class PayloadNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    name: str = "Payload"
+    payload_refs: ClassVar[list[weakref.ref]] = []
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        alive = sum(ref() is not None for ref in self.payload_refs)
+        payload = Payload(data=b"0" * 1024)
+        self.payload_refs.append(weakref.ref(payload))
+        return {"payload": payload, "alive": alive}
+
+
+@pytest.fixture
+def chain():
+    PayloadNode.payload_refs = []
+    nodes = [PayloadNode()]
+    for _ in range(4):
+        nodes.append(PayloadNode(depends=[NodeDependency(nodes[-1])]))
+    return nodes
+
+
+def test_workflow_keeps_sink_outputs_and_releases_consumed_outputs(chain):
+    wf = Workflow(flow=flows.Flow(nodes=chain, keep_outputs="sinks"))
+
+    response = wf.run(input_data={})
+
+    assert response.status == RunnableStatus.SUCCESS
+    # the dependency result holds its payload and the payload of its own dependency in its input
+    assert response.output[chain[-1].id]["output"]["alive"] == 2
+    assert response.output[chain[-1].id]["input"][chain[-2].id]["output"]["payload"] == {"data": b"0" * 1024}
+    for node in chain[:-1]:
+        assert response.output[node.id] == {"status": RunnableStatus.SUCCESS.value, "input": None, "output": None}
+
+
+def test_workflow_arun_releases_consumed_outputs(chain):
+    wf = Workflow(flow=flows.Flow(nodes=chain, keep_outputs="sinks"))
+
+    response = asyncio.run(wf.arun(input_data={}))
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[chain[-1].id]["output"]["alive"] == 2
+    for node in chain[:-1]:
+        assert response.output[node.id] == {"status": RunnableStatus.SUCCESS.value, "input": None, "output": None}
+
+
+def test_flow_run_batch_releases_consumed_outputs(chain):
+    flow = flows.Flow(nodes=chain, keep_outputs="sinks")
+
+    results = flow.run_batch([{}])
+
+    assert results[0].output[chain[-1].id]["output"]["alive"] == 2
+
+
+def test_workflow_keeps_listed_outputs(chain):
+    wf = Workflow(flow=flows.Flow(nodes=chain, keep_outputs=[chain[0].id]))
+
+    response = wf.run(input_data={})
+
+    assert response.output[chain[0].id]["output"]["payload"] == {"data": b"0" * 1024}
+    assert [response.output[node.id]["output"] for node in chain[1:]] == [None] * (len(chain) - 1)
+    assert all(response.output[node.id]["status"] == RunnableStatus.SUCCESS.value for node in chain)
+
+
+def test_workflow_keeps_all_outputs_by_default(chain):
+    wf = Workflow(flow=flows.Flow(nodes=chain))
+
+    response = wf.run(input_data={})
+
+    assert response.output[chain[-1].id]["output"]["alive"] == len(chain) - 1
+    assert all(response.output[node.id]["output"]["payload"] for node in chain)
+
+
+def test_flow_run_iter_yields_released_results(chain):
+    flow = flows.Flow(nodes=chain, keep_outputs="sinks")
+
+    results = dict(flow.run_iter(input_data={}))
+
+    assert all(results[node.id].output["payload"] for node in chain)
+
+
+def test_flow_keep_outputs_with_unknown_node_ids():
+    with pytest.raises(ValueError, match="keep_outputs"):
+        flows.Flow(nodes=[PayloadNode()], keep_outputs=["unknown"])
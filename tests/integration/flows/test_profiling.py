@@ -0,0 +1,88 @@
+import json
+from typing import Any, Literal
+
+from dynamiq import Workflow, flows
+from dynamiq.callbacks import ProfilingCallbackHandler
+from dynamiq.nodes import NodeGroup
+from dynamiq.nodes.node import Node, NodeDependency
+from dynamiq.nodes.utils import Output, SubFlow
+from dynamiq.runnables import RunnableConfig, RunnableResult, RunnableStatus
+
+
+class FailingNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    name: str = "Failing"
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        raise ValueError("Error")
+
+
+def test_workflow_with_profiling_callback_records_node_phases():
+    first_node = Output()
+    subflow = SubFlow(flow=flows.Flow(nodes=[Output()]), depends=[NodeDependency(first_node)])
+    failing_node = FailingNode()
+    skipped_node = Output(depends=[NodeDependency(failing_node)])
+    profiling = ProfilingCallbackHandler()
+    config = RunnableConfig(callbacks=[profiling])
+    wf = Workflow(flow=flows.Flow(nodes=[first_node, subflow, failing_node]))
+
+    response = wf.run(input_data={"a": 1}, config=config)
+    assert response.status == RunnableStatus.SUCCESS
+    skipped_node.run(
+        input_data={}, config=config, depends_result={failing_node.id: RunnableResult(status=RunnableStatus.FAILURE)}
+    )
+
+    profiles = {profile.node_id: profile for profile in profiling.profiles.values()}
+    assert len(profiles) == 5
+    assert [phase[0] for phase in profiles[first_node.id].phases] == [
+        "validate_depends",
+        "transform_input",
+        "callbacks",
+        "cache_lookup",
+        "execute_with_retry",
+        "cache_store",
+        "transform_output",
+        "callbacks",
+    ]
+    assert [phase[0] for phase in profiles[failing_node.id].phases][-2:] == ["execute_with_retry", "callbacks"]
+    assert [phase[0] for phase in profiles[skipped_node.id].phases] == ["validate_depends", "callbacks"]
+    for profile in profiles.values():
+        assert all(prev[2] == phase[1] for prev, phase in zip(profile.phases, profile.phases[1:]))
+    assert set(profiling.get_phase_durations()) == {
+        "validate_depends",
+        "transform_input",
+        "callbacks",
+        "cache_lookup",
+        "execute_with_retry",
+        "cache_store",
+        "transform_output",
+    }
+
+
+def test_profiling_callback_exports_chrome_trace_and_speedscope(tmp_path):
+    first_node = Output()
+    subflow = SubFlow(flow=flows.Flow(nodes=[Output(), Output()]), depends=[NodeDependency(first_node)])
+    profiling = ProfilingCallbackHandler()
+    wf = Workflow(flow=flows.Flow(nodes=[first_node, subflow]))
+
+    wf.run(input_data={"a": 1}, config=RunnableConfig(callbacks=[profiling]))
+    chrome_path, speedscope_path = tmp_path / "trace.json", tmp_path / "profile.speedscope.json"
+    profiling.save(str(chrome_path))
+    profiling.save(str(speedscope_path), format="speedscope")
+
+    trace = json.loads(chrome_path.read_text())
+    node_events = [event for event in trace["traceEvents"] if event.get("cat") == "node"]
+    assert len(node_events) == 4
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in node_events)
+    assert any(event["ph"] == "M" for event in trace["traceEvents"])
+
+    speedscope = json.loads(speedscope_path.read_text())
+    frame_names = [frame["name"] for frame in speedscope["shared"]["frames"]]
+    assert {"SubFlow", "execute_with_retry"} <= set(frame_names)
+    for profile in speedscope["profiles"]:
+        depth, times = 0, [event["at"] for event in profile["events"]]
+        assert times == sorted(times)
+        for event in profile["events"]:
+            depth += 1 if event["type"] == "O" else -1
+            assert depth >= 0
+        assert depth == 0
@@ -0,0 +1,121 @@
+import threading
+from typing import Any, Literal
+
+import pytest
+from dynamiq import Workflow, flows
+from dynamiq.components.splitters.document import DocumentSplitBy
+from dynamiq.executors.streaming import NodeOutputStream
+from dynamiq.nodes import NodeGroup
+from dynamiq.nodes.node import Node, NodeDependency
+from dynamiq.nodes.splitters.document import DocumentSplitter
+from dynamiq.runnables import RunnableConfig, RunnableStatus
+from dynamiq.types import Document
+
+
+class DocumentCounter(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    name: str = "DocumentCounter"
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        return {"documents": input_data["documents"], "count": len(input_data["documents"])}
+
+
+class RecordingSplitter(DocumentSplitter):
+    first_chunk_received: Any = None
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        self.first_chunk_received.set()
+        return super().execute(input_data, config, **kwargs)
+
+
+class BlockingSplitter(DocumentSplitter):
+    first_chunk_consumed: Any = None
+
+    def split_stream_input(self, input_data: dict[str, Any]):
+        for index, chunk_input in enumerate(super().split_stream_input(input_data)):
+            if index == 1:
+                self.first_chunk_consumed.wait(timeout=5)
+            yield chunk_input
+
+
+def test_node_output_stream_is_bounded():
+    stream = NodeOutputStream(maxsize=1)
+    stream.put(1)
+    second_put_done = threading.Event()
+
+    def producer():
+        stream.put(2)
+        second_put_done.set()
+        stream.close()
+
+    threading.Thread(target=producer).start()
+
+    assert not second_put_done.wait(timeout=0.1)
+    assert list(stream) == [1, 2]
+    assert second_put_done.is_set()
+
+
+def test_workflow_with_stream_edges_pipelines_chunks(mocker):
+    consumed = threading.Event()
+    splitter = BlockingSplitter(split_by=DocumentSplitBy.WORD, split_length=1, first_chunk_consumed=consumed)
+    consumer = RecordingSplitter(
+        split_by=DocumentSplitBy.PASSAGE, depends=[NodeDependency(splitter, stream=True)], first_chunk_received=consumed
+    )
+    consumer.inputs(documents=splitter.outputs.documents)
+    wf = Workflow(flow=flows.Flow(nodes=[splitter, consumer], stream_buffer_size=1))
+    documents = [Document(content="a b"), Document(content="c d e")]
+    execute_with_retry = mocker.spy(DocumentSplitter, "execute_with_retry")
+
+    response = wf.run(input_data={"documents": documents})
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert consumed.is_set()
+    assert len(response.output[splitter.id]["output"]["documents"]) == 5
+    consumer_output = response.output[consumer.id]["output"]
+    assert [document["content"] for document in consumer_output["documents"]] == ["a ", "b", "c ", "d ", "e"]
+    # every input part is executed with retries, timeout and cache
+    assert execute_with_retry.call_count == len(documents) + len(consumer_output["documents"])
+
+
+def test_workflow_with_stream_edges_output_matches_regular_run():
+    def get_nodes(stream: bool):
+        splitter = DocumentSplitter(id="splitter", split_by=DocumentSplitBy.WORD, split_length=1)
+        consumer = DocumentSplitter(
+            id="consumer", split_by=DocumentSplitBy.PASSAGE, depends=[NodeDependency(splitter, stream=stream)]
+        )
+        consumer.inputs(documents=splitter.outputs.documents)
+        counter = DocumentCounter(id="counter", depends=[NodeDependency(consumer)])
+        counter.inputs(documents=consumer.outputs.documents)
+        return [splitter, consumer, counter]
+
+    input_data = {"documents": [Document(id="1", content="a b"), Document(id="2", content="c d e")]}
+
+    response = Workflow(flow=flows.Flow(nodes=get_nodes(stream=True))).run(input_data=input_data)
+    regular_response = Workflow(flow=flows.Flow(nodes=get_nodes(stream=False))).run(input_data=input_data)
+
+    def get_output(response, node_id):
+        output = response.output[node_id]["output"]
+        return output | {"documents": [document["content"] for document in output["documents"]]}
+
+    assert response.output["counter"]["output"]["count"] == 5
+    for node_id in ["splitter", "consumer", "counter"]:
+        assert get_output(response, node_id) == get_output(regular_response, node_id)
+
+
+def test_flow_stream_edge_requires_consumer_supporting_stream_input():
+    splitter = DocumentSplitter()
+
+    with pytest.raises(ValueError, match="does not support stream input"):
+        flows.Flow(nodes=[splitter, DocumentCounter(depends=[NodeDependency(splitter, stream=True)])])
+
+
+def test_workflow_with_stream_edges_skips_consumer_of_failed_node():
+    splitter = DocumentSplitter(split_by=DocumentSplitBy.WORD, split_length=1)
+    consumer = DocumentSplitter(depends=[NodeDependency(splitter, stream=True)])
+    consumer.inputs(documents=splitter.outputs.documents)
+    wf = Workflow(flow=flows.Flow(nodes=[splitter, consumer]))
+
+    response = wf.run(input_data={"documents": [Document(content="a b"), "not a document"]})
+
+    assert response.output[splitter.id]["status"] == RunnableStatus.FAILURE.value
+    assert response.output[consumer.id]["status"] == RunnableStatus.SKIP.value
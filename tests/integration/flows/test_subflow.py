@@ -0,0 +1,104 @@
+import threading
+import time
+from typing import Any, Literal
+
+from dynamiq import Workflow, flows
+from dynamiq.callbacks import TracingCallbackHandler
+from dynamiq.callbacks.tracing import RunType
+from dynamiq.nodes import NodeGroup
+from dynamiq.nodes.node import Node, NodeDependency
+from dynamiq.nodes.utils import Output, SubFlow
+from dynamiq.runnables import RunnableConfig, RunnableStatus
+
+
+class ConcurrencyCounter:
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.thread_names = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.thread_names.add(threading.current_thread().name)
+
+    def __exit__(self, *args):
+        with self._lock:
+            self.active -= 1
+
+
+class CountedNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    name: str = "Counted"
+    counter: Any = None
+    sleep_seconds: float = 0.1
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        with self.counter:
+            time.sleep(self.sleep_seconds)
+        return {"value": input_data["value"]}
+
+
+def test_workflow_with_subflow_runs_nested_nodes_within_parent_limit():
+    counter = ConcurrencyCounter()
+    nested_nodes = [CountedNode(counter=counter) for _ in range(3)]
+    subflow = SubFlow(flow=flows.Flow(nodes=nested_nodes))
+    sibling = CountedNode(counter=counter, sleep_seconds=0.3)
+    wf = Workflow(flow=flows.Flow(nodes=[subflow, sibling], max_node_workers=2))
+
+    response = wf.run(input_data={"value": 1})
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[subflow.id]["status"] == RunnableStatus.SUCCESS.value
+    subflow_output = response.output[subflow.id]["output"]
+    assert all(subflow_output[node.id]["output"] == {"value": 1} for node in nested_nodes)
+    assert counter.max_active == 2
+    assert all(name.startswith("dynamiq-nodes") for name in counter.thread_names)
+
+
+def test_workflow_with_subflow_lends_slot_to_nested_nodes():
+    counter = ConcurrencyCounter()
+    first_node = CountedNode(counter=counter)
+    second_node = CountedNode(counter=counter, depends=[NodeDependency(first_node)])
+    subflow = SubFlow(flow=flows.Flow(nodes=[first_node, second_node]))
+    output_node = Output(depends=[NodeDependency(subflow)])
+    tracing = TracingCallbackHandler()
+    wf = Workflow(flow=flows.Flow(nodes=[subflow, output_node], max_node_workers=1))
+
+    response = wf.run(input_data={"value": 1}, config=RunnableConfig(callbacks=[tracing]))
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[output_node.id]["status"] == RunnableStatus.SUCCESS.value
+    assert counter.max_active == 1
+
+    runs = list(tracing.runs.values())
+    subflow_run = next(run for run in runs if run.metadata.get("node", {}).get("id") == subflow.id)
+    nested_flow_run = next(run for run in runs if run.type == RunType.FLOW and run.parent_run_id == subflow_run.id)
+    nested_node_runs = [run for run in runs if run.parent_run_id == nested_flow_run.id]
+    assert {run.metadata["node"]["id"] for run in nested_node_runs} == {first_node.id, second_node.id}
+
+
+class NestedRunNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    name: str = "NestedRun"
+    flow: flows.Flow
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        result = self.flow.run(input_data=input_data, config=config)
+        return {"status": result.status.value}
+
+
+def test_workflow_with_node_running_flow_keeps_its_slot():
+    counter = ConcurrencyCounter()
+    nested_node = NestedRunNode(flow=flows.Flow(nodes=[CountedNode(counter=counter)]))
+    wf = Workflow(flow=flows.Flow(nodes=[nested_node], max_node_workers=1))
+    responses = []
+
+    thread = threading.Thread(target=lambda: responses.append(wf.run(input_data={"value": 1})), daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert responses[0].output[nested_node.id]["output"] == {"status": RunnableStatus.SUCCESS.value}
@@ -1,4 +1,5 @@
 import uuid
+from unittest.mock import ANY
 
 import pytest
 
@@ -88,4 +89,5 @@ def test_workflow_with_azure_llm(mock_llm_response_text, mock_llm_executor, mode
         api_key=connection.api_key,
         response_format=None,
         drop_params=True,
+        timeout=ANY,
     )
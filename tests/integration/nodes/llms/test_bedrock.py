@@ -1,4 +1,5 @@
 import uuid
+from unittest.mock import ANY
 
 import pytest
 
@@ -89,4 +90,5 @@ def test_workflow_with_bedrock_llm(mock_llm_response_text, mock_llm_executor, mo
         aws_region_name='us-east-1',
         response_format=None,
         drop_params=True,
+        timeout=ANY,
     )
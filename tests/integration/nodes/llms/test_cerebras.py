@@ -1,4 +1,5 @@
 import uuid
+from unittest.mock import ANY
 
 import pytest
 
@@ -84,4 +85,5 @@ def test_workflow_with_cerebras_llm(mock_llm_response_text, mock_llm_executor, m
         api_key=connection.api_key,
         response_format=None,
         drop_params=True,
+        timeout=ANY,
     )
@@ -1,4 +1,5 @@
 import uuid
+from unittest.mock import ANY
 
 
 from dynamiq import Workflow, connections
@@ -81,4 +82,5 @@ def test_workflow_with_custom_llm(mock_llm_response_text, mock_llm_executor):
         stop=None,
         response_format=None,
         drop_params=True,
+        timeout=ANY,
     )
@@ -1,4 +1,5 @@
 import uuid
+from unittest.mock import ANY
 
 import pytest
 
@@ -85,6 +86,7 @@ def test_workflow_with_gemini_llm_and_gemini_ai_studio_conn(
         stop=None,
         response_format=None,
         drop_params=True,
+        timeout=ANY,
     )
 
 
@@ -134,4 +136,5 @@ def test_workflow_with_gemini_llm_and_gemini_vertex_ai_conn(
         vertex_location=connection.project_location,
         response_format=None,
         drop_params=True,
+        timeout=ANY,
     )
@@ -85,4 +85,5 @@ def test_workflow_with_mistral_llm(mock_llm_response_text, mock_llm_executor, mo
         api_key=ANY,
         response_format=None,
         drop_params=True,
+        timeout=ANY,
     )
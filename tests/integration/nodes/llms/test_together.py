@@ -1,4 +1,5 @@
 import uuid
+from unittest.mock import ANY
 
 import pytest
 
@@ -87,4 +88,5 @@ def test_workflow_with_together_ai(mock_llm_response_text, mock_llm_executor, mo
         api_key=connection.api_key,
         response_format=None,
         drop_params=True,
+        timeout=ANY,
     )
@@ -1,4 +1,5 @@
 import uuid
+from unittest.mock import ANY
 
 import pytest
 
@@ -91,4 +92,5 @@ def test_workflow_with_watsonx_ai(mock_llm_response_text, mock_llm_executor, mod
         apikey=connection.api_key,
         response_format=None,
         drop_params=True,
+        timeout=ANY,
     )
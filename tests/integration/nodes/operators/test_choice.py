@@ -1,4 +1,6 @@
+import threading
 import uuid
+from typing import Any, Literal
 from unittest.mock import ANY
 
 import pytest
@@ -7,7 +9,8 @@ from dynamiq import Workflow
 from dynamiq.callbacks import TracingCallbackHandler
 from dynamiq.callbacks.tracing import RunStatus, RunType
 from dynamiq.flows import Flow
-from dynamiq.nodes import ErrorHandling
+from dynamiq.nodes import ErrorHandling, NodeGroup
+from dynamiq.nodes.node import Node, NodeDependency
 from dynamiq.nodes.operators import operators
 from dynamiq.runnables import RunnableConfig, RunnableResult, RunnableStatus
 
@@ -356,3 +359,75 @@ def test_workflow_with_choice_operator_with_errors_and_retries(
     mock_tracing_client.trace.assert_called_once_with(
         [run for run in tracing.runs.values()]
     )
+
+
+class BranchNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    name: str = "Branch"
+    started: Any = None
+    canceled: Any = None
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        self.started.set()
+        if self.canceled is not None and config.cancellation_token.wait(timeout=5):
+            self.canceled.set()
+        return {"branch": self.id}
+
+
+class GateNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    name: str = "Gate"
+    opened_by: list = []
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        return {"opened": all(event.wait(timeout=5) for event in self.opened_by)}
+
+
+def get_speculative_choice_nodes() -> tuple[list[Node], threading.Event]:
+    taken_started, not_taken_started = threading.Event(), threading.Event()
+    gate = GateNode(opened_by=[taken_started, not_taken_started])
+    taken_option = operators.ChoiceOption(
+        condition=operators.ChoiceCondition(
+            operator=operators.ConditionOperator.BOOLEAN_EQUALS, variable="$.a", value=True
+        ),
+        speculative=True,
+    )
+    not_taken_option = operators.ChoiceOption(speculative=True)
+    choice = operators.Choice(depends=[NodeDependency(gate)], options=[taken_option, not_taken_option])
+    taken = BranchNode(name="Taken", depends=[NodeDependency(choice, option=taken_option.id)], started=taken_started)
+    not_taken_canceled = threading.Event()
+    not_taken = BranchNode(
+        name="NotTaken",
+        depends=[NodeDependency(choice, option=not_taken_option.id)],
+        started=not_taken_started,
+        canceled=not_taken_canceled,
+    )
+    return [gate, choice, taken, not_taken], not_taken_canceled
+
+
+def test_workflow_with_speculative_choice_options_starts_branches_early():
+    nodes, not_taken_canceled = get_speculative_choice_nodes()
+    gate, _, taken, not_taken = nodes
+    wf = Workflow(flow=Flow(nodes=nodes))
+
+    response = wf.run(input_data={"a": True})
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[gate.id]["output"] == {"opened": True}
+    assert response.output[taken.id]["status"] == RunnableStatus.SUCCESS.value
+    assert response.output[taken.id]["output"] == {"branch": taken.id}
+    assert response.output[not_taken.id]["status"] == RunnableStatus.SKIP.value
+    assert not_taken_canceled.is_set()
+
+
+def test_workflow_with_speculative_choice_options_traces_discarded_branch_once():
+    nodes, _ = get_speculative_choice_nodes()
+    tracing = TracingCallbackHandler()
+    wf = Workflow(flow=Flow(nodes=nodes))
+
+    response = wf.run(input_data={"a": True}, config=RunnableConfig(callbacks=[tracing]))
+
+    assert response.status == RunnableStatus.SUCCESS
+    runs = [run for run in tracing.runs.values() if run.type == RunType.NODE]
+    assert [run.status for run in runs if run.name == "Taken"] == [RunStatus.SUCCEEDED]
+    assert [run.status for run in runs if run.name == "NotTaken"] == [RunStatus.SKIPPED]
@@ -0,0 +1,107 @@
+import threading
+import time
+from typing import Any, Literal
+
+import pytest
+from litellm import ModelResponse
+
+from dynamiq import Workflow, flows
+from dynamiq.nodes import ErrorHandling, NodeGroup
+from dynamiq.nodes.node import Node
+from dynamiq.runnables import RunnableConfig, RunnableStatus
+from dynamiq.types.cancellation import CancellationToken
+
+
+class SleepNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    name: str = "Sleep"
+    sleep_seconds: float = 0
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        time.sleep(self.sleep_seconds)
+        return {}
+
+
+class WrapperNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    name: str = "Wrapper"
+    inner: Node
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        result = self.inner.run(input_data={}, config=config)
+        return {"status": result.status.value, "error_type": (result.output or {}).get("error_type")}
+
+
+@pytest.fixture
+def hung_call_released():
+    released = threading.Event()
+    yield released
+    released.set()
+
+
+@pytest.fixture
+def mock_llm_hung_executor(mocker, hung_call_released, mock_llm_response_text):
+    def response(*args, **kwargs):
+        hung_call_released.wait(timeout=10)
+        model_r = ModelResponse()
+        model_r["choices"][0]["message"]["content"] = mock_llm_response_text
+        return model_r
+
+    yield mocker.patch("dynamiq.nodes.llms.base.BaseLLM._completion", side_effect=response)
+
+
+def test_node_timeout_returns_immediately(openai_node, mock_llm_hung_executor):
+    openai_node.error_handling = ErrorHandling(timeout_seconds=0.1, max_retries=1, retry_interval_seconds=0)
+
+    time_start = time.monotonic()
+    result = openai_node.run(input_data={})
+
+    assert result.status == RunnableStatus.FAILURE
+    assert result.output["error_type"] == "TimeoutError"
+    assert time.monotonic() - time_start < 2
+    assert mock_llm_hung_executor.call_count == 2
+
+
+def test_node_timeout_caps_llm_request_timeout(openai_node, mock_llm_executor):
+    openai_node.error_handling = ErrorHandling(timeout_seconds=5)
+
+    result = openai_node.run(input_data={})
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert 0 < mock_llm_executor.call_args.kwargs["timeout"] <= 5
+
+
+def test_node_canceled_by_token(openai_node, mock_llm_hung_executor):
+    token = CancellationToken()
+    threading.Timer(0.1, token.cancel, kwargs={"reason": "Client disconnected."}).start()
+
+    time_start = time.monotonic()
+    result = openai_node.run(input_data={}, config=RunnableConfig(cancellation_token=token))
+
+    assert result.status == RunnableStatus.FAILURE
+    assert result.output["error_type"] == "CanceledException"
+    assert result.output["content"] == "Client disconnected."
+    assert time.monotonic() - time_start < 2
+
+
+def test_workflow_canceled_by_token(openai_node, mock_llm_executor):
+    token = CancellationToken()
+    token.cancel()
+    wf = Workflow(flow=flows.Flow(nodes=[openai_node]))
+
+    result = wf.run(input_data={}, config=RunnableConfig(cancellation_token=token))
+
+    assert result.status == RunnableStatus.FAILURE
+    assert mock_llm_executor.call_count == 0
+
+
+def test_nested_node_timeout_enforced():
+    inner = SleepNode(sleep_seconds=2, error_handling=ErrorHandling(timeout_seconds=0.2))
+    wrapper = WrapperNode(inner=inner, error_handling=ErrorHandling(timeout_seconds=10))
+
+    time_start = time.monotonic()
+    result = wrapper.run(input_data={})
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output == {"status": RunnableStatus.FAILURE.value, "error_type": "TimeoutError"}
+    assert time.monotonic() - time_start < 1.5
@@ -0,0 +1,68 @@
+import subprocess  # nosec
+from fractions import Fraction
+
+import fakeredis
+import pytest
+
+from dynamiq.checkpoints import InMemoryCheckpointStore, RedisCheckpointStore, SQLiteCheckpointStore
+from dynamiq.runnables import RunnableResult, RunnableStatus
+
+
+@pytest.fixture(params=["in_memory", "sqlite", "redis"])
+def checkpoint_store(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteCheckpointStore(db_path=str(tmp_path / "checkpoints.db"))
+    if request.param == "redis":
+        return RedisCheckpointStore(client=fakeredis.FakeRedis())
+    return InMemoryCheckpointStore()
+
+
+def test_checkpoint_store_save_and_load(checkpoint_store):
+    input_data = {"query": "test", "items": [1, 2]}
+    result = RunnableResult(status=RunnableStatus.SUCCESS, input=input_data, output={"content": "answer"})
+
+    checkpoint_store.create("run-1", "flow-1", input_data)
+    checkpoint_store.save_result("run-1", "node-1", result)
+    checkpoint = checkpoint_store.load("run-1")
+
+    assert checkpoint.run_id == "run-1"
+    assert checkpoint.flow_id == "flow-1"
+    assert checkpoint.input_data == input_data
+    assert checkpoint.results == {"node-1": result}
+
+
+def test_checkpoint_store_create_replaces_results(checkpoint_store):
+    checkpoint_store.create("run-1", "flow-1", {})
+    checkpoint_store.save_result("run-1", "node-1", RunnableResult(status=RunnableStatus.SUCCESS))
+
+    checkpoint_store.create("run-1", "flow-1", {"a": 1})
+
+    assert checkpoint_store.load("run-1").results == {}
+
+
+def test_checkpoint_store_delete(checkpoint_store):
+    checkpoint_store.create("run-1", "flow-1", {})
+
+    checkpoint_store.delete("run-1")
+
+    assert checkpoint_store.load("run-1") is None
+    assert checkpoint_store.load("missing") is None
+
+
+@pytest.mark.parametrize("store_type", [SQLiteCheckpointStore, RedisCheckpointStore])
+def test_checkpoint_store_deserialize_rejects_not_allowed_objects(store_type, mocker):
+    popen = mocker.spy(subprocess, "Popen")
+
+    with pytest.raises(ValueError, match="not allowed"):
+        store_type.deserialize('{"py/reduce": [{"py/type": "subprocess.Popen"}, {"py/tuple": ["echo"]}]}')
+    popen.assert_not_called()
+
+
+@pytest.mark.parametrize("checkpoint_store", ["sqlite", "redis"], indirect=True)
+def test_checkpoint_store_load_rejects_not_allowed_results(checkpoint_store):
+    checkpoint_store.create("run-1", "flow-1", {})
+    result = RunnableResult(status=RunnableStatus.SUCCESS, output=Fraction(1, 2))
+    checkpoint_store.save_result("run-1", "node-1", result)
+
+    with pytest.raises(ValueError, match="not allowed"):
+        checkpoint_store.load("run-1")
@@ -1,7 +1,10 @@
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from dynamiq.connections.connections import HTTPMethod
+from dynamiq.connections.connections import Http as HttpConnection
 from dynamiq.connections.connections import Milvus as MilvusConnection
 from dynamiq.connections.connections import MilvusDeploymentType
 from dynamiq.connections.connections import Qdrant as QdrantConnection
@@ -98,3 +101,29 @@ def test_milvus_connect_host_without_token(mock_milvus_client_class):
 def test_milvus_connect_file_invalid_uri():
     with pytest.raises(ValueError, match="For FILE deployment, URI should point to a file ending with '.db'"):
         MilvusConnection(deployment_type=MilvusDeploymentType.FILE, uri="not_a_db_path")
+
+
+def test_http_async_client_reused_per_event_loop():
+    connection = HttpConnection(method=HTTPMethod.GET, url="http://localhost")
+
+    async def get_clients():
+        return await connection.get_async_client(), await connection.get_async_client()
+
+    first, second = asyncio.run(get_clients())
+    other_loop_client, _ = asyncio.run(get_clients())
+
+    assert first is second
+    assert other_loop_client is not first
+
+
+def test_http_async_client_closed_on_event_loop_shutdown():
+    connection = HttpConnection(method=HTTPMethod.GET, url="http://localhost")
+
+    async def get_client():
+        client = await connection.get_async_client()
+        assert not client.is_closed
+        return client
+
+    client = asyncio.run(get_client())
+
+    assert client.is_closed
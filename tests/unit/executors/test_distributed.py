@@ -0,0 +1,175 @@
+import json
+import subprocess  # nosec
+import threading
+
+import jsonpickle
+import pytest
+from fakeredis import FakeRedis
+
+from dynamiq import Workflow, flows
+from dynamiq.executors.distributed import (
+    InMemoryWorkQueue,
+    QueueExecutor,
+    RedisWorkQueue,
+    WorkQueuePool,
+    WorkQueueWorker,
+    register_work_item_callable,
+)
+from dynamiq.nodes.node import NodeDependency
+from dynamiq.nodes.utils import Output
+from dynamiq.runnables import RunnableStatus
+
+
+@register_work_item_callable
+def fail():
+    raise ValueError("Error")
+
+
+@register_work_item_callable
+def identity(value):
+    return value
+
+
+def unregistered():
+    return "unregistered"
+
+
+register_work_item_callable(sorted)
+
+
+@pytest.fixture(params=["in_memory", "redis"])
+def work_queue(request):
+    if request.param == "redis":
+        return RedisWorkQueue(client=FakeRedis())
+    return InMemoryWorkQueue()
+
+
+@pytest.fixture()
+def worker(work_queue):
+    stop_event = threading.Event()
+    thread = threading.Thread(
+        target=WorkQueueWorker(work_queue=work_queue, max_workers=2, poll_interval=0.05).run, args=(stop_event,)
+    )
+    thread.start()
+    yield
+    stop_event.set()
+    thread.join()
+
+
+def test_work_queue_pool_runs_calls_on_worker(work_queue, worker):
+    pool = WorkQueuePool(work_queue=work_queue, poll_interval=0.05)
+
+    assert pool.submit(sorted, [3, 1, 2]).result(timeout=5) == [1, 2, 3]
+    with pytest.raises(ValueError, match="Error"):
+        pool.submit(fail).result(timeout=5)
+
+    pool.shutdown()
+    with pytest.raises(RuntimeError):
+        pool.submit(sorted, [])
+
+
+def test_workflow_with_queue_executor(work_queue, worker):
+    pool = WorkQueuePool(work_queue=work_queue, poll_interval=0.05)
+    first_node = Output()
+    second_node = Output(depends=[NodeDependency(first_node)])
+    wf = Workflow(flow=flows.Flow(nodes=[first_node, second_node], executor=QueueExecutor, executor_pool=pool))
+
+    response = wf.run(input_data={"a": 1})
+    pool.shutdown()
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[first_node.id]["output"] == {"a": 1}
+    assert response.output[second_node.id]["status"] == RunnableStatus.SUCCESS.value
+
+
+def test_queue_executor_requires_work_queue_pool():
+    with pytest.raises(ValueError):
+        QueueExecutor()
+
+
+def test_work_queue_pool_rejects_unregistered_callable(work_queue):
+    pool = WorkQueuePool(work_queue=work_queue, poll_interval=0.05)
+
+    with pytest.raises(ValueError, match="not registered"):
+        pool.submit(unregistered)
+
+
+def test_worker_rejects_unregistered_callable(work_queue):
+    work_item = {"id": "1", "reply_to": "results", "fn": "os:system", "args": ["echo"], "kwargs": {}}
+
+    WorkQueueWorker(work_queue=work_queue).process(json.dumps(work_item))
+
+    reply = jsonpickle.decode(work_queue.get("results", timeout=1))  # nosec
+    assert isinstance(reply["error"], ValueError)
+    assert "not registered" in str(reply["error"])
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"py/object": "subprocess.Popen"},
+        {"py/reduce": [{"py/function": "builtins.eval"}, {"py/tuple": ["1"]}]},
+        {"py/reduce": [{"py/type": "builtins.eval"}, {"py/tuple": ["1"]}]},
+        {"py/type": "dynamiq.executors.distributed.threading.Thread"},
+        {"py/function": "dynamiq.executors.distributed.json.loads"},
+        {"py/repr": "os/os.system('echo')"},
+    ],
+)
+def test_worker_rejects_not_allowed_objects(work_queue, mocker, value):
+    popen = mocker.spy(subprocess, "Popen")
+    work_item = {"id": "1", "reply_to": "results", "fn": f"{identity.__module__}:identity", "args": [value]}
+
+    WorkQueueWorker(work_queue=work_queue).process(json.dumps(work_item | {"kwargs": {}}))
+
+    reply = jsonpickle.decode(work_queue.get("results", timeout=1))  # nosec
+    assert "not allowed" in str(reply["error"])
+    popen.assert_not_called()
+
+
+def test_worker_restores_allowed_objects(work_queue):
+    output = Output()
+    worker = WorkQueueWorker(work_queue=work_queue)
+    work_item = {
+        "id": "1",
+        "reply_to": "results",
+        "fn": f"{identity.__module__}:identity",
+        "args": [output],
+        "kwargs": {},
+    }
+
+    worker.process(jsonpickle.encode(work_item))
+
+    reply = jsonpickle.decode(work_queue.get("results", timeout=1))  # nosec
+    assert reply["result"].id == output.id
+
+
+def test_work_queue_pool_fails_calls_without_result(work_queue):
+    pool = WorkQueuePool(work_queue=work_queue, poll_interval=0.05, result_timeout=0.1)
+
+    future = pool.submit(identity, 1)
+    pool.shutdown()
+
+    with pytest.raises(TimeoutError):
+        future.result(timeout=0)
+
+
+def test_work_queue_pool_fails_calls_with_undecodable_result(work_queue):
+    pool = WorkQueuePool(work_queue=work_queue, poll_interval=0.05)
+
+    future = pool.submit(identity, 1)
+    work_item = json.loads(work_queue.get(pool.name, timeout=1))
+    work_queue.put(pool.reply_to, json.dumps({"id": work_item["id"], "result": {"py/object": "subprocess.Popen"}}))
+
+    with pytest.raises(ValueError, match="Undecodable result"):
+        future.result(timeout=5)
+    pool.shutdown()
+
+
+def test_worker_sets_result_queue_expiry():
+    client = FakeRedis()
+    work_queue = RedisWorkQueue(client=client)
+    work_item = {"id": "1", "reply_to": "results", "fn": f"{identity.__module__}:identity", "args": [1], "kwargs": {}}
+
+    WorkQueueWorker(work_queue=work_queue, result_ttl=60).process(json.dumps(work_item))
+
+    assert 0 < client.ttl(work_queue.get_key("results")) <= 60
@@ -0,0 +1,176 @@
+import multiprocessing
+from collections import OrderedDict
+from concurrent import futures
+from typing import Any, Literal
+
+import pytest
+
+from dynamiq import flows
+from dynamiq.executors import pool as pool_module
+from dynamiq.executors import shared
+from dynamiq.executors.pool import ProcessExecutor, ThreadExecutor
+from dynamiq.executors.shared import SharedThreadPool, get_shared_thread_pool, shutdown_shared_thread_pools
+from dynamiq.nodes import NodeGroup
+from dynamiq.nodes.node import Node, NodeReadyToRun
+from dynamiq.nodes.utils import Output
+from dynamiq.runnables import RunnableConfig, RunnableResult, RunnableStatus
+
+
+class NestedFlowNode(Node):
+    group: Literal[NodeGroup.UTILS] = NodeGroup.UTILS
+    name: str = "NestedFlow"
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        result = flows.Flow(nodes=[Output()]).run(input_data=input_data)
+        return {"status": result.status.value}
+
+
+@pytest.fixture
+def single_worker_shared_pools(monkeypatch):
+    shutdown_shared_thread_pools()
+    monkeypatch.setattr(shared, "MAX_WORKERS_SHARED_THREAD_POOL", 1)
+    yield
+    shutdown_shared_thread_pools()
+
+
+def test_thread_executor_attaches_to_shared_pool():
+    run_executor = ThreadExecutor()
+
+    assert run_executor.executor is get_shared_thread_pool(SharedThreadPool.NODES)
+    assert run_executor.executor is not get_shared_thread_pool(SharedThreadPool.TASKS)
+
+    run_executor.shutdown()
+
+    assert get_shared_thread_pool().submit(lambda: 1).result() == 1
+
+
+def run_on_shared_thread_pool():
+    return get_shared_thread_pool().submit(lambda: 1).result(timeout=5)
+
+
+def test_shared_thread_pool_is_recreated_in_forked_process():
+    assert get_shared_thread_pool().submit(lambda: 1).result() == 1
+
+    with futures.ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("fork")) as pool:
+        assert pool.submit(run_on_shared_thread_pool).result(timeout=10) == 1
+
+
+def test_nested_flows_run_on_pool_of_their_nesting_level(single_worker_shared_pools):
+    flow = flows.Flow(nodes=[NestedFlowNode()])
+
+    with futures.ThreadPoolExecutor(max_workers=1) as caller:
+        result = caller.submit(flow.run, input_data={}).result(timeout=10)
+
+    assert result.output[flow.nodes[0].id]["output"] == {"status": RunnableStatus.SUCCESS.value}
+    assert get_shared_thread_pool(SharedThreadPool.NODES, level=1) is not get_shared_thread_pool()
+
+
+def test_thread_executor_limits_in_flight_nodes():
+    nodes = [Output() for _ in range(3)]
+    ready_nodes = [NodeReadyToRun(node=node, is_ready=True, input_data={"a": 1}) for node in nodes]
+    run_executor = ThreadExecutor(max_workers=1)
+
+    run_executor.run_nodes(ready_nodes=ready_nodes)
+
+    assert len(run_executor.node_by_future) == 1
+    assert len(run_executor.pending_nodes) == 2
+
+    results = {}
+    while len(results) < len(nodes):
+        results.update(run_executor.execute(ready_nodes=[]))
+        assert len(run_executor.node_by_future) <= 1
+    run_executor.shutdown()
+
+    assert set(results) == {node.id for node in nodes}
+    assert all(result.status == RunnableStatus.SUCCESS for result in results.values())
+
+
+def test_thread_executor_with_own_pool_is_not_shutdown():
+    pool = futures.ThreadPoolExecutor(max_workers=2)
+    run_executor = ThreadExecutor(executor=pool)
+
+    results = run_executor.execute(ready_nodes=[NodeReadyToRun(node=Output(), is_ready=True, input_data={})])
+    run_executor.shutdown()
+
+    assert len(results) == 1
+    assert pool.submit(lambda: 1).result() == 1
+    pool.shutdown()
+
+
+def test_thread_executor_submits_pending_nodes_by_priority():
+    nodes = [Output(id=f"node_{i}") for i in range(3)]
+    ready_nodes = [
+        NodeReadyToRun(node=node, is_ready=True, input_data={}, priority=priority)
+        for node, priority in zip(nodes, [1, 3, 2])
+    ]
+    run_executor = ThreadExecutor(max_workers=1)
+    submitted = []
+
+    def run_node(ready_node, config=None, **kwargs):
+        submitted.append(ready_node.node.id)
+        future = futures.Future()
+        future.set_result(RunnableResult(status=RunnableStatus.SUCCESS))
+        return future
+
+    run_executor.run_node = run_node
+    run_executor.run_nodes(ready_nodes=ready_nodes)
+    while run_executor.node_by_future:
+        run_executor.execute(ready_nodes=[])
+
+    assert submitted == ["node_1", "node_2", "node_0"]
+    assert set(run_executor.node_durations) == {node.id for node in nodes}
+
+
+def test_process_executor_registers_node_definition_once(mocker):
+    node = Output()
+    pool = futures.ProcessPoolExecutor(max_workers=1)
+    serialize_node = mocker.spy(ProcessExecutor, "serialize_node")
+
+    for _ in range(3):
+        run_executor = ProcessExecutor(executor=pool)
+        results = run_executor.execute(ready_nodes=[NodeReadyToRun(node=node, is_ready=True, input_data={"a": 1})])
+        assert results[node.id].status == RunnableStatus.SUCCESS
+        assert results[node.id].output == {"a": 1}
+
+    assert serialize_node.call_count == 1
+
+    # fresh worker process misses the definition and gets it resent
+    other_pool = futures.ProcessPoolExecutor(max_workers=1)
+    results = ProcessExecutor(executor=other_pool).execute(
+        ready_nodes=[NodeReadyToRun(node=node, is_ready=True, input_data={"a": 2})]
+    )
+
+    assert results[node.id].output == {"a": 2}
+    assert serialize_node.call_count == 2
+
+    # changed definition is registered under a new key
+    node.name = "Renamed"
+    ProcessExecutor(executor=pool).execute(ready_nodes=[NodeReadyToRun(node=node, is_ready=True, input_data={})])
+
+    assert serialize_node.call_count == 3
+    pool.shutdown()
+    other_pool.shutdown()
+
+
+def test_process_executor_caches_node_key_until_node_changes(mocker):
+    node = Output()
+    to_dict = mocker.spy(Output, "to_dict")
+
+    node_key = ProcessExecutor.get_node_key(node)
+
+    assert ProcessExecutor.get_node_key(node) == node_key
+    assert to_dict.call_count == 1
+
+    node.name = "Renamed"
+
+    assert ProcessExecutor.get_node_key(node) != node_key
+    assert to_dict.call_count == 2
+
+
+def test_process_executor_registered_node_keys_bounded(monkeypatch):
+    monkeypatch.setattr(pool_module, "MAX_WORKER_REGISTERED_NODES", 2)
+    monkeypatch.setattr(ProcessExecutor, "registered_node_keys", OrderedDict())
+
+    assert all(ProcessExecutor.register_node_key((f"node_{i}", "hash")) for i in range(3))
+    assert not ProcessExecutor.register_node_key(("node_2", "hash"))
+    assert list(ProcessExecutor.registered_node_keys) == [("node_1", "hash"), ("node_2", "hash")]
@@ -0,0 +1,76 @@
+from graphlib import CycleError
+
+import pytest
+
+from dynamiq import flows
+from dynamiq.flows.scheduling import DEFAULT_NODE_COST, FlowGraph, NodeCostEstimator
+from dynamiq.nodes.node import NodeDependency
+from dynamiq.nodes.utils import Output
+
+
+@pytest.fixture
+def wide_graph():
+    # slow -> tail is the critical path, fast ones are independent leaves
+    slow = Output(id="slow", cost_hint=5)
+    tail = Output(id="tail", cost_hint=1, depends=[NodeDependency(slow)])
+    fast = [Output(id=f"fast_{i}", cost_hint=1) for i in range(3)]
+    return [*fast, slow, tail]
+
+
+def test_priorities_follow_critical_path(wide_graph):
+    priorities = NodeCostEstimator().get_priorities(wide_graph)
+
+    assert priorities == {"fast_0": 1, "fast_1": 1, "fast_2": 1, "slow": 6, "tail": 1}
+
+
+def test_learned_costs_used_without_hint():
+    node = Output(id="node")
+    estimator = NodeCostEstimator(smoothing=0.5)
+
+    assert estimator.get_cost(node) == DEFAULT_NODE_COST
+
+    estimator.update({"node": 2.0})
+    estimator.update({"node": 4.0})
+
+    assert estimator.get_cost(node) == 3.0
+    assert estimator.get_cost(Output(id="node", cost_hint=0.5)) == 0.5
+
+
+def test_node_sorter_tracks_run_progress(wide_graph):
+    graph = FlowGraph(wide_graph)
+    sorter = graph.get_sorter()
+
+    assert set(sorter.get_ready()) == {"fast_0", "fast_1", "fast_2", "slow"}
+    assert sorter.get_ready() == ()
+
+    sorter.done("slow")
+    assert sorter.get_ready() == ("tail",)
+    with pytest.raises(ValueError):
+        sorter.done("slow")
+
+    sorter.done("tail", "fast_0", "fast_1", "fast_2")
+    assert not sorter.is_active()
+    assert graph.get_sorter().is_active()
+
+
+def test_flow_compiled_once_and_after_nodes_added(wide_graph, mocker):
+    flow = flows.Flow(nodes=wide_graph)
+    compile_spy = mocker.spy(flows.Flow, "compile")
+
+    flow.run(input_data={})
+    flow.run(input_data={})
+    assert compile_spy.call_count == 1
+
+    flow.add_nodes(Output(id="extra", depends=[NodeDependency(wide_graph[-1])]))
+    result = flow.run(input_data={})
+    assert compile_spy.call_count == 2
+    assert result.output["extra"]["status"] == "success"
+
+
+def test_flow_compile_detects_cycles():
+    first = Output(id="first")
+    second = Output(id="second", depends=[NodeDependency(first)])
+    first.depends = [NodeDependency(second)]
+
+    with pytest.raises(CycleError):
+        flows.Flow(nodes=[first, second]).compile()
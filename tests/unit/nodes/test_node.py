@@ -0,0 +1,184 @@
+import copy
+from typing import Any
+
+import pytest
+
+from dynamiq import Workflow, flows
+from dynamiq.callbacks import BaseCallbackHandler, TracingCallbackHandler
+from dynamiq.nodes.node import NodeDependency
+from dynamiq.nodes.splitters.document import DocumentSplitter
+from dynamiq.types import Document
+from dynamiq.nodes.utils import Output
+from dynamiq.runnables import RunnableConfig, RunnableResult, RunnableStatus
+
+
+class SerializedRecorder(BaseCallbackHandler):
+    def __init__(self):
+        self.serialized = []
+        self.flow_events = 0
+
+    def on_flow_start(self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any):
+        self.flow_events += 1
+
+    def on_node_start(self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any):
+        self.serialized.append(serialized)
+
+    def on_node_end(self, serialized: dict[str, Any], output_data: dict[str, Any], **kwargs: Any):
+        self.serialized.append(serialized)
+
+
+def test_node_callbacks_share_serialized_snapshot():
+    node = Output()
+    recorder = SerializedRecorder()
+    config = RunnableConfig(callbacks=[recorder])
+
+    node.run(input_data={"a": 1}, config=config)
+    node.run(input_data={"a": 2}, config=config)
+
+    assert len(recorder.serialized) == 4
+    assert all(serialized is recorder.serialized[0] for serialized in recorder.serialized)
+    assert recorder.serialized[0] == node.to_dict()
+
+
+def test_node_serialized_snapshot_recreated_after_definition_change(mocker):
+    node = Output()
+    to_dict = mocker.spy(Output, "to_dict")
+    snapshot = node.to_dict_snapshot()
+
+    assert node.to_dict_snapshot() is snapshot
+    assert to_dict.call_count == 1
+
+    node.name = "Renamed"
+
+    assert node.to_dict_snapshot()["name"] == "Renamed"
+    assert node.model_copy(update={"id": "copied"}).to_dict_snapshot()["id"] == "copied"
+    assert copy.copy(node).to_dict_snapshot() is not node.to_dict_snapshot()
+
+
+def test_node_serialized_snapshot_reuses_dependency_snapshots():
+    source = Output()
+    branches = [Output(depends=[NodeDependency(source)]) for _ in range(2)]
+    sink = Output(depends=[NodeDependency(node) for node in branches])
+
+    serialized = sink.to_dict_snapshot()
+
+    assert [depend["node"] for depend in serialized["depends"]] == [node.to_dict_snapshot() for node in branches]
+    assert all(depend["node"]["depends"][0]["node"] is source.to_dict_snapshot() for depend in serialized["depends"])
+
+
+def test_node_serialized_snapshot_recreated_after_dependency_change():
+    source = Output(name="Start")
+    branch = Output(depends=[NodeDependency(source)])
+    sink = Output(name="End", depends=[NodeDependency(branch)])
+    definition_hash = sink.get_definition_hash()
+    sink.to_dict_snapshot()
+
+    source.name = "Renamed"
+
+    assert sink.to_dict_snapshot()["depends"][0]["node"]["depends"][0]["node"]["name"] == "Renamed"
+    assert sink.get_definition_hash() != definition_hash
+
+    sink.depends_on(Output(name="Added"))
+
+    assert sink.to_dict_snapshot()["depends"][-1]["node"]["name"] == "Added"
+
+
+class WorkflowRecorder(BaseCallbackHandler):
+    def __init__(self):
+        self.serialized = []
+
+    def on_workflow_start(self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any):
+        self.serialized.append(serialized)
+
+    def on_workflow_end(self, serialized: dict[str, Any], output_data: dict[str, Any], **kwargs: Any):
+        self.serialized.append(serialized)
+
+
+def test_workflow_callbacks_share_serialized_snapshot(mocker):
+    node = Output()
+    wf = Workflow(flow=flows.Flow(nodes=[node]))
+    recorder = WorkflowRecorder()
+    model_dump = mocker.spy(Workflow, "model_dump")
+
+    wf.run(input_data={"a": 1}, config=RunnableConfig(callbacks=[recorder]))
+    wf.run(input_data={"a": 2}, config=RunnableConfig(callbacks=[recorder]))
+
+    assert len(recorder.serialized) == 4
+    assert all(serialized is recorder.serialized[0] for serialized in recorder.serialized)
+    assert recorder.serialized[0]["flow"]["nodes"] == [node.to_dict_snapshot()]
+    assert recorder.serialized[0]["flow"]["nodes"][0] is node.to_dict_snapshot()
+    assert model_dump.call_count == 1
+
+
+def test_workflow_serialized_snapshot_recreated_after_change():
+    node = Output()
+    wf = Workflow(flow=flows.Flow(nodes=[node]))
+    snapshot = wf.to_dict_snapshot()
+
+    node.name = "Renamed"
+
+    assert wf.to_dict_snapshot() is not snapshot
+    assert wf.to_dict_snapshot()["flow"]["nodes"][0]["name"] == "Renamed"
+
+    wf.flow.add_nodes(Output(name="Added"))
+
+    assert wf.to_dict_snapshot()["flow"]["nodes"][-1]["name"] == "Added"
+
+    wf.flow.max_node_workers = 2
+    wf.version = "2"
+
+    assert wf.to_dict_snapshot()["flow"]["max_node_workers"] == 2
+    assert wf.to_dict_snapshot()["version"] == "2"
+
+
+def test_node_run_without_callbacks_skips_serialization(mocker):
+    source = Output()
+    node = Output(depends=[NodeDependency(source)])
+    to_dict = mocker.spy(Output, "to_dict")
+
+    result = node.run(input_data={"a": 1}, depends_result={source.id: RunnableResult(status=RunnableStatus.SUCCESS)})
+    skip_result = node.run(input_data={}, depends_result={source.id: RunnableResult(status=RunnableStatus.FAILURE)})
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert skip_result.status == RunnableStatus.SKIP
+    assert to_dict.call_count == 0
+
+
+def test_node_run_in_lean_mode_skips_node_callbacks():
+    node = Output()
+    recorder = SerializedRecorder()
+    wf = Workflow(flow=flows.Flow(nodes=[node]))
+
+    response = wf.run(input_data={"a": 1}, config=RunnableConfig(callbacks=[recorder], lean=True))
+
+    assert response.output[node.id]["output"] == {"a": 1}
+    assert recorder.serialized == []
+    assert recorder.flow_events == 1
+
+
+def test_node_run_in_lean_mode_with_tracing_skips_execute_run_events():
+    node = DocumentSplitter(split_by="word", split_length=2, split_overlap=0)
+    tracing = TracingCallbackHandler()
+    wf = Workflow(flow=flows.Flow(nodes=[node]))
+
+    response = wf.run(
+        input_data={"documents": [Document(content="one two three")]},
+        config=RunnableConfig(callbacks=[tracing], lean=True),
+    )
+
+    assert response.output[node.id]["status"] == RunnableStatus.SUCCESS.value
+    assert len(response.output[node.id]["output"]["documents"]) == 2
+    assert all(run.metadata.get("node", {}).get("id") != node.id for run in tracing.runs.values())
+
+
+def test_node_merge_stream_outputs():
+    node = Output()
+    chunks = [
+        {"documents": [1], "meta": {"source": "a", "ids": [1]}},
+        {"documents": [2], "meta": {"source": "a", "ids": []}},
+    ]
+
+    assert node.merge_stream_outputs(chunks) == {"documents": [1, 2], "meta": {"source": "a", "ids": [1]}}
+    assert chunks[0] == {"documents": [1], "meta": {"source": "a", "ids": [1]}}
+    with pytest.raises(ValueError, match="can not be merged"):
+        node.merge_stream_outputs([{"count": 1}, {"count": 2}])
@@ -0,0 +1,74 @@
+import copy
+import pickle
+
+import jsonpickle
+
+from dynamiq import Workflow, flows
+from dynamiq.nodes.node import NodeDependency
+from dynamiq.nodes.utils import Output
+from dynamiq.runnables import RunnableResult, RunnableStatus
+from dynamiq.runnables import base as runnables_base
+
+
+def test_runnable_result_views_are_formatted_once(mocker):
+    result = RunnableResult(status=RunnableStatus.SUCCESS, input={"query": b"q"}, output={"content": b"a"})
+    format_value = mocker.spy(runnables_base, "format_value")
+
+    depend_dicts = [result.to_tracing_depend_dict() for _ in range(3)]
+    result.to_depend_dict()
+    result.to_depend_dict()
+
+    assert depend_dicts[0] == {"status": "success", "output": {"content": b"a"}}
+    assert all(depend_dict == depend_dicts[0] for depend_dict in depend_dicts)
+    assert format_value.call_count == 2
+
+    assert result.to_dict() == {"status": "success", "input": {"query": "q"}, "output": {"content": "a"}}
+    assert format_value.call_count == 4
+
+
+def test_runnable_result_views_are_copied_for_each_consumer():
+    result = RunnableResult(status=RunnableStatus.SUCCESS, input={"query": b"q"}, output={"items": [{"a": 1}]})
+
+    for view in (result.to_depend_dict, result.to_tracing_depend_dict, result.to_dict):
+        first = view()
+        first["output"]["items"][0]["a"] = 2
+        first["output"]["items"].append({"b": 1})
+        assert view()["output"] == {"items": [{"a": 1}]}
+
+    shared = result.to_dict(copy=False)
+    assert result.to_dict(copy=False)["output"] is shared["output"]
+    assert result.output == {"items": [{"a": 1}]}
+
+
+def test_runnable_result_views_reset_on_field_assignment():
+    result = RunnableResult(status=RunnableStatus.SUCCESS, output={"content": "a"})
+    result.to_dict()
+
+    result.output = {"content": "b"}
+    assert result.to_dict()["output"] == {"content": "b"}
+
+    copied = copy.copy(result)
+    copied.status = RunnableStatus.FAILURE
+    assert copied.to_dict()["status"] == "failure"
+    assert result.model_copy(update={"output": "c"}).to_dict()["output"] == "c"
+
+
+def test_runnable_result_views_are_not_serialized():
+    result = RunnableResult(status=RunnableStatus.SUCCESS, output={"content": "a"})
+    result.to_dict()
+
+    assert pickle.loads(pickle.dumps(result))._formatted == {}
+    assert jsonpickle.decode(jsonpickle.encode(result)).to_dict() == result.to_dict()
+
+
+def test_flow_output_does_not_share_dependency_output_between_consumers():
+    source = Output()
+    consumers = [Output(depends=[NodeDependency(source)]) for _ in range(3)]
+    wf = Workflow(flow=flows.Flow(nodes=[source, *consumers]))
+
+    response = wf.run(input_data={"content": b"data"})
+
+    outputs = [response.output[node.id]["input"][source.id]["output"] for node in consumers]
+    outputs[0]["content"] = b"changed"
+    assert outputs[1:] == [{"content": b"data"}] * 2
+    assert response.output[source.id]["output"] == {"content": b"data"}
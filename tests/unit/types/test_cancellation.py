@@ -0,0 +1,68 @@
+import time
+from concurrent.futures import TimeoutError
+
+import pytest
+
+from dynamiq.types.cancellation import CanceledException, CancellationToken, TimerScheduler
+
+
+def test_cancellation_token_cancel_propagates_to_children():
+    token = CancellationToken()
+    child = token.child()
+    fired = []
+    child.on_cancel(lambda: fired.append(True))
+
+    token.cancel("stop")
+
+    assert child.is_canceled
+    assert child.reason == "stop"
+    assert fired == [True]
+    with pytest.raises(CanceledException, match="stop"):
+        child.raise_if_canceled()
+
+
+def test_cancellation_token_child_does_not_cancel_parent():
+    token = CancellationToken()
+    child = token.child()
+
+    child.cancel()
+
+    assert child.is_canceled
+    assert not token.is_canceled
+
+
+def test_cancellation_token_timeout():
+    token = CancellationToken(timeout=0.05)
+
+    assert token.wait(timeout=2)
+    assert token.timed_out
+    with pytest.raises(TimeoutError):
+        token.raise_if_canceled()
+
+
+def test_cancellation_token_child_deadline_capped_by_parent():
+    token = CancellationToken(timeout=0.05)
+    child = token.child(timeout=10)
+
+    assert child.remaining <= 0.05
+    assert child.wait(timeout=2)
+    assert child.timed_out
+
+
+def test_cancellation_token_release_stops_timer():
+    token = CancellationToken(timeout=0.05)
+
+    token.release()
+    time.sleep(0.1)
+
+    assert not token.is_canceled
+
+
+def test_timer_scheduler_drops_canceled_timers():
+    scheduler = TimerScheduler()
+    handles = [scheduler.schedule(60, lambda: None) for _ in range(10)]
+
+    for handle in handles:
+        handle.cancel()
+
+    assert scheduler._timers == []
@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from datetime import datetime
+from io import BytesIO
+
+import pytest
+
+from dynamiq.nodes.tools.python import PythonInputSchema
+from dynamiq.runnables import RunnableResult, RunnableStatus
+from dynamiq.types import Document
+from dynamiq.utils import format_value
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+class Opaque:
+    def __str__(self):
+        return "opaque"
+
+
+def test_format_value_formats_nested_values():
+    document = Document(id="1", content="text")
+    value = {
+        "scalars": [1, 1.5, "a", True, None],
+        "bytes": b"data",
+        "file": BytesIO(b"data"),
+        "documents": (document,),
+        "result": RunnableResult(status=RunnableStatus.SUCCESS, input={"a": b"in"}, output=[b"out"]),
+        "python_input": PythonInputSchema(a=b"in"),
+        "error": ValueError("failed"),
+        "func": len,
+        "point": Point(1, 2),
+        "opaque": Opaque(),
+    }
+
+    assert format_value(value) == {
+        "scalars": [1, 1.5, "a", True, None],
+        "bytes": "data",
+        "file": "data",
+        "documents": (document.to_dict(),),
+        "result": {"status": "success", "input": {"a": "in"}, "output": ["out"]},
+        "python_input": {"a": "in"},
+        "error": {"content": "failed", "error_type": "ValueError", "recoverable": False},
+        "func": "func: len",
+        "point": {"x": 1, "y": 2},
+        "opaque": "opaque",
+    }
+    assert format_value(ValueError("failed"), recoverable=True)["recoverable"] is True
+
+
+def test_format_value_skips_types():
+    timestamp = datetime(2024, 1, 1)
+    value = {"bytes": b"data", "file": BytesIO(b"data"), "timestamp": timestamp}
+
+    formatted = format_value(value, skip_format_types={bytes, BytesIO}, force_format_types={BytesIO})
+
+    assert formatted == {"bytes": b"data", "file": "data", "timestamp": timestamp}
+
+
+@pytest.mark.parametrize("value", [{"a": [1, {"b": "c"}]}, [{"a": 1}, (2, 3)], {"a": {1, 2}}])
+def test_format_value_without_copy_returns_unchanged_value(value):
+    assert format_value(value, copy=False) is value
+    assert format_value(value) == value
+    assert format_value(value) is not value
+
+
+def test_format_value_without_copy_copies_only_changed_containers():
+    unchanged = {"b": [1, 2]}
+    value = {"a": b"data", "unchanged": unchanged}
+
+    formatted = format_value(value, copy=False)
+
+    assert formatted == {"a": "data", "unchanged": unchanged}
+    assert formatted["unchanged"] is unchanged
+    assert value["a"] == b"data"
+
+
+def test_format_value_with_memo_formats_shared_containers_once():
+    shared = {"content": b"data"}
+    memo = {}
+
+    first = format_value({"a": shared, "b": shared}, memo=memo)
+    second = format_value([shared], memo=memo)
+
+    assert first == {"a": {"content": "data"}, "b": {"content": "data"}}
+    assert first["a"] is first["b"] is second[0]
+    assert format_value(shared) is not first["a"]